@@ -19,10 +19,16 @@ from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    config_per_platform,
+    device_registry,
+    entity_registry,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
+    BASE_PLATFORMS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
@@ -436,12 +442,46 @@ async def async_setup_multi_components(
         )
 
 
+async def _async_pre_import_integrations(
+    hass: core.HomeAssistant, stages: list[set[str]], config: dict[str, Any]
+) -> None:
+    """Import the integrations and configured platforms of each stage.
+
+    Modules are imported in the executor ahead of setup, setup waits for
+    a pending import instead of importing the module in the event loop.
+    Integrations with requirements are left to setup, which has to
+    install the requirements before the integration can be imported.
+    """
+    for domains in stages:
+        platforms: dict[str, set[str]] = {domain: set() for domain in domains}
+        for domain in domains & BASE_PLATFORMS:
+            for platform_name, _ in config_per_platform(config, domain):
+                if isinstance(platform_name, str):
+                    platforms.setdefault(platform_name, set()).add(domain)
+
+        integrations = await gather_with_concurrency(
+            loader.MAX_LOAD_CONCURRENTLY,
+            *(loader.async_get_integration(hass, domain) for domain in platforms),
+            return_exceptions=True,
+        )
+        await gather_with_concurrency(
+            MAX_LOAD_CONCURRENTLY,
+            *(
+                itg.async_pre_import(platforms[itg.domain])
+                for itg in integrations
+                if isinstance(itg, loader.Integration)
+                and (hass.config.skip_pip or not itg.requirements)
+            ),
+        )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
     """Set up all the integrations."""
     hass.data[DATA_SETUP_STARTED] = {}
     setup_time = hass.data[DATA_SETUP_TIME] = {}
+    import_time = hass.data.setdefault(loader.DATA_IMPORT_TIME, {})
 
     watch_task = asyncio.create_task(_async_watch_pending_setups(hass))
 
@@ -527,6 +567,11 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
+    # Import the integrations in the executor while the registries load
+    hass.async_create_task(
+        _async_pre_import_integrations(hass, [stage_1_domains, stage_2_domains], config)
+    )
+
     # Load the registries
     await asyncio.gather(
         device_registry.async_load(hass),
@@ -570,6 +615,15 @@ async def _async_set_up_integrations(
             )
         },
     )
+    _LOGGER.debug(
+        "Integration import times: %s",
+        {
+            integration: timedelta.total_seconds()
+            for integration, timedelta in sorted(
+                import_time.items(), key=lambda item: item[1].total_seconds()
+            )
+        },
+    )
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
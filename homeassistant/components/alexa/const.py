@@ -6,6 +6,7 @@ from homeassistant.const import TEMP_CELSIUS, TEMP_FAHRENHEIT
 
 DOMAIN = "alexa"
 EVENT_ALEXA_SMART_HOME = "alexa_smart_home"
+DATA_CHANGE_REPORTERS = "alexa_change_reporters"
 
 # Flash briefing constants
 CONF_UID = "uid"
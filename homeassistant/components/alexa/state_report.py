@@ -2,24 +2,36 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 import json
 import logging
+import time
 
 import aiohttp
 import async_timeout
 
-from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
+from homeassistant.const import (
+    HTTP_ACCEPTED,
+    HTTP_TOO_MANY_REQUESTS,
+    MATCH_ALL,
+    STATE_ON,
+)
 from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.significant_change import create_checker
 import homeassistant.util.dt as dt_util
 
-from .const import API_CHANGE, DOMAIN, Cause
+from .const import API_CHANGE, DATA_CHANGE_REPORTERS, DOMAIN, Cause
 from .entities import ENTITY_ADAPTERS, AlexaEntity, generate_alexa_id
 from .messages import AlexaResponse
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 
+# Minimum time between two ChangeReports of a config
+CHANGE_REPORT_INTERVAL = 0.1
+# Time to pause reporting after Alexa rejected a report as too many requests
+CHANGE_REPORT_RATE_LIMITED_DELAY = 10
+
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
@@ -43,8 +55,10 @@ async def async_enable_proactive_mode(hass, smart_home_config):
         return old_extra_arg is not None and old_extra_arg != new_extra_arg
 
     checker = await create_checker(hass, DOMAIN, extra_significant_check)
+    reporter = AlexaChangeReporter(hass, smart_home_config)
 
-    async def async_entity_state_listener(
+    @callback
+    def async_entity_state_listener(
         changed_entity: str,
         old_state: State | None,
         new_state: State | None,
@@ -53,6 +67,7 @@ async def async_enable_proactive_mode(hass, smart_home_config):
             return
 
         if not new_state:
+            reporter.async_forget(changed_entity)
             return
 
         if new_state.domain not in ENTITY_ADAPTERS:
@@ -67,24 +82,19 @@ async def async_enable_proactive_mode(hass, smart_home_config):
         )
 
         # Determine how entity should be reported on
-        should_report = False
-        should_doorbell = False
-
-        for interface in alexa_changed_entity.interfaces():
-            if not should_report and interface.properties_proactively_reported():
-                should_report = True
-
-            if interface.name() == "Alexa.DoorbellEventSource":
-                should_doorbell = True
-                break
+        should_report, should_doorbell = reporter.async_report_mode(
+            alexa_changed_entity
+        )
 
         if not should_report and not should_doorbell:
             return
 
         if should_doorbell:
             if new_state.state == STATE_ON:
-                await async_send_doorbell_event_message(
-                    hass, smart_home_config, alexa_changed_entity
+                hass.async_create_task(
+                    async_send_doorbell_event_message(
+                        hass, smart_home_config, alexa_changed_entity
+                    )
                 )
             return
 
@@ -95,20 +105,187 @@ async def async_enable_proactive_mode(hass, smart_home_config):
         ):
             return
 
-        await async_send_changereport_message(
-            hass, smart_home_config, alexa_changed_entity, alexa_properties
-        )
+        reporter.async_queue(alexa_changed_entity, alexa_properties)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def async_disable():
+        """Stop reporting state changes."""
+        unsub()
+        reporter.async_stop()
+
+    return async_disable
+
+
+class _QueuedReport:
+    """A ChangeReport waiting to be sent."""
+
+    __slots__ = ("alexa_entity", "alexa_properties", "queued_at")
+
+    def __init__(self, alexa_entity, alexa_properties, queued_at):
+        """Initialize the queued report."""
+        self.alexa_entity = alexa_entity
+        self.alexa_properties = alexa_properties
+        self.queued_at = queued_at
+
+
+class AlexaChangeReporter:
+    """Send the ChangeReport messages of a config one at a time.
+
+    Changes of an entity that is still waiting in the queue replace the
+    queued properties, so every endpoint is reported at most once per pass.
+    """
+
+    def __init__(self, hass, config):
+        """Initialize the reporter."""
+        self.hass = hass
+        self.config = config
+        self._queue: dict[str, _QueuedReport] = {}
+        self._report_modes: dict[str, tuple[Mapping, dict, bool, bool]] = {}
+        self._sender: asyncio.Task | None = None
+        self._next_send = 0.0
+        self.sent = 0
+        self.coalesced = 0
+        self.max_queue_latency: float | None = None
+        hass.data.setdefault(DATA_CHANGE_REPORTERS, []).append(self)
+
+    @property
+    def queued(self) -> int:
+        """Return the number of reports waiting to be sent."""
+        return len(self._queue)
+
+    @callback
+    def async_report_mode(self, alexa_entity: AlexaEntity) -> tuple[bool, bool]:
+        """Return if an entity reports its properties and if it is a doorbell.
+
+        The interfaces of an entity only depend on its attributes and entity
+        config, so the result is reused until one of them changes.
+        """
+        entity_id = alexa_entity.entity_id
+        attributes = alexa_entity.entity.attributes
+        entity_conf = alexa_entity.entity_conf
+        cached = self._report_modes.get(entity_id)
+        if cached is not None and cached[0] == attributes and cached[1] == entity_conf:
+            return cached[2], cached[3]
+
+        should_report = False
+        should_doorbell = False
+
+        for interface in alexa_entity.interfaces():
+            if not should_report and interface.properties_proactively_reported():
+                should_report = True
+
+            if interface.name() == "Alexa.DoorbellEventSource":
+                should_doorbell = True
+                break
+
+        self._report_modes[entity_id] = (
+            attributes,
+            entity_conf,
+            should_report,
+            should_doorbell,
+        )
+        return should_report, should_doorbell
+
+    @callback
+    def async_forget(self, entity_id: str) -> None:
+        """Drop the cached data and queued report of a removed entity."""
+        self._report_modes.pop(entity_id, None)
+        self._queue.pop(entity_id, None)
+
+    @callback
+    def async_queue(self, alexa_entity: AlexaEntity, alexa_properties: list) -> None:
+        """Queue a ChangeReport for an entity."""
+        queued = self._queue.get(alexa_entity.entity_id)
+
+        if queued is not None:
+            # Keep the original queue time so latency covers the whole wait
+            queued.alexa_entity = alexa_entity
+            queued.alexa_properties = alexa_properties
+            self.coalesced += 1
+        else:
+            self._queue[alexa_entity.entity_id] = _QueuedReport(
+                alexa_entity, alexa_properties, time.monotonic()
+            )
+
+        if self._sender is None:
+            self._sender = self.hass.async_create_task(self._async_send_queued())
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sending reports."""
+        self._queue.clear()
+        self._report_modes.clear()
+        if self._sender is not None:
+            self._sender.cancel()
+            self._sender = None
+        reporters = self.hass.data.get(DATA_CHANGE_REPORTERS, [])
+        if self in reporters:
+            reporters.remove(self)
+
+    async def _async_send_queued(self) -> None:
+        """Send queued reports while staying within the Alexa rate limits."""
+        session = self.hass.helpers.aiohttp_client.async_get_clientsession()
+
+        try:
+            while self._queue:
+                delay = self._next_send - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                entity_id = next(iter(self._queue))
+                report = self._queue.pop(entity_id)
+                now = time.monotonic()
+                self._next_send = now + CHANGE_REPORT_INTERVAL
+                queue_latency = now - report.queued_at
+                self.max_queue_latency = max(self.max_queue_latency or 0, queue_latency)
+                _LOGGER.debug(
+                    "Sending ChangeReport for %s after %.3f seconds in queue",
+                    entity_id,
+                    queue_latency,
+                )
+
+                status = await async_send_changereport_message(
+                    self.hass,
+                    self.config,
+                    report.alexa_entity,
+                    report.alexa_properties,
+                    session=session,
+                )
+
+                if status != HTTP_TOO_MANY_REQUESTS:
+                    self.sent += 1
+                    continue
+
+                _LOGGER.warning(
+                    "Alexa is rate limiting ChangeReports, waiting %s seconds",
+                    CHANGE_REPORT_RATE_LIMITED_DELAY,
+                )
+                self._next_send = time.monotonic() + CHANGE_REPORT_RATE_LIMITED_DELAY
+                # Retry the report unless a newer change got queued meanwhile
+                if entity_id not in self._queue:
+                    self._queue = {entity_id: report, **self._queue}
+        finally:
+            self._sender = None
+
 
 async def async_send_changereport_message(
-    hass, config, alexa_entity, alexa_properties, *, invalidate_access_token=True
+    hass,
+    config,
+    alexa_entity,
+    alexa_properties,
+    *,
+    invalidate_access_token=True,
+    session=None,
 ):
     """Send a ChangeReport message for an Alexa entity.
 
+    Returns the status of the response, or None if Alexa could not be reached.
+
     https://developer.amazon.com/docs/smarthome/state-reporting-for-a-smart-home-skill.html#report-state-with-changereport-events
     """
     token = await config.async_get_access_token()
@@ -128,7 +305,8 @@ async def async_send_changereport_message(
     message.set_endpoint_full(token, endpoint)
 
     message_serialized = message.serialize()
-    session = hass.helpers.aiohttp_client.async_get_clientsession()
+    if session is None:
+        session = hass.helpers.aiohttp_client.async_get_clientsession()
 
     try:
         with async_timeout.timeout(DEFAULT_TIMEOUT):
@@ -141,7 +319,7 @@ async def async_send_changereport_message(
 
     except (asyncio.TimeoutError, aiohttp.ClientError):
         _LOGGER.error("Timeout sending report to Alexa")
-        return
+        return None
 
     response_text = await response.text()
 
@@ -149,7 +327,7 @@ async def async_send_changereport_message(
     _LOGGER.debug("Received (%s): %s", response.status, response_text)
 
     if response.status == HTTP_ACCEPTED:
-        return
+        return response.status
 
     response_json = json.loads(response_text)
 
@@ -159,7 +337,12 @@ async def async_send_changereport_message(
     ):
         config.async_invalidate_access_token()
         return await async_send_changereport_message(
-            hass, config, alexa_entity, alexa_properties, invalidate_access_token=False
+            hass,
+            config,
+            alexa_entity,
+            alexa_properties,
+            invalidate_access_token=False,
+            session=session,
         )
 
     _LOGGER.error(
@@ -167,6 +350,7 @@ async def async_send_changereport_message(
         response_json["payload"]["code"],
         response_json["payload"]["description"],
     )
+    return response.status
 
 
 async def async_send_add_or_update_message(hass, config, entity_ids):
@@ -0,0 +1,33 @@
+"""Provide info to system health."""
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_CHANGE_REPORTERS
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass):
+    """Get info for the info page."""
+    reporters = hass.data.get(DATA_CHANGE_REPORTERS)
+    if not reporters:
+        return {}
+
+    latencies = [
+        reporter.max_queue_latency
+        for reporter in reporters
+        if reporter.max_queue_latency is not None
+    ]
+
+    return {
+        "queued_reports": sum(reporter.queued for reporter in reporters),
+        "sent_reports": sum(reporter.sent for reporter in reporters),
+        "coalesced_reports": sum(reporter.coalesced for reporter in reporters),
+        "max_queue_latency": round(max(latencies) * 1000) if latencies else None,
+    }
@@ -1,11 +1,13 @@
 """Rest API for Home Assistant."""
+from __future__ import annotations
+
 import asyncio
 from contextlib import suppress
 import json
 import logging
 
 from aiohttp import web
-from aiohttp.web_exceptions import HTTPBadRequest
+from aiohttp.web_exceptions import HTTPBadRequest, HTTPInternalServerError
 import async_timeout
 import voluptuous as vol
 
@@ -13,6 +15,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
@@ -209,6 +212,25 @@ class APIDiscoveryView(HomeAssistantView):
         return self.json(data)
 
 
+def _states_json(
+    states: ha.State | list[ha.State], status_code: int = HTTP_OK
+) -> web.Response:
+    """Return a JSON response of states that reuses their cached JSON."""
+    try:
+        if isinstance(states, list):
+            body = f"[{', '.join(state.as_json() for state in states)}]"
+        else:
+            body = states.as_json()
+    except (ValueError, TypeError) as err:
+        _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, states)
+        raise HTTPInternalServerError from err
+    response = web.Response(
+        body=body.encode("UTF-8"), content_type=CONTENT_TYPE_JSON, status=status_code
+    )
+    response.enable_compression()
+    return response
+
+
 class APIStatesView(HomeAssistantView):
     """View to handle States requests."""
 
@@ -225,7 +247,7 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        return _states_json(states)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -243,7 +265,7 @@ class APIEntityStateView(HomeAssistantView):
 
         state = request.app["hass"].states.get(entity_id)
         if state:
-            return self.json(state)
+            return _states_json(state)
         return self.json_message("Entity not found.", HTTP_NOT_FOUND)
 
     async def post(self, request, entity_id):
@@ -273,7 +295,7 @@ class APIEntityStateView(HomeAssistantView):
 
         # Read the state back for our response
         status_code = HTTP_CREATED if is_new_state else HTTP_OK
-        resp = self.json(hass.states.get(entity_id), status_code)
+        resp = _states_json(hass.states.get(entity_id), status_code)
 
         resp.headers.add("Location", f"/api/states/{entity_id}")
 
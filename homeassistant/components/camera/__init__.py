@@ -1,13 +1,17 @@
 """Component to interface with cameras."""
+from __future__ import annotations
+
 import asyncio
 import base64
 import collections
 from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 import hashlib
 import logging
 import os
 from random import SystemRandom
+import time
 from typing import final
 
 from aiohttp import web
@@ -46,13 +50,16 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
 
+from .broadcast import MjpegBroadcast, async_open_mjpeg_source  # noqa: F401
 from .const import (
     CAMERA_IMAGE_TIMEOUT,
     CAMERA_STREAM_SOURCE_TIMEOUT,
     CONF_DURATION,
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
+    DEFAULT_SNAPSHOT_MAX_AGE,
     DOMAIN,
+    PREF_SNAPSHOT_MAX_AGE,
     SERVICE_RECORD,
 )
 from .prefs import CameraPreferences
@@ -133,7 +140,7 @@ async def async_get_image(hass, entity_id, timeout=10):
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await camera.async_camera_snapshot()
 
             if image:
                 return Image(camera.content_type, image)
@@ -157,6 +164,20 @@ async def async_get_mjpeg_stream(hass, request, entity_id):
     return await camera.handle_async_mjpeg_stream(request)
 
 
+def _mjpeg_part(content_type, img_bytes):
+    """Return an image as a part of a multipart MJPEG stream."""
+    return (
+        bytes(
+            "--frameboundary\r\n"
+            "Content-Type: {}\r\n"
+            "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
 async def async_get_still_stream(request, image_cb, content_type, interval):
     """Generate an HTTP MJPEG stream from camera images.
 
@@ -168,16 +189,7 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
 
     async def write_to_mjpeg_stream(img_bytes):
         """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                "Content-Type: {}\r\n"
-                "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
+        await response.write(_mjpeg_part(content_type, img_bytes))
 
     last_image = None
 
@@ -298,6 +310,11 @@ async def async_unload_entry(hass, entry):
 class Camera(Entity):
     """The base class for camera entities."""
 
+    _snapshot: bytes | None = None
+    _snapshot_time: float = 0.0
+    _snapshot_fetch: asyncio.Task | None = None
+    _mjpeg_broadcasts: dict[str, MjpegBroadcast] | None = None
+
     def __init__(self):
         """Initialize a camera."""
         self.is_streaming = False
@@ -370,12 +387,116 @@ class Camera(Entity):
         """Return bytes of camera image."""
         return await self.hass.async_add_executor_job(self.camera_image)
 
+    @final
+    async def async_camera_snapshot(self, max_age=None):
+        """Return a camera image that is at most max_age seconds old.
+
+        Concurrent callers share a single in-flight fetch from the camera.
+        Without a max_age the snapshot max age preference of the camera is
+        used.
+        """
+        if max_age is None:
+            max_age = self._snapshot_max_age
+
+        if (
+            self._snapshot is not None
+            and time.monotonic() - self._snapshot_time <= max_age
+        ):
+            return self._snapshot
+
+        if self._snapshot_fetch is None:
+            self._snapshot_fetch = self.hass.loop.create_task(
+                self._async_fetch_snapshot()
+            )
+
+        return await asyncio.shield(self._snapshot_fetch)
+
+    async def _async_fetch_snapshot(self):
+        """Fetch a camera image and remember it as the latest snapshot."""
+        try:
+            image = await self.async_camera_image()
+        finally:
+            self._snapshot_fetch = None
+
+        if image:
+            self._snapshot = image
+            self._snapshot_time = time.monotonic()
+
+        return image
+
+    @property
+    def _snapshot_max_age(self):
+        """Return how long snapshots of this camera may be reused."""
+        prefs = self.hass.data.get(DATA_CAMERA_PREFS)
+        if prefs is None:
+            return DEFAULT_SNAPSHOT_MAX_AGE
+        return prefs.get(self.entity_id).snapshot_max_age
+
+    @final
+    async def async_broadcast_mjpeg_stream(self, request, key, open_source):
+        """Serve an MJPEG stream shared by all clients using the same key.
+
+        open_source is called once to open the upstream source when the
+        first client connects. The source is closed again when the last
+        client disconnects.
+        """
+        if self._mjpeg_broadcasts is None:
+            self._mjpeg_broadcasts = {}
+
+        broadcast = self._mjpeg_broadcasts.get(key)
+
+        if broadcast is None:
+
+            @callback
+            def async_remove_broadcast():
+                """Forget the broadcast once its source is closed."""
+                if self._mjpeg_broadcasts.get(key) is broadcast:
+                    del self._mjpeg_broadcasts[key]
+
+            broadcast = self._mjpeg_broadcasts[key] = MjpegBroadcast(
+                self.hass, open_source, async_remove_broadcast
+            )
+
+        return await broadcast.async_handle(request)
+
     async def handle_async_still_stream(self, request, interval):
         """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+        return await self.async_broadcast_mjpeg_stream(
+            request,
+            f"still_{interval}",
+            partial(self._async_open_still_source, interval),
+        )
+
+    async def _async_open_still_source(self, interval):
+        """Open an MJPEG source polling camera images."""
+        return (
+            CONTENT_TYPE_MULTIPART.format("--frameboundary"),
+            self._async_still_parts(interval),
         )
 
+    async def _async_still_parts(self, interval):
+        """Poll camera images and yield the changed ones as MJPEG parts."""
+        last_image = None
+
+        while True:
+            img_bytes = await self.async_camera_snapshot(
+                min(interval, self._snapshot_max_age)
+            )
+            if not img_bytes:
+                break
+
+            if img_bytes != last_image:
+                part = _mjpeg_part(self.content_type, img_bytes)
+                yield part
+
+                # Chrome seems to always ignore first picture,
+                # print it twice.
+                if last_image is None:
+                    yield part
+                last_image = img_bytes
+
+            await asyncio.sleep(interval)
+
     async def handle_async_mjpeg_stream(self, request):
         """Serve an HTTP MJPEG stream from the camera.
 
@@ -500,7 +621,7 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(CAMERA_IMAGE_TIMEOUT):
-                image = await camera.async_camera_image()
+                image = await camera.async_camera_snapshot()
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -598,6 +719,9 @@ async def websocket_get_prefs(hass, connection, msg):
         vol.Required("type"): "camera/update_prefs",
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional("preload_stream"): bool,
+        vol.Optional(PREF_SNAPSHOT_MAX_AGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
     }
 )
 async def websocket_update_prefs(hass, connection, msg):
@@ -0,0 +1,237 @@
+"""Share one upstream MJPEG source between the HTTP clients of a camera."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import AsyncIterator, Awaitable, Callable, Optional, Tuple
+
+import aiohttp
+from aiohttp import web
+from aiohttp.web_exceptions import HTTPBadGateway, HTTPGatewayTimeout
+import async_timeout
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Parts buffered per client, older parts are dropped for slow clients
+MJPEG_CLIENT_BUFFER = 4
+
+# Largest part we buffer while looking for the next multipart boundary
+MAX_PART_SIZE = 8 * 1024 * 1024
+
+MjpegSource = Tuple[Optional[str], AsyncIterator[bytes]]
+
+
+class MjpegBroadcast:
+    """Broadcast the parts of one upstream MJPEG source to many clients.
+
+    The source is opened when the first client connects and closed when
+    the last one leaves. Every client gets a bounded buffer, so a slow
+    client only loses frames instead of holding back the others.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        open_source: Callable[[], Awaitable[MjpegSource]],
+        on_close: Callable[[], None],
+    ) -> None:
+        """Initialize the broadcast."""
+        self.hass = hass
+        self._open_source = open_source
+        self._on_close = on_close
+        self._clients: set[asyncio.Queue] = set()
+        self._opening: asyncio.Task | None = None
+        self._reader: asyncio.Task | None = None
+        self._content_type: str | None = None
+        self._last_part: bytes | None = None
+
+    @property
+    def client_count(self) -> int:
+        """Return the number of connected clients."""
+        return len(self._clients)
+
+    async def async_handle(self, request: web.Request) -> web.StreamResponse:
+        """Stream the broadcast to a client."""
+        queue: asyncio.Queue = asyncio.Queue(MJPEG_CLIENT_BUFFER)
+        self._clients.add(queue)
+
+        try:
+            if self._reader is None:
+                if self._opening is None:
+                    self._opening = self.hass.loop.create_task(self._async_open())
+                await asyncio.shield(self._opening)
+            elif self._content_type is not None and self._last_part is not None:
+                # Chrome seems to always ignore first picture, print it twice.
+                queue.put_nowait(self._last_part)
+                queue.put_nowait(self._last_part)
+
+            response = web.StreamResponse()
+            if self._content_type is not None:
+                response.content_type = self._content_type
+            await response.prepare(request)
+
+            while True:
+                part = await queue.get()
+                if part is None:
+                    break
+                await response.write(part)
+
+            return response
+        finally:
+            self._clients.discard(queue)
+            if not self._clients:
+                self._async_stop()
+
+    async def _async_open(self) -> None:
+        """Open the upstream source and start reading it."""
+        try:
+            self._content_type, parts = await self._open_source()
+        finally:
+            self._opening = None
+        self._reader = self.hass.loop.create_task(self._async_read(parts))
+
+    async def _async_read(self, parts: AsyncIterator[bytes]) -> None:
+        """Read the upstream source and hand its parts to the clients."""
+        try:
+            async for part in parts:
+                self._last_part = part
+                for queue in self._clients:
+                    _async_put_dropping_oldest(queue, part)
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            _LOGGER.debug("Upstream MJPEG source closed")
+        finally:
+            # A stopped reader is already replaced, leave its clients alone
+            if self._reader is asyncio.current_task():
+                self._reader = None
+                for queue in self._clients:
+                    _async_put_dropping_oldest(queue, None)
+                self._on_close()
+            aclose = getattr(parts, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop reading the source once no client is left."""
+        if self._opening is not None:
+            self._opening.cancel()
+            self._opening = None
+            self._on_close()
+        if self._reader is not None:
+            # Clients connecting before the reader is done open a new source
+            self._reader.cancel()
+            self._reader = None
+            self._last_part = None
+            self._on_close()
+
+
+@callback
+def _async_put_dropping_oldest(queue: asyncio.Queue, part: bytes | None) -> None:
+    """Add a part to a client buffer, dropping the oldest part if it is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(part)
+
+
+async def async_open_mjpeg_source(
+    web_coro: Awaitable[aiohttp.ClientResponse],
+    buffer_size: int = 102400,
+    timeout: int = 10,
+) -> MjpegSource:
+    """Open an upstream MJPEG stream for a broadcast."""
+    try:
+        with async_timeout.timeout(timeout):
+            req = await web_coro
+
+    except asyncio.TimeoutError as err:
+        # Timeout trying to start the web request
+        raise HTTPGatewayTimeout() from err
+
+    except aiohttp.ClientError as err:
+        # Something went wrong with the connection
+        raise HTTPBadGateway() from err
+
+    content_type = req.headers.get(aiohttp.hdrs.CONTENT_TYPE)
+    stream = req.content
+
+    async def read_chunks() -> AsyncIterator[bytes]:
+        """Read the response in chunks."""
+        try:
+            while True:
+                with async_timeout.timeout(timeout):
+                    data = await stream.read(buffer_size)
+                if not data:
+                    break
+                yield data
+        finally:
+            req.close()
+
+    return content_type, async_multipart_parts(content_type, read_chunks())
+
+
+async def async_multipart_parts(
+    content_type: str | None, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    """Split a multipart stream into its parts.
+
+    Every yielded part starts at a boundary, so clients can join or skip
+    parts without receiving half a frame. Streams without a boundary are
+    passed on as they are read.
+    """
+    boundary = _get_boundary(content_type)
+
+    try:
+        if boundary is None:
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        data = b""
+        async for chunk in chunks:
+            data += chunk
+            while True:
+                first = data.find(boundary)
+                if first == -1:
+                    break
+                end = _find_delimiter(data, boundary, first + len(boundary))
+                if end == -1:
+                    break
+                yield data[:end]
+                data = data[end:]
+
+            if len(data) > MAX_PART_SIZE:
+                yield data
+                data = b""
+
+        if data:
+            yield data
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _get_boundary(content_type: str | None) -> bytes | None:
+    """Return the boundary of a multipart content type without leading dashes."""
+    if content_type is None:
+        return None
+
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            boundary = value.strip('"').lstrip("-")
+            return boundary.encode() if boundary else None
+
+    return None
+
+
+def _find_delimiter(data: bytes, boundary: bytes, start: int) -> int:
+    """Return the index of the first delimiter line at or after start."""
+    idx = data.find(boundary, start)
+    if idx == -1:
+        return -1
+    while idx > 0 and data[idx - 1 : idx] == b"-":
+        idx -= 1
+    return idx
@@ -4,6 +4,11 @@ DOMAIN = "camera"
 DATA_CAMERA_PREFS = "camera_prefs"
 
 PREF_PRELOAD_STREAM = "preload_stream"
+PREF_SNAPSHOT_MAX_AGE = "snapshot_max_age"
+
+# Seconds a camera image is reused for other image requests, concurrent
+# requests always share one fetch
+DEFAULT_SNAPSHOT_MAX_AGE = 0
 
 SERVICE_RECORD = "record"
 
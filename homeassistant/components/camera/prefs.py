@@ -1,7 +1,12 @@
 """Preference management for camera component."""
 from homeassistant.helpers.typing import UNDEFINED
 
-from .const import DOMAIN, PREF_PRELOAD_STREAM
+from .const import (
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DOMAIN,
+    PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_MAX_AGE,
+)
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -25,6 +30,11 @@ class CameraEntityPreferences:
         """Return if stream is loaded on hass start."""
         return self._prefs.get(PREF_PRELOAD_STREAM, False)
 
+    @property
+    def snapshot_max_age(self):
+        """Return how many seconds a camera image may be reused."""
+        return self._prefs.get(PREF_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE)
+
 
 class CameraPreferences:
     """Handle camera preferences."""
@@ -45,13 +55,21 @@ class CameraPreferences:
         self._prefs = prefs
 
     async def async_update(
-        self, entity_id, *, preload_stream=UNDEFINED, stream_options=UNDEFINED
+        self,
+        entity_id,
+        *,
+        preload_stream=UNDEFINED,
+        snapshot_max_age=UNDEFINED,
+        stream_options=UNDEFINED,
     ):
         """Update camera preferences."""
         if not self._prefs.get(entity_id):
             self._prefs[entity_id] = {}
 
-        for key, value in ((PREF_PRELOAD_STREAM, preload_stream),):
+        for key, value in (
+            (PREF_PRELOAD_STREAM, preload_stream),
+            (PREF_SNAPSHOT_MAX_AGE, snapshot_max_age),
+        ):
             if value is not UNDEFINED:
                 self._prefs[entity_id][key] = value
 
@@ -1,4 +1,5 @@
 """Google Report State implementation."""
+import json
 import logging
 
 from homeassistant.const import MATCH_ALL
@@ -14,6 +15,16 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect significant changes before reporting them in one request
+REPORT_STATE_WINDOW = 1
+
+# Token bucket limiting the number of report state requests
+REPORT_STATE_BURST = 5
+REPORT_STATE_REFILL_INTERVAL = 1
+
+# Split a report into multiple requests when the states get larger than this
+MAX_REPORT_STATE_SIZE = 64 * 1024
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,8 +33,13 @@ _LOGGER = logging.getLogger(__name__)
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
     checker = None
+    pending = {}
+    tokens = REPORT_STATE_BURST
+    unsub_flush = None
+    unsub_refill = None
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
             return
 
@@ -47,11 +63,55 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not checker.async_is_significant_change(new_state, extra_arg=entity_data):
             return
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
+        _LOGGER.debug("Queueing state report for %s: %s", changed_entity, entity_data)
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        pending[changed_entity] = entity_data
+        async_schedule_flush()
+
+    @callback
+    def async_schedule_flush():
+        """Report the pending states after the collect window."""
+        nonlocal unsub_flush
+        if unsub_flush is None:
+            unsub_flush = async_call_later(hass, REPORT_STATE_WINDOW, async_flush)
+
+    @callback
+    def async_flush(_now=None):
+        """Report the pending states for as long as the rate limit allows."""
+        nonlocal unsub_flush, tokens
+        unsub_flush = None
+
+        while pending and tokens:
+            tokens -= 1
+            states = _async_take_chunk(pending)
+            _LOGGER.debug("Reporting state for %d entities", len(states))
+            hass.async_create_task(
+                google_config.async_report_state_all({"devices": {"states": states}})
+            )
+
+        async_schedule_refill()
+
+    @callback
+    def async_schedule_refill():
+        """Schedule adding a token to the bucket."""
+        nonlocal unsub_refill
+        if unsub_refill is None and tokens < REPORT_STATE_BURST:
+            unsub_refill = async_call_later(
+                hass, REPORT_STATE_REFILL_INTERVAL, async_refill
+            )
+
+    @callback
+    def async_refill(_now):
+        """Add a token to the bucket and report states waiting for it."""
+        nonlocal unsub_refill, tokens
+        unsub_refill = None
+        tokens += 1
+
+        # States still inside their collect window are reported when it ends
+        if pending and unsub_flush is None:
+            async_flush()
+        else:
+            async_schedule_refill()
 
     @callback
     def extra_significant_check(
@@ -94,7 +154,8 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not entities:
             return
 
-        await google_config.async_report_state_all({"devices": {"states": entities}})
+        pending.update(entities)
+        async_flush()
 
         unsub = hass.helpers.event.async_track_state_change(
             MATCH_ALL, async_entity_state_listener
@@ -102,5 +163,29 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
     unsub = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    # pylint: disable=unnecessary-lambda
-    return lambda: unsub()
+    @callback
+    def async_disable():
+        """Stop reporting states."""
+        unsub()
+        if unsub_flush is not None:
+            unsub_flush()
+        if unsub_refill is not None:
+            unsub_refill()
+        pending.clear()
+
+    return async_disable
+
+
+def _async_take_chunk(pending: dict) -> dict:
+    """Remove and return pending states up to the maximum report size."""
+    states = {}
+    size = 0
+
+    for entity_id in list(pending):
+        entity_size = len(entity_id) + len(json.dumps(pending[entity_id]))
+        if states and size + entity_size > MAX_REPORT_STATE_SIZE:
+            break
+        states[entity_id] = pending.pop(entity_id)
+        size += entity_size
+
+    return states
@@ -439,7 +439,9 @@ class Group(Entity):
         self._icon = icon
         self._set_tracked(entity_ids)
         self._on_off = None
+        self._on_count = 0
         self._assumed = None
+        self._assumed_count = 0
         self._on_states = None
         self.user_defined = user_defined
         self.mode = any
@@ -448,6 +450,7 @@ class Group(Entity):
         self._order = order
         self._assumed_state = False
         self._async_unsub_state_changed = None
+        self._write_scheduled = False
 
     @staticmethod
     def create_group(
@@ -650,7 +653,8 @@ class Group(Entity):
         """Handle removal from Home Assistant."""
         self._async_stop()
 
-    async def _async_state_changed_listener(self, event):
+    @callback
+    def _async_state_changed_listener(self, event):
         """Respond to a member state changing.
 
         This method must be run in the event loop.
@@ -667,12 +671,34 @@ class Group(Entity):
             self._reset_tracked_state()
 
         self._async_update_group_state(new_state)
+        self._async_schedule_write_ha_state()
+
+    @callback
+    def _async_schedule_write_ha_state(self):
+        """Write the state once for the member changes of a loop iteration.
+
+        A scene turning on many members, or a member group changing, only
+        writes the state of the group once.
+        """
+        if self._write_scheduled:
+            return
+        self._write_scheduled = True
+        self.hass.async_create_task(self._async_write_scheduled_ha_state())
+
+    async def _async_write_scheduled_ha_state(self):
+        """Write the state with the changes of the last loop iteration."""
+        self._write_scheduled = False
+        # removed meanwhile
+        if self._async_unsub_state_changed is None:
+            return
         self.async_write_ha_state()
 
     def _reset_tracked_state(self):
         """Reset tracked state."""
         self._on_off = {}
+        self._on_count = 0
         self._assumed = {}
+        self._assumed_count = 0
         self._on_states = set()
 
         for entity_id in self.trackable:
@@ -687,7 +713,10 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        # The counters make the group state independent of the member count
+        self._assumed_count += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -695,12 +724,20 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in self.hass.data[REG_KEY].on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            is_on = state in entity_on_state
+        self._on_count += is_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = is_on
+
+    def _mode_of_count(self, count, total):
+        """Apply the mode of the group to the number of true values."""
+        if self.mode is all:
+            return count == total
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state=None):
@@ -723,7 +760,9 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_of_count(
+                self._assumed_count, len(self._assumed)
+            )
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -743,7 +782,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_of_count(self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         else:
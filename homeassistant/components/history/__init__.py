@@ -1,9 +1,11 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections import defaultdict
+import asyncio
+from collections import defaultdict, deque
 from datetime import datetime as dt, timedelta
-from itertools import groupby
+from functools import partial
+from itertools import chain, groupby
 import json
 import logging
 import time
@@ -14,27 +16,35 @@ from sqlalchemy import and_, bindparam, func, not_, or_
 from sqlalchemy.ext import baked
 import voluptuous as vol
 
-from homeassistant.components import recorder
+from homeassistant.components import recorder, websocket_api
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
+from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
+    statistics_during_period,
+)
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.const import (
     CONF_DOMAINS,
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
     HTTP_BAD_REQUEST,
 )
-from homeassistant.core import Context, HomeAssistant, State, split_entity_id
+from homeassistant.core import Context, HomeAssistant, State, callback, split_entity_id
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -47,6 +57,12 @@ CONF_ORDER = "use_include_order"
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
 
+# Keys of the series in the compressed state format
+COMPRESSED_STATE_KEY = "s"
+COMPRESSED_LAST_CHANGED_KEY = "lc"
+COMPRESSED_ATTRIBUTES_KEY = "a"
+COMPRESSED_ATTRIBUTES_COLUMN_KEY = "ac"
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -82,16 +98,35 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    States.attributes_id,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "history_bakery"
 
+# The number of states read from the database
+# at a time when streaming the history
+STREAM_BATCH_SIZE = 1000
+
+# The minimum number of bytes written to
+# the response at a time when streaming
+STREAM_CHUNK_SIZE = 65536
+
+JSON_DUMP = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
+
+
+def _query_states(session):
+    """Query the states joined with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
 
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return _get_significant_states(hass, session, *args, **kwargs)
 
 
@@ -115,10 +150,46 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_json(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
     )
 
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+):
+    """Return the query for the significant states sorted by entity_id and time."""
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
+
     if significant_changes_only:
         baked_query += lambda q: q.filter(
             (
@@ -144,34 +215,129 @@ def _get_significant_states(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
 
-    return _sorted_states_to_json(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
-    )
+def _stream_significant_states_json(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+    compressed_state_format=False,
+):
+    """Yield the significant states as chunks of a JSON list of lists.
+
+    The result is the same as the one of get_significant_states, without
+    the entity_ids as keys. The states are read from the database in
+    batches and only the states of one entity are held at a time.
+
+    With compressed_state_format the result is a JSON object with a
+    series per entity_id instead, see _entity_states_to_columns.
+    """
+    start_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            start_states[state.entity_id] = state
+
+    def _states_by_entity():
+        """Yield the entity_id, the start state and the states of each entity."""
+        if entity_ids is not None:
+            # One query per entity keeps the order of entity_ids
+            for entity_id in entity_ids:
+                yield entity_id, start_states.get(entity_id), _query([entity_id])
+            return
+
+        # Entities without changes during the period only have a start
+        # state, they are merged into the entities sorted by entity_id
+        unchanged_ids = deque(sorted(start_states))
+        for entity_id, group in groupby(_query(None), lambda row: row.entity_id):
+            while unchanged_ids and unchanged_ids[0] < entity_id:
+                unchanged_id = unchanged_ids.popleft()
+                yield unchanged_id, start_states[unchanged_id], ()
+            if unchanged_ids and unchanged_ids[0] == entity_id:
+                unchanged_ids.popleft()
+            yield entity_id, start_states.get(entity_id), group
+        for unchanged_id in unchanged_ids:
+            yield unchanged_id, start_states[unchanged_id], ()
+
+    def _query(query_entity_ids):
+        """Return the significant states of the entities, fetched in batches."""
+        return _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            query_entity_ids,
+            filters,
+            significant_changes_only,
+        ).with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_SIZE))
+
+    if compressed_state_format:
+        chunk = bytearray(b"{")
+        separator = b""
+        for entity_id, start_state, rows in _states_by_entity():
+            series = _entity_states_to_columns(
+                split_entity_id(entity_id)[0], start_state, rows, {}
+            )
+            if series is None:
+                continue
+            chunk += separator
+            chunk += JSON_DUMP(entity_id).encode("utf-8")
+            chunk += b":"
+            chunk += JSON_DUMP(series).encode("utf-8")
+            separator = b","
+            if len(chunk) >= STREAM_CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+        chunk += b"}"
+        yield bytes(chunk)
+        return
+
+    chunk = bytearray(b"[")
+    separator = b""
+    for entity_id, start_state, rows in _states_by_entity():
+        # Attributes are rarely shared between entities
+        attr_cache = {}
+        if start_state is not None:
+            start_state.attr_cache = attr_cache
+        entity_separator = separator + b"["
+        for state in _entity_states_to_json(
+            split_entity_id(entity_id)[0],
+            start_state,
+            rows,
+            minimal_response,
+            attr_cache,
+        ):
+            chunk += entity_separator
+            chunk += JSON_DUMP(state).encode("utf-8")
+            entity_separator = b","
+            if len(chunk) >= STREAM_CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+        if entity_separator == b",":
+            chunk += b"]"
+            separator = b","
+
+    chunk += b"]"
+    yield bytes(chunk)
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
-    with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+    with session_scope(hass=hass, read_only=True) as session:
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -184,7 +350,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -204,14 +372,14 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     """Return the last number_of_states."""
     start_time = dt_util.utcnow()
 
-    with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+    with session_scope(hass=hass, read_only=True) as session:
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -247,7 +415,7 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None)
         if run is None:
             return []
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return _get_states_with_session(
             hass, session, utc_point_in_time, entity_ids, run, filters
         )
@@ -272,7 +440,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -320,9 +488,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -359,6 +525,8 @@ def _sorted_states_to_json(
     axis correctly.
     """
     result = defaultdict(list)
+    # Attributes shared by several states are only decoded once
+    attr_cache = {}
     # Set all entity IDs to empty lists in result set to maintain the order
     if entity_ids is not None:
         for ent_id in entity_ids:
@@ -371,6 +539,7 @@ def _sorted_states_to_json(
         for state in _get_states_with_session(
             hass, session, start_time, entity_ids, run=run, filters=filters
         ):
+            state.attr_cache = attr_cache
             state.last_changed = start_time
             state.last_updated = start_time
             result[state.entity_id].append(state)
@@ -379,53 +548,127 @@ def _sorted_states_to_json(
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
-    # Called in a tight loop so cache the function
-    # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
-
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
         ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
+        start_state = ent_results.pop() if ent_results else None
+        ent_results.extend(
+            _entity_states_to_json(
+                split_entity_id(ent_id)[0],
+                start_state,
+                group,
+                minimal_response,
+                attr_cache,
             )
-            prev_state = db_state
-
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+        )
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
 
 
+def _entity_states_to_columns(domain, start_state, db_states, attr_cache):
+    """Return the states of an entity as a series of columns.
+
+    The series has the attributes of the last state and the state and
+    last_changed, as a UNIX timestamp, of each state change. Domains
+    that need the attributes to be graphed get a column of attributes
+    and all their states instead of only the state changes.
+    """
+    states = []
+    last_changed = []
+    attributes = [] if domain in NEED_ATTRIBUTE_DOMAINS else None
+
+    if start_state is not None:
+        start_state.attr_cache = attr_cache
+        db_states = chain((start_state,), db_states)
+
+    last_state = None
+    for db_state in db_states:
+        if (
+            attributes is None
+            and last_state is not None
+            and db_state.state == last_state.state
+        ):
+            last_state = db_state
+            continue
+        last_state = db_state
+        states.append(db_state.state)
+        last_changed.append(process_timestamp(db_state.last_changed).timestamp())
+        if attributes is not None:
+            attributes.append(_lazy_state(db_state, attr_cache).attributes)
+
+    if last_state is None:
+        return None
+
+    series = {
+        COMPRESSED_ATTRIBUTES_KEY: _lazy_state(last_state, attr_cache).attributes,
+        COMPRESSED_STATE_KEY: states,
+        COMPRESSED_LAST_CHANGED_KEY: last_changed,
+    }
+    if attributes is not None:
+        series[COMPRESSED_ATTRIBUTES_COLUMN_KEY] = attributes
+    return series
+
+
+def _lazy_state(db_state, attr_cache):
+    """Return the database row as a LazyState."""
+    if isinstance(db_state, LazyState):
+        return db_state
+    return LazyState(db_state, attr_cache)
+
+
+def _entity_states_to_json(
+    domain, start_state, db_states, minimal_response, attr_cache
+):
+    """Yield the states of an entity sorted by last_updated.
+
+    The start state, if any, comes first.
+    """
+    db_states = iter(db_states)
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        if start_state is not None:
+            yield start_state
+        for db_state in db_states:
+            yield LazyState(db_state, attr_cache)
+        return
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if start_state is None:
+        first_state = next(db_states, None)
+        if first_state is None:
+            return
+        start_state = LazyState(first_state, attr_cache)
+    yield start_state
+
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+
+    prev_state = start_state
+    last_change = None
+    for db_state in db_states:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        if last_change is not None:
+            yield {
+                STATE_KEY: last_change.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    last_change.last_changed
+                ),
+            }
+        last_change = prev_state = db_state
+
+    if last_change is not None:
+        # The last state change is a full state
+        yield LazyState(last_change, attr_cache)
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -439,6 +682,7 @@ async def async_setup(hass, config):
     filters = sqlalchemy_filter_from_include_exclude_conf(conf)
 
     hass.data[HISTORY_BAKERY] = baked.bakery()
+    hass.data[DOMAIN] = filters
 
     use_include_order = conf.get(CONF_ORDER)
 
@@ -446,10 +690,124 @@ async def async_setup(hass, config):
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
     )
+    websocket_api.async_register_command(hass, ws_get_statistics_during_period)
+    websocket_api.async_register_command(hass, ws_get_history_during_period)
 
     return True
 
 
+@callback
+def _async_parse_period(connection, msg):
+    """Return the UTC start and end time of the message, or None if invalid."""
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return None
+
+    end_time = None
+    if "end_time" in msg:
+        end_time = dt_util.parse_datetime(msg["end_time"])
+        if end_time is None:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return None
+        end_time = dt_util.as_utc(end_time)
+
+    return dt_util.as_utc(start_time), end_time
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/history_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_get_history_during_period(hass, connection, msg):
+    """Handle history websocket command, the states are in the compressed format."""
+    period = _async_parse_period(connection, msg)
+    if period is None:
+        return
+    start_time, end_time = period
+
+    if start_time > dt_util.utcnow():
+        connection.send_result(msg["id"], {})
+        return
+
+    connection.send_message(
+        await hass.async_add_executor_job(
+            _history_during_period_message,
+            hass,
+            msg["id"],
+            start_time,
+            end_time,
+            msg.get("entity_ids"),
+            msg["include_start_time_state"],
+            msg["significant_changes_only"],
+        )
+    )
+
+
+def _history_during_period_message(
+    hass,
+    msg_id,
+    start_time,
+    end_time,
+    entity_ids,
+    include_start_time_state,
+    significant_changes_only,
+):
+    """Return the serialized result message of the history during a period."""
+    with session_scope(hass=hass, read_only=True) as session:
+        result = b"".join(
+            _stream_significant_states_json(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                hass.data[DOMAIN],
+                include_start_time_state,
+                significant_changes_only,
+                compressed_state_format=True,
+            )
+        )
+    return websocket_api.messages.result_message_json(msg_id, result.decode("utf-8"))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/statistics_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("statistic_ids"): [str],
+        vol.Optional("period", default=PERIOD_HOUR): vol.In(
+            (PERIOD_5MINUTE, PERIOD_HOUR)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_get_statistics_during_period(hass, connection, msg):
+    """Handle statistics websocket command."""
+    period = _async_parse_period(connection, msg)
+    if period is None:
+        return
+    start_time, end_time = period
+
+    statistics = await hass.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        start_time,
+        end_time,
+        msg.get("statistic_ids"),
+        msg["period"],
+    )
+    connection.send_result(msg["id"], statistics)
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -473,6 +831,10 @@ class HistoryPeriodView(HomeAssistantView):
             if datetime_ is None:
                 return self.json_message("Invalid datetime", HTTP_BAD_REQUEST)
 
+        # Series of columns keyed by entity_id instead of lists of states
+        compressed_state_format = "compressed_state_format" in request.query
+        empty_result = {} if compressed_state_format else []
+
         now = dt_util.utcnow()
 
         one_day = timedelta(days=1)
@@ -482,7 +844,7 @@ class HistoryPeriodView(HomeAssistantView):
             start_time = now - one_day
 
         if start_time > now:
-            return self.json([])
+            return self.json(empty_result)
 
         end_time_str = request.query.get("end_time")
         if end_time_str:
@@ -511,7 +873,20 @@ class HistoryPeriodView(HomeAssistantView):
             and entity_ids
             and not _entities_may_have_state_changes_after(hass, entity_ids, start_time)
         ):
-            return self.json([])
+            return self.json(empty_result)
+
+        if compressed_state_format or not (self.filters and self.use_include_order):
+            return await self._async_stream_significant_states_json(
+                request,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                compressed_state_format,
+            )
 
         return cast(
             web.Response,
@@ -527,6 +902,61 @@ class HistoryPeriodView(HomeAssistantView):
             ),
         )
 
+    async def _async_stream_significant_states_json(
+        self,
+        request,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        compressed_state_format,
+    ):
+        """Stream significant states from the database as json.
+
+        Reordering the result by the included entities needs all of
+        it, so it is only streamed without use_include_order.
+        """
+        response = web.StreamResponse(headers={"Content-Type": CONTENT_TYPE_JSON})
+        response.enable_chunked_encoding()
+        response.enable_compression()
+        await response.prepare(request)
+
+        def _write_significant_states_json():
+            """Write the chunks from the executor as the client reads them."""
+            timer_start = time.perf_counter()
+
+            with session_scope(hass=hass, read_only=True) as session:
+                for chunk in _stream_significant_states_json(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    compressed_state_format,
+                ):
+                    asyncio.run_coroutine_threadsafe(
+                        response.write(chunk), hass.loop
+                    ).result()
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                elapsed = time.perf_counter() - timer_start
+                _LOGGER.debug("Streamed the history in %fs", elapsed)
+
+        try:
+            await hass.async_add_executor_job(_write_significant_states_json)
+        except ConnectionResetError:
+            _LOGGER.debug("Client disconnected while streaming the history")
+            return response
+        await response.write_eof()
+        return response
+
     def _sorted_significant_states_json(
         self,
         hass,
@@ -540,7 +970,7 @@ class HistoryPeriodView(HomeAssistantView):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
 
-        with session_scope(hass=hass) as session:
+        with session_scope(hass=hass, read_only=True) as session:
             result = _get_significant_states(
                 hass,
                 session,
@@ -689,6 +1119,7 @@ class LazyState(State):
 
     __slots__ = [
         "_row",
+        "attr_cache",
         "entity_id",
         "state",
         "_attributes",
@@ -697,9 +1128,10 @@ class LazyState(State):
         "_context",
     ]
 
-    def __init__(self, row):  # pylint: disable=super-init-not-called
+    def __init__(self, row, attr_cache=None):  # pylint: disable=super-init-not-called
         """Init the lazy state."""
         self._row = row
+        self.attr_cache = attr_cache
         self.entity_id = self._row.entity_id
         self.state = self._row.state or ""
         self._attributes = None
@@ -711,12 +1143,21 @@ class LazyState(State):
     def attributes(self):
         """State attributes."""
         if not self._attributes:
+            attributes_id = self._row.attributes_id
+            attr_cache = self.attr_cache
+            if attr_cache is not None and attributes_id in attr_cache:
+                self._attributes = attr_cache[attributes_id]
+                return self._attributes
             try:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(
+                    self._row.shared_attrs or self._row.attributes
+                )
             except ValueError:
                 # When json.loads fails
                 _LOGGER.exception("Error converting row to state: %s", self._row)
                 self._attributes = {}
+            if attr_cache is not None and attributes_id is not None:
+                attr_cache[attributes_id] = self._attributes
         return self._attributes
 
     @attributes.setter
@@ -1,4 +1,5 @@
 """Component to make instant statistics about your history."""
+from collections import deque
 import datetime
 import logging
 import math
@@ -121,6 +122,13 @@ class HistoryStatsSensor(SensorEntity):
         self.value = None
         self.count = None
 
+        # State changes of the tracked entity as (timestamp, matches) tuples,
+        # complete from the timestamp of the first one once loaded
+        self._history = None
+        self._history_start = None
+        # State changes received from the event loop, consumed by update
+        self._pending_changes = deque()
+
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
 
@@ -129,16 +137,28 @@ class HistoryStatsSensor(SensorEntity):
             """Register state tracking."""
 
             @callback
-            def force_refresh(*args):
-                """Force the component to refresh."""
+            def state_changed(event):
+                """Record the state change and refresh."""
+                new_state = event.data["new_state"]
+                # Like the history, only keep changes of the state itself
+                if (
+                    new_state is not None
+                    and new_state.last_changed == new_state.last_updated
+                ):
+                    self._pending_changes.append(
+                        (
+                            new_state.last_changed.timestamp(),
+                            new_state.state in self._entity_states,
+                        )
+                    )
                 self.async_schedule_update_ha_state(True)
 
-            force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
+            self.async_schedule_update_ha_state(True)
 
         if self.hass.state == CoreState.running:
             start_refresh()
@@ -209,34 +229,65 @@ class HistoryStatsSensor(SensorEntity):
         p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
         now_timestamp = math.floor(dt_util.as_timestamp(now))
 
-        # If period has not changed and current time after the period end...
+        # If period has not changed, current time after the period end and no
+        # state changes were received...
         if (
             start_timestamp == p_start_timestamp
             and end_timestamp == p_end_timestamp
             and end_timestamp <= now_timestamp
+            and not self._pending_changes
         ):
             # Don't compute anything as the value cannot have changed
             return
 
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
+        changes = self._pending_changes
+        pending = [changes.popleft() for _ in range(len(changes))]
 
-        if self._entity_id not in history_list:
-            return
+        # The history is only read from the database when the period starts
+        # before the changes that are already known
+        if self._history is None or start_timestamp < self._history_start:
+            # Get history between start and end
+            history_list = history.state_changes_during_period(
+                self.hass, start, end, str(self._entity_id)
+            )
+
+            if self._entity_id not in history_list:
+                self._history = None
+                return
 
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
+            if self._history is not None:
+                pending = list(self._history) + pending
+
+            # The first item is the state at the start of the period
+            self._history = deque(
+                (item.last_changed.timestamp(), item.state in self._entity_states)
+                for item in history_list[self._entity_id]
+            )
+            self._history_start = start_timestamp
+            # Keep the changes that were not recorded yet
+            last_recorded = self._history[-1][0]
+            pending = [change for change in pending if change[0] > last_recorded]
+
+        self._history.extend(pending)
+
+        # Forget the changes before the start except for the state at the start
+        while len(self._history) > 1 and self._history[1][0] <= start_timestamp:
+            self._history.popleft()
+        self._history_start = max(self._history_start, start_timestamp)
+
+        last_state = False
         last_time = start_timestamp
         elapsed = 0
         count = 0
 
+        # Like the history, only use the changes before the end
+        history_end = end.timestamp()
+
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in self._history:
+            if current_time >= history_end:
+                break
+            current_time = max(current_time, start_timestamp)
 
             if last_state:
                 elapsed += current_time - last_time
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import datetime
 import logging
 import math
+import os
 import queue
 import threading
 import time
@@ -37,6 +39,8 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
+import homeassistant.util.dt as dt_util
 
 from .const import (
     API_VERSION_2,
@@ -45,10 +49,13 @@ from .const import (
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
+    COALESCE_LAST,
+    COALESCE_MEAN,
     CODE_INVALID_INPUTS,
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
     CONF_API_VERSION,
     CONF_BUCKET,
+    CONF_COALESCE,
     CONF_COMPONENT_CONFIG,
     CONF_COMPONENT_CONFIG_DOMAIN,
     CONF_COMPONENT_CONFIG_GLOB,
@@ -85,14 +92,21 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_BATCH_BUFFER_SIZE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
+    QUEUE_FULL_MESSAGE,
+    QUEUE_MAX_SIZE,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SLOW_WRITE_SECONDS,
+    SPILL_ERROR_MESSAGE,
+    SPILL_FILE,
+    SPILL_MAX_BYTES,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
@@ -102,6 +116,12 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+PRECISION_DIVISORS = {None: 1, "ns": 1, "us": 10 ** 3, "ms": 10 ** 6, "s": 10 ** 9}
+
+_ESCAPE_MEASUREMENT = str.maketrans({",": r"\,", " ": r"\ ", "\n": r"\n"})
+_ESCAPE_KEY = str.maketrans({",": r"\,", "=": r"\=", " ": r"\ ", "\n": r"\n"})
+_ESCAPE_STRING = str.maketrans({'"': r"\"", "\\": r"\\", "\n": r"\n"})
+
 
 def create_influx_url(conf: dict) -> dict:
     """Build URL used from config inputs and default when necessary."""
@@ -165,6 +185,7 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
         ),
         vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string,
+        vol.Optional(CONF_COALESCE): vol.In([COALESCE_LAST, COALESCE_MEAN]),
         vol.Optional(CONF_TAGS, default={}): vol.Schema({cv.string: cv.string}),
         vol.Optional(CONF_TAGS_ATTRIBUTES, default=[]): vol.All(
             cv.ensure_list, [cv.string]
@@ -316,6 +337,86 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
     return event_to_json
 
 
+def _format_field(value: Any) -> str:
+    """Format a field value for line protocol."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    return f'"{str(value).translate(_ESCAPE_STRING)}"'
+
+
+def _format_time(value: Any, precision: str | None) -> int:
+    """Convert a timestamp to an integer in the given precision."""
+    if isinstance(value, int):
+        # Assume integer timestamps are already in the right precision
+        return value
+    if not isinstance(value, datetime):
+        value = dt_util.parse_datetime(str(value))
+    delta = dt_util.as_utc(value) - dt_util.utc_from_timestamp(0)
+    nanoseconds = (
+        (delta.days * 86400 + delta.seconds) * 10 ** 6 + delta.microseconds
+    ) * 1000
+    return nanoseconds // PRECISION_DIVISORS[precision]
+
+
+def json_to_line(json: dict[str, Any], precision: str | None = None) -> str | None:
+    """Serialize an event json into a line protocol record."""
+    fields = ",".join(
+        f"{key.translate(_ESCAPE_KEY)}={_format_field(value)}"
+        for key, value in json[INFLUX_CONF_FIELDS].items()
+    )
+    if not fields:
+        return None
+
+    line = str(json[INFLUX_CONF_MEASUREMENT]).translate(_ESCAPE_MEASUREMENT)
+    for key, value in sorted(json[INFLUX_CONF_TAGS].items()):
+        value = str(value)
+        if value:
+            line += f",{key.translate(_ESCAPE_KEY)}={value.translate(_ESCAPE_KEY)}"
+
+    return f"{line} {fields} {_format_time(json[INFLUX_CONF_TIME], precision)}"
+
+
+def _coalesce_json(events_json: list[dict[str, Any]], mode: str) -> list[dict]:
+    """Merge updates of the same entity into one point per entity."""
+    merged: dict[tuple, list] = {}
+    for json in events_json:
+        tags = json[INFLUX_CONF_TAGS]
+        key = (
+            json[INFLUX_CONF_MEASUREMENT],
+            tags.get(CONF_DOMAIN),
+            tags.get(CONF_ENTITY_ID),
+        )
+        if key not in merged or mode == COALESCE_LAST:
+            merged[key] = [json, {}, {}]
+        else:
+            merged[key][0] = json
+
+        if mode != COALESCE_MEAN:
+            continue
+
+        sums, counts = merged[key][1:]
+        for field, value in json[INFLUX_CONF_FIELDS].items():
+            if isinstance(value, float):
+                sums[field] = sums.get(field, 0.0) + value
+                counts[field] = counts.get(field, 0) + 1
+
+    result = []
+    for json, sums, counts in merged.values():
+        if sums:
+            json = {**json, INFLUX_CONF_FIELDS: dict(json[INFLUX_CONF_FIELDS])}
+            fields = json[INFLUX_CONF_FIELDS]
+            for field, value in fields.items():
+                if field in sums:
+                    fields[field] = sums[field] / counts[field]
+        result.append(json)
+
+    return result
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
@@ -426,7 +527,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
     def write_v1(json):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(json, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -479,7 +580,15 @@ def setup(hass, config):
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        conf.get(CONF_PRECISION),
+        conf.get(CONF_COALESCE),
+        hass.config.path(STORAGE_DIR, SPILL_FILE),
+    )
     instance.start()
 
     def shutdown(event):
@@ -496,22 +605,53 @@ def setup(hass, config):
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self,
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        precision=None,
+        coalesce=None,
+        spill_path=None,
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
-        self.queue = queue.Queue()
+        self.queue = queue.Queue(maxsize=QUEUE_MAX_SIZE)
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.precision = precision
+        self.coalesce = coalesce
+        self.spill_path = spill_path
+        self.batch_size = BATCH_BUFFER_SIZE
+        self.write_latency = None
         self.write_errors = 0
+        self.written = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.spill_size = 0
         self.shutdown = False
+        self._write_failed = False
+        self._queue_full = False
+        if spill_path is not None:
+            with suppress(OSError):
+                self.spill_size = os.path.getsize(spill_path)
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
     def _event_listener(self, event):
         """Listen for new messages on the bus and queue them for Influx."""
         item = (time.monotonic(), event)
-        self.queue.put(item)
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+            if not self._queue_full:
+                self._queue_full = True
+                _LOGGER.warning(QUEUE_FULL_MESSAGE)
+        else:
+            self._queue_full = False
 
     @staticmethod
     def batch_timeout():
@@ -524,55 +664,129 @@ class InfluxThread(threading.Thread):
 
         count = 0
         json = []
-
-        dropped = 0
+        old_json = []
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while count < self.batch_size and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
 
                 if item is None:
                     self.shutdown = True
+                    continue
+
+                timestamp, event = item
+                event_json = self.event_to_json(event)
+                if not event_json:
+                    continue
+                if time.monotonic() - timestamp < queue_seconds:
+                    json.append(event_json)
                 else:
-                    timestamp, event = item
-                    age = time.monotonic() - timestamp
+                    old_json.append(event_json)
 
-                    if age < queue_seconds:
-                        event_json = self.event_to_json(event)
-                        if event_json:
-                            json.append(event_json)
-                    else:
-                        dropped += 1
+        if self.coalesce:
+            json = _coalesce_json(json, self.coalesce)
+
+        if old_json:
+            # Write the backlog to disk so the live data can catch up
+            _LOGGER.warning(CATCHING_UP_MESSAGE, len(old_json))
+            self.write_errors += self._spill(self._to_lines(old_json))
 
-        if dropped:
-            _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+        return count, self._to_lines(json)
 
-        return count, json
+    def _to_lines(self, events_json):
+        """Serialize events to line protocol."""
+        lines = []
+        for event_json in events_json:
+            line = json_to_line(event_json, self.precision)
+            if line is not None:
+                lines.append(line)
+        return lines
 
     def write_to_influxdb(self, json):
         """Write preprocessed events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
+            start = time.monotonic()
             try:
                 self.influx.write(json)
-
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
-
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
-                break
             except ValueError as err:
                 _LOGGER.error(err)
-                break
+                return
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
-                else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    continue
+                if not self._write_failed:
+                    self._write_failed = True
+                    _LOGGER.error(err)
+                self.batch_size = BATCH_BUFFER_SIZE
+                self.write_errors += self._spill(json)
+                return
+
+            self.write_latency = time.monotonic() - start
+            self.written += len(json)
+            if self._write_failed:
+                _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+                self._write_failed = False
+                self.write_errors = 0
+
+            _LOGGER.debug(WROTE_MESSAGE, len(json))
+            self._adjust_batch_size(len(json))
+            if self.spill_size:
+                self._replay_spill()
+            return
+
+    def _adjust_batch_size(self, written):
+        """Grow the batch while writes keep up with a backlog, shrink if slow."""
+        if self.write_latency > SLOW_WRITE_SECONDS:
+            self.batch_size = max(BATCH_BUFFER_SIZE, self.batch_size // 2)
+        elif written >= self.batch_size and self.queue.qsize():
+            self.batch_size = min(MAX_BATCH_BUFFER_SIZE, self.batch_size * 2)
+
+    def _spill(self, lines):
+        """Append lines to the disk buffer, return the number of lost events."""
+        if not lines:
+            return 0
+        data = "".join(f"{line}\n" for line in lines).encode()
+        if self.spill_path is None or self.spill_size + len(data) > SPILL_MAX_BYTES:
+            self.dropped += len(lines)
+            return len(lines)
+        try:
+            os.makedirs(os.path.dirname(self.spill_path), exist_ok=True)
+            with open(self.spill_path, "ab") as spill:
+                spill.write(data)
+        except OSError as err:
+            _LOGGER.error(SPILL_ERROR_MESSAGE, err)
+            self.dropped += len(lines)
+            return len(lines)
+        self.spill_size += len(data)
+        self.spilled += len(lines)
+        return 0
+
+    def _replay_spill(self):
+        """Write the events buffered on disk during an outage."""
+        try:
+            with open(self.spill_path, "rb") as spill:
+                lines = spill.read().decode().splitlines()
+            os.remove(self.spill_path)
+        except OSError as err:
+            _LOGGER.error(SPILL_ERROR_MESSAGE, err)
+            return
+        self.spill_size = 0
+        self.spilled = 0
+
+        for start in range(0, len(lines), self.batch_size):
+            batch = lines[start : start + self.batch_size]
+            try:
+                self.influx.write(batch)
+            except ValueError as err:
+                _LOGGER.error(err)
+                continue
+            except ConnectionError:
+                self.write_errors += self._spill(lines[start:])
+                return
+            self.written += len(batch)
 
     def run(self):
         """Process incoming events."""
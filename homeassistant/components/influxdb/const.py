@@ -32,6 +32,7 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_COALESCE = "coalesce"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -78,6 +79,14 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+MAX_BATCH_BUFFER_SIZE = 5000
+SLOW_WRITE_SECONDS = 1
+QUEUE_MAX_SIZE = 20000
+SPILL_FILE = "influxdb_buffer"
+SPILL_MAX_BYTES = 10 * 1024 * 1024
+
+COALESCE_LAST = "last"
+COALESCE_MEAN = "mean"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -117,7 +126,9 @@ QUERY_ERROR = (
     "Could not execute query '%s' due to '%s'. Check the syntax of your query."
 )
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
-CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
+CATCHING_UP_MESSAGE = "Catching up, buffered %d old events on disk."
+QUEUE_FULL_MESSAGE = "Export queue is full, dropping events until it drains."
+SPILL_ERROR_MESSAGE = "Could not buffer events on disk: %s."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
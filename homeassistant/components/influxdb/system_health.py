@@ -0,0 +1,33 @@
+"""Provide info to system health."""
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass):
+    """Get info for the info page."""
+    instance = hass.data.get(DOMAIN)
+    if instance is None:
+        return {}
+
+    write_latency = None
+    if instance.write_latency is not None:
+        write_latency = round(instance.write_latency * 1000)
+
+    return {
+        "queue_depth": instance.queue.qsize(),
+        "batch_size": instance.batch_size,
+        "write_latency": write_latency,
+        "written_events": instance.written,
+        "buffered_events": instance.spilled,
+        "dropped_events": instance.dropped,
+    }
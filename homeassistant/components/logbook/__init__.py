@@ -1,8 +1,10 @@
 """Event parser and human readable log generator."""
-from contextlib import suppress
+import asyncio
+from contextlib import closing, suppress
 from datetime import timedelta
 from itertools import groupby
 import json
+import logging
 import re
 
 import sqlalchemy
@@ -10,11 +12,13 @@ from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
+from homeassistant.components import recorder, websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -27,6 +31,7 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
@@ -48,6 +53,8 @@ from homeassistant.helpers.integration_platform import (
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
+_LOGGER = logging.getLogger(__name__)
+
 ENTITY_ID_JSON_TEMPLATE = '"entity_id": "{}"'
 ENTITY_ID_JSON_EXTRACT = re.compile('"entity_id": "([^"]+)"')
 DOMAIN_JSON_EXTRACT = re.compile('"domain": "([^"]+)"')
@@ -58,6 +65,7 @@ ATTR_MESSAGE = "message"
 CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
 DOMAIN = "logbook"
+LOGBOOK_FILTERS = "logbook_filters"
 
 GROUP_BY_MINUTES = 15
 
@@ -66,6 +74,15 @@ UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
 HA_DOMAIN_ENTITY_ID = f"{HA_DOMAIN}."
 
+# Entries per websocket message while streaming the recorded events
+STREAM_CHUNK_SIZE = 250
+
+# Contexts a live stream remembers to describe what caused an entry
+MAX_LIVE_CONTEXTS = 2048
+
+# Seconds a stream waits for the recorder to commit the queued events
+STREAM_COMMIT_TIMEOUT = 10
+
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
 )
@@ -160,7 +177,9 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[LOGBOOK_FILTERS] = (filters, entities_filter)
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    websocket_api.async_register_command(hass, ws_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -257,6 +276,206 @@ class LogbookView(HomeAssistantView):
         return await hass.async_add_executor_job(json_events)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+@websocket_api.async_response
+async def ws_event_stream(hass, connection, msg):
+    """Stream the logbook entries since start_time and keep sending new ones.
+
+    Without an end_time the subscription switches to live entries once
+    the recorded ones have been sent.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    end_time = None
+    if "end_time" in msg:
+        end_time = dt_util.parse_datetime(msg["end_time"])
+        if end_time is None:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+        end_time = dt_util.as_utc(end_time)
+
+    filters, entities_filter = hass.data[LOGBOOK_FILTERS]
+    stream = LogbookEventStream(
+        hass, connection, msg["id"], msg.get("entity_ids"), filters, entities_filter
+    )
+
+    live = end_time is None
+    if live:
+        # Subscribe before querying so no event falls between the
+        # recorded and the live entries
+        connection.subscriptions[msg["id"]] = stream.async_subscribe()
+        end_time = dt_util.utcnow()
+
+    connection.send_result(msg["id"])
+
+    instance = hass.data[recorder.DATA_INSTANCE]
+    if instance.is_alive():
+        try:
+            await asyncio.wait_for(instance.async_commit(), STREAM_COMMIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Recorder did not commit in time, the latest logbook entries "
+                "may be missing from the stream"
+            )
+    # The events committed before going live are read from the database
+    # the recorder writes to, a read replica could still be missing them
+    entries = await hass.async_add_executor_job(
+        stream.stream_recorded, dt_util.as_utc(start_time), end_time, not live
+    )
+    stream.async_go_live(entries)
+
+
+class LogbookEventStream:
+    """Send logbook entries to a websocket subscription.
+
+    The recorded entries are sent in chunks as they are read from the
+    database. Events fired meanwhile are held back and described with
+    the same attribute cache and context lookup once the recorded
+    entries are out.
+    """
+
+    def __init__(self, hass, connection, msg_id, entity_ids, filters, entities_filter):
+        """Initialize the stream."""
+        self.hass = hass
+        self.connection = connection
+        self.msg_id = msg_id
+        self.entity_ids = entity_ids
+        self.filters = filters
+        if entity_ids is not None:
+            entities_filter = generate_filter([], entity_ids, [], [])
+        self.entities_filter = entities_filter
+        self.entity_attr_cache = EntityAttributeCache(hass)
+        self.context_lookup = {None: None}
+        self._pending_events = []
+        self._live = False
+        self._cancelled = False
+        self._unsubs = []
+
+    @callback
+    def async_subscribe(self):
+        """Listen for the events the logbook describes."""
+        for event_type in (*ALL_EVENT_TYPES, *self.hass.data[DOMAIN]):
+            self._unsubs.append(
+                self.hass.bus.async_listen(event_type, self._async_handle_event)
+            )
+        return self._async_unsubscribe
+
+    @callback
+    def _async_unsubscribe(self):
+        """Stop the stream."""
+        self._cancelled = True
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+    def stream_recorded(self, start_day, end_day, read_only=True):
+        """Send the recorded entries in chunks and return the last chunk."""
+        entries = []
+        with closing(
+            _stream_events(
+                self.hass,
+                start_day,
+                end_day,
+                self.entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_attr_cache=self.entity_attr_cache,
+                context_lookup=self.context_lookup,
+                read_only=read_only,
+            )
+        ) as recorded_entries:
+            for entry in recorded_entries:
+                if self._cancelled:
+                    break
+                entries.append(entry)
+                if len(entries) == STREAM_CHUNK_SIZE:
+                    self.hass.loop.call_soon_threadsafe(
+                        self.connection.send_message, self._message(entries, True)
+                    )
+                    entries = []
+        return entries
+
+    @callback
+    def async_go_live(self, entries):
+        """Send the last recorded entries with the ones that came in meanwhile."""
+        if self._cancelled:
+            return
+        for event in self._pending_events:
+            entries.extend(self._humanify_live(event))
+        self._pending_events = None
+        self._live = True
+        self.connection.send_message(self._message(entries))
+
+    @callback
+    def _async_handle_event(self, event):
+        """Describe a new event or hold it until the recorded entries are sent."""
+        if not self._live:
+            self._pending_events.append(event)
+            return
+
+        entries = self._humanify_live(event)
+        if entries:
+            self.connection.send_message(self._message(entries))
+
+    def _humanify_live(self, event):
+        """Convert a live event into logbook entries."""
+        lazy_event = LazyEventPartialState.from_event(event)
+        context_lookup = self.context_lookup
+        context_lookup.setdefault(lazy_event.context_id, lazy_event)
+        if len(context_lookup) > 2 * MAX_LIVE_CONTEXTS:
+            recent = list(context_lookup.items())[-MAX_LIVE_CONTEXTS:]
+            context_lookup.clear()
+            context_lookup[None] = None
+            context_lookup.update(recent)
+
+        if event.event_type == EVENT_CALL_SERVICE:
+            return []
+
+        if event.event_type == EVENT_STATE_CHANGED:
+            if not self._keep_state_changed_event(event):
+                return []
+        elif not _keep_event(self.hass, lazy_event, self.entities_filter):
+            return []
+
+        return list(
+            humanify(self.hass, [lazy_event], self.entity_attr_cache, context_lookup)
+        )
+
+    def _keep_state_changed_event(self, event):
+        """Apply the filters the database query uses for state changes."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if old_state is None or new_state is None:
+            return False
+        if old_state.state == new_state.state:
+            return False
+        if (
+            new_state.domain in CONTINUOUS_DOMAINS
+            and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+        ):
+            return False
+        return self.entities_filter is None or self.entities_filter(new_state.entity_id)
+
+    def _message(self, entries, partial=False):
+        """Return a serialized event message with logbook entries."""
+        data = {"events": entries}
+        if partial:
+            data["partial"] = True
+        return websocket_api.messages.message_to_json(
+            websocket_api.event_message(self.msg_id, data)
+        )
+
+
 def humanify(hass, events, entity_attr_cache, context_lookup):
     """Generate a converted list of events into Entry objects.
 
@@ -422,12 +641,45 @@ def _get_events(
     context_id=None,
 ):
     """Get events for a period of time."""
+    return list(
+        _stream_events(
+            hass,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entities_filter,
+            entity_matches_only,
+            context_id,
+        )
+    )
+
+
+def _stream_events(
+    hass,
+    start_day,
+    end_day,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+    entity_attr_cache=None,
+    context_lookup=None,
+    read_only=True,
+):
+    """Yield the logbook entries for a period of time.
+
+    Pass read_only=False to read from the database the recorder writes to.
+    """
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
 
-    entity_attr_cache = EntityAttributeCache(hass)
-    context_lookup = {None: None}
+    if entity_attr_cache is None:
+        entity_attr_cache = EntityAttributeCache(hass)
+    if context_lookup is None:
+        context_lookup = {None: None}
 
     def yield_events(query):
         """Yield Events that are not filtered away."""
@@ -444,7 +696,7 @@ def _get_events(
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=read_only) as session:
         old_state = aliased(States, name="old_state")
 
         if entity_ids is not None:
@@ -482,8 +734,8 @@ def _get_events(
 
         query = query.order_by(Events.time_fired)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        yield from humanify(
+            hass, yield_events(query), entity_attr_cache, context_lookup
         )
 
 
@@ -494,6 +746,7 @@ def _generate_events_query(session):
         States.entity_id,
         States.domain,
         States.attributes,
+        StateAttributes.shared_attrs,
     )
 
 
@@ -504,6 +757,7 @@ def _generate_events_query_without_states(session):
         literal(None).label("entity_id"),
         literal(None).label("domain"),
         literal(None).label("attributes"),
+        literal(None).label("shared_attrs"),
     )
 
 
@@ -512,6 +766,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -526,6 +783,9 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -555,7 +815,11 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            sqlalchemy.func.coalesce(
+                StateAttributes.shared_attrs, States.attributes
+            ).contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
@@ -709,13 +973,28 @@ class LazyEventPartialState:
         self.context_parent_id = self._row.context_parent_id
         self.time_fired_minute = self._row.time_fired.minute
 
+    @classmethod
+    def from_event(cls, event):
+        """Create a lazy event from an event fired on the bus."""
+        new_state = None
+        if event.event_type == EVENT_STATE_CHANGED:
+            new_state = event.data.get("new_state")
+        lazy_event = cls(_LiveEventRow(event, new_state))
+        if new_state is not None:
+            lazy_event._attributes = new_state.attributes
+        elif event.event_type != EVENT_STATE_CHANGED:
+            lazy_event._event_data = event.data
+        return lazy_event
+
     @property
     def attributes_icon(self):
         """Extract the icon from the decoded attributes or json."""
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(
+            self._row.shared_attrs or self._row.attributes or EMPTY_JSON_OBJECT
+        )
         return result and result.group(1)
 
     @property
@@ -740,13 +1019,11 @@ class LazyEventPartialState:
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            source = self._row.shared_attrs or self._row.attributes
+            if source is None or source == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(source)
         return self._attributes
 
     @property
@@ -770,6 +1047,39 @@ class LazyEventPartialState:
         return self._time_fired_isoformat
 
 
+class _LiveEventRow:
+    """The columns of a logbook query row taken from a live event."""
+
+    __slots__ = [
+        "event_type",
+        "event_data",
+        "time_fired",
+        "context_id",
+        "context_user_id",
+        "context_parent_id",
+        "state",
+        "entity_id",
+        "domain",
+        "attributes",
+        "shared_attrs",
+    ]
+
+    def __init__(self, event, new_state):
+        """Init the row."""
+        self.event_type = event.event_type
+        # The decoded data and attributes are set on the lazy event
+        self.event_data = EMPTY_JSON_OBJECT
+        self.time_fired = event.time_fired
+        self.context_id = event.context.id
+        self.context_user_id = event.context.user_id
+        self.context_parent_id = event.context.parent_id
+        self.state = new_state and new_state.state
+        self.entity_id = new_state and new_state.entity_id
+        self.domain = new_state and new_state.domain
+        self.attributes = None
+        self.shared_attrs = None
+
+
 class EntityAttributeCache:
     """A cache to lookup static entity_id attribute.
 
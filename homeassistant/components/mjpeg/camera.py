@@ -9,7 +9,11 @@ import requests
 from requests.auth import HTTPBasicAuth, HTTPDigestAuth
 import voluptuous as vol
 
-from homeassistant.components.camera import PLATFORM_SCHEMA, Camera
+from homeassistant.components.camera import (
+    PLATFORM_SCHEMA,
+    Camera,
+    async_open_mjpeg_source,
+)
 from homeassistant.const import (
     CONF_AUTHENTICATION,
     CONF_NAME,
@@ -20,10 +24,7 @@ from homeassistant.const import (
     HTTP_DIGEST_AUTHENTICATION,
 )
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import (
-    async_aiohttp_proxy_web,
-    async_get_clientsession,
-)
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -156,11 +157,16 @@ class MjpegCamera(Camera):
         if self._authentication == HTTP_DIGEST_AUTHENTICATION:
             return await super().handle_async_mjpeg_stream(request)
 
-        # connect to stream
-        websession = async_get_clientsession(self.hass, verify_ssl=self._verify_ssl)
-        stream_coro = websession.get(self._mjpeg_url, auth=self._auth)
+        return await self.async_broadcast_mjpeg_stream(
+            request, "mjpeg", self._async_open_mjpeg_source
+        )
 
-        return await async_aiohttp_proxy_web(self.hass, request, stream_coro)
+    async def _async_open_mjpeg_source(self):
+        """Connect to the MJPEG stream of the camera."""
+        websession = async_get_clientsession(self.hass, verify_ssl=self._verify_ssl)
+        return await async_open_mjpeg_source(
+            websession.get(self._mjpeg_url, auth=self._auth)
+        )
 
     @property
     def name(self):
@@ -6,7 +6,7 @@ from functools import lru_cache, partial, wraps
 import inspect
 from itertools import groupby
 import logging
-from operator import attrgetter
+from operator import attrgetter, itemgetter
 import os
 import ssl
 import time
@@ -531,12 +531,112 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str = attr.ib(default="utf-8")
 
 
+class _SubscriptionTrieNode:
+    """Node of the subscription trie, one per topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[tuple[int, Subscription]] = []
+
+
+class SubscriptionTrie:
+    """Wildcard aware trie of subscriptions keyed by topic level.
+
+    Looking up the subscriptions matching a topic is proportional to the
+    depth of the topic instead of the number of subscriptions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        self._sequence = 0
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        self._sequence += 1
+        node.subscriptions.append((self._sequence, subscription))
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie."""
+        levels = subscription.topic.split("/")
+        path = [self._root]
+        for level in levels:
+            node = path[-1].children.get(level)
+            if node is None:
+                raise KeyError(subscription.topic)
+            path.append(node)
+
+        entries = path[-1].subscriptions
+        for idx, (_, other) in enumerate(entries):
+            if other is subscription:
+                del entries[idx]
+                break
+        else:
+            raise KeyError(subscription.topic)
+
+        # Prune the branch when it no longer holds any subscriptions
+        for idx in range(len(levels), 0, -1):
+            node = path[idx]
+            if node.subscriptions or node.children:
+                break
+            del path[idx - 1].children[levels[idx - 1]]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there is at least one subscription on the topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            node = node.children.get(level)  # type: ignore
+            if node is None:
+                return False
+        return bool(node.subscriptions)
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic in subscription order."""
+        # Wildcards in the first level do not match topics starting with $
+        wildcard_root = not topic.startswith("$")
+        matched: list[tuple[int, Subscription]] = []
+        nodes = [self._root]
+
+        for idx, level in enumerate(topic.split("/")):
+            next_nodes = []
+            wildcards = wildcard_root or idx > 0
+            for node in nodes:
+                children = node.children
+                if wildcards and "#" in children:
+                    matched.extend(children["#"].subscriptions)
+                if level in children:
+                    next_nodes.append(children[level])
+                if wildcards and "+" in children:
+                    next_nodes.append(children["+"])
+            nodes = next_nodes
+            if not nodes:
+                break
+
+        for node in nodes:
+            matched.extend(node.subscriptions)
+            # A multi-level wildcard also matches its parent level
+            if "#" in node.children:
+                matched.extend(node.children["#"].subscriptions)
+
+        if len(matched) > 1:
+            matched.sort(key=itemgetter(0))
+        return [subscription for _, subscription in matched]
+
+
 class MQTT:
     """Home Assistant MQTT client."""
 
@@ -555,6 +655,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscription_trie = SubscriptionTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -741,10 +842,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
+        self._subscription_trie.add(subscription)
         self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
@@ -758,9 +858,10 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
+            self._subscription_trie.remove(subscription)
             self._matching_subscriptions.cache_clear()
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self._subscription_trie.has_topic(topic):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -853,11 +954,7 @@ class MQTT:
 
     @lru_cache(2048)
     def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        return self._subscription_trie.matches(topic)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -969,16 +1066,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
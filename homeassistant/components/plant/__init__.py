@@ -4,6 +4,7 @@ from contextlib import suppress
 from datetime import datetime, timedelta
 import logging
 
+from sqlalchemy.orm import joinedload
 import voluptuous as vol
 
 from homeassistant.components.recorder.models import States
@@ -311,9 +312,10 @@ class Plant(Entity):
             return
 
         _LOGGER.debug("Initializing values for %s from the database", self._name)
-        with session_scope(hass=self.hass) as session:
+        with session_scope(hass=self.hass, read_only=True) as session:
             query = (
                 session.query(States)
+                .options(joinedload(States.state_attributes))
                 .filter(
                     (States.entity_id == entity_id.lower())
                     and (States.last_updated > start_date)
@@ -1,12 +1,14 @@
 """Support for Prometheus metrics export."""
+import gzip
 import logging
 import string
+import threading
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
+from prometheus_client.utils import floatToGoString
 import voluptuous as vol
 
-from homeassistant import core as hacore
 from homeassistant.components.climate.const import (
     ATTR_CURRENT_TEMPERATURE,
     ATTR_HVAC_ACTION,
@@ -43,6 +45,7 @@ _LOGGER = logging.getLogger(__name__)
 API_ENDPOINT = "/api/prometheus"
 
 DOMAIN = "prometheus"
+GZIP_COMPRESS_LEVEL = 6
 CONF_FILTER = "filter"
 CONF_PROM_NAMESPACE = "namespace"
 CONF_COMPONENT_CONFIG = "component_config"
@@ -80,8 +83,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -104,10 +105,28 @@ def setup(hass, config):
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(prometheus_client, metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
     return True
 
 
+def _escape_label_value(value):
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_sample(sample):
+    """Format a sample as a line of the text exposition format."""
+    labels = ""
+    if sample.labels:
+        labels = ",".join(
+            f'{key}="{_escape_label_value(value)}"'
+            for key, value in sorted(sample.labels.items())
+        )
+        labels = f"{{{labels}}}"
+    return f"{sample.name}{labels} {floatToGoString(sample.value)}\n"
+
+
 class PrometheusMetrics:
     """Model all of the metrics which should be exposed to Prometheus."""
 
@@ -139,7 +158,13 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
+        # Events are handled in executor threads, the lock keeps scrapes
+        # from rendering a family while it is created or updated.
+        self._lock = threading.Lock()
         self._metrics = {}
+        self._changed_metrics = set()
+        self._rendered_metrics = {}
+        self._sample_lines = {}
         self._climate_units = climate_units
 
     def handle_event(self, event):
@@ -148,16 +173,18 @@ class PrometheusMetrics:
         if state is None:
             return
 
-        entity_id = state.entity_id
-        _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
+        _LOGGER.debug("Handling state update for %s", state.entity_id)
 
         if not self._filter(state.entity_id):
             return
 
+        with self._lock:
+            self._handle_state(state)
+
+    def _handle_state(self, state):
         ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
 
-        handler = f"_handle_{domain}"
+        handler = f"_handle_{state.domain}"
 
         if hasattr(self, handler) and state.state not in ignored_states:
             getattr(self, handler)(state)
@@ -197,19 +224,63 @@ class PrometheusMetrics:
                 pass
 
     def _metric(self, metric, factory, documentation, extra_labels=None):
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
-
+        self._changed_metrics.add(metric)
         try:
             return self._metrics[metric]
         except KeyError:
+            labels = ["entity", "friendly_name", "domain"]
+            if extra_labels is not None:
+                labels.extend(extra_labels)
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(full_metric_name, documentation, labels)
+            # Entity metrics are kept out of the default registry so they can
+            # be rendered per family and cached between scrapes.
+            self._metrics[metric] = factory(
+                full_metric_name, documentation, labels, registry=None
+            )
             return self._metrics[metric]
 
+    def render(self):
+        """Render the exposition, only regenerating the changed families."""
+        with self._lock:
+            changed, self._changed_metrics = self._changed_metrics, set()
+            for metric in changed:
+                self._rendered_metrics[metric] = self._render_metric(metric)
+            rendered = b"".join(self._rendered_metrics.values())
+        return self.prometheus_cli.generate_latest() + rendered
+
+    def _render_metric(self, metric):
+        """Render a metric family, reusing the lines of unchanged samples."""
+        sample_lines = self._sample_lines.setdefault(metric, {})
+        output = []
+        for family in self._metrics[metric].collect():
+            name = family.name
+            if family.type == "counter":
+                name = f"{name}_total"
+            documentation = family.documentation.replace("\\", r"\\").replace(
+                "\n", r"\n"
+            )
+            output.append(f"# HELP {name} {documentation}\n")
+            output.append(f"# TYPE {name} {family.type}\n")
+
+            created = []
+            for sample in family.samples:
+                key = (sample.name, tuple(sample.labels.values()))
+                cached = sample_lines.get(key)
+                if cached is None or cached[0] != sample.value:
+                    cached = sample_lines[key] = (sample.value, _format_sample(sample))
+                if sample.name == f"{family.name}_created":
+                    created.append(cached[1])
+                else:
+                    output.append(cached[1])
+
+            if created:
+                output.append(f"# TYPE {family.name}_created gauge\n")
+                output.extend(created)
+
+        return "".join(output).encode("utf-8")
+
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
         return "".join(
@@ -482,15 +553,26 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, metrics):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
+        hass = request.app["hass"]
+        use_gzip = "gzip" in request.headers.get(hdrs.ACCEPT_ENCODING, "")
+
+        body = await hass.async_add_executor_job(self.metrics.render)
+
+        headers = {hdrs.VARY: hdrs.ACCEPT_ENCODING}
+        if use_gzip:
+            body = await hass.async_add_executor_job(
+                gzip.compress, body, GZIP_COMPRESS_LEVEL
+            )
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
 
         return web.Response(
-            body=self.prometheus_cli.generate_latest(),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+            body=body, content_type=CONTENT_TYPE_TEXT_PLAIN, headers=headers
         )
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 import concurrent.futures
 from datetime import datetime, timedelta
 import logging
@@ -11,7 +12,7 @@ import threading
 import time
 from typing import Any, Callable, NamedTuple
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -34,14 +35,30 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER,
     convert_include_exclude_filter,
 )
-from homeassistant.helpers.event import async_track_time_interval, track_time_change
+from homeassistant.helpers.event import (
+    async_track_time_interval,
+    track_time_change,
+    track_utc_time_change,
+)
+from homeassistant.helpers.integration_platform import (
+    async_process_integration_platforms,
+)
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
-from . import migration, purge
+from . import migration, purge, statistics, websocket_api
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from .models import (
+    TABLE_EVENTS,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES,
+    Base,
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from .util import (
     dburl_to_path,
     move_away_broken_database,
@@ -83,14 +100,24 @@ KEEPALIVE_TIME = 30
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of recently used shared attributes
+# we keep the attributes_id of in memory
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
+# The maximum number of attribute hashes
+# we look up in one query
+MAX_HASHES_PER_QUERY = 500
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
+CONF_DB_READ_URL = "db_read_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_SHORT_TERM_STATISTICS = "short_term_statistics"
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
     {vol.Optional(CONF_EVENT_TYPES): vol.All(cv.ensure_list, [cv.string])}
@@ -113,6 +140,7 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): cv.string,
+                    vol.Optional(CONF_DB_READ_URL): cv.string,
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -125,6 +153,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_SHORT_TERM_STATISTICS, default=False): cv.boolean,
                 }
             ),
         )
@@ -199,6 +228,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
     exclude = conf[CONF_EXCLUDE]
     exclude_t = exclude.get(CONF_EVENT_TYPES, [])
+    short_term_statistics = conf[CONF_SHORT_TERM_STATISTICS]
+    db_read_url = conf.get(CONF_DB_READ_URL)
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass,
         auto_purge=auto_purge,
@@ -209,14 +240,25 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        short_term_statistics=short_term_statistics,
+        db_read_url=db_read_url,
     )
     instance.async_initialize()
     instance.start()
     _async_register_services(hass, instance)
+    websocket_api.async_setup(hass)
+
+    hass.data[DOMAIN] = {}
+    await async_process_integration_platforms(hass, DOMAIN, _process_recorder_platform)
 
     return await instance.async_db_ready
 
 
+async def _process_recorder_platform(hass, domain, platform):
+    """Process a recorder platform."""
+    hass.data[DOMAIN][domain] = platform
+
+
 @callback
 def _async_register_services(hass, instance):
     """Register recorder services."""
@@ -255,10 +297,27 @@ class PurgeTask(NamedTuple):
     apply_filter: bool
 
 
+class StatisticsTask(NamedTuple):
+    """Object to store information about a statistics compile task."""
+
+    start: datetime
+    period: str
+
+
+class CompileMissingStatisticsTask:
+    """An object to insert into the recorder queue to compile the statistics missed while stopped."""
+
+
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class CommitTask(NamedTuple):
+    """Object to store information about a commit somebody waits for."""
+
+    event: asyncio.Event
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -273,6 +332,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        short_term_statistics: bool,
+        db_read_url: str | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -284,28 +345,43 @@ class Recorder(threading.Thread):
         self.queue: Any = queue.SimpleQueue()
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
+        self.db_read_url = db_read_url
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.async_db_ready = asyncio.Future()
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Any = None
+        self.read_engine: Any = None
         self.run_info: Any = None
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
+        self.short_term_statistics = short_term_statistics
 
         self._timechanges_seen = 0
         self._commits_without_expire = 0
         self._keepalive_count = 0
-        self._old_states = {}
-        self._pending_expunge = []
+        self._old_states: dict[str, dict[str, Any]] = {}
+        self._pending_events: list[dict[str, Any]] = []
+        self._pending_states: list[
+            tuple[
+                dict[str, Any],
+                dict[str, Any],
+                dict[str, Any] | None,
+                dict[str, Any] | None,
+            ]
+        ] = []
+        self._pending_state_attributes: dict[str, dict[str, Any]] = {}
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
         self.event_session = None
         self.get_session = None
+        self.get_read_session = None
         self._completed_database_setup = None
         self._event_listener = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
+        self.purge_progress: purge.PurgeProgress | None = None
         self._queue_watcher = None
 
         self.enabled = True
@@ -416,6 +492,32 @@ class Recorder(threading.Thread):
         """Trigger the purge."""
         self.queue.put(PurgeTask(self.keep_days, repack=False, apply_filter=False))
 
+    @callback
+    def async_periodic_statistics(self, now):
+        """Trigger the statistics compilation of the periods that just closed."""
+        end = statistics.period_start(now, statistics.PERIOD_5MINUTE)
+        if self.short_term_statistics:
+            self.queue.put(
+                StatisticsTask(
+                    end - statistics.PERIOD_LENGTHS[statistics.PERIOD_5MINUTE],
+                    statistics.PERIOD_5MINUTE,
+                )
+            )
+        if end.minute == 0:
+            self.queue.put(
+                StatisticsTask(
+                    end - statistics.PERIOD_LENGTHS[statistics.PERIOD_HOUR],
+                    statistics.PERIOD_HOUR,
+                )
+            )
+
+    @property
+    def statistics_periods(self) -> list[str]:
+        """Return the periods statistics are compiled for."""
+        if self.short_term_statistics:
+            return [statistics.PERIOD_5MINUTE, statistics.PERIOD_HOUR]
+        return [statistics.PERIOD_HOUR]
+
     def run(self):
         """Start processing events to save."""
         shutdown_task = object()
@@ -469,6 +571,15 @@ class Recorder(threading.Thread):
             # Purge every night at 4:12am
             track_time_change(self.hass, self.async_purge, hour=4, minute=12, second=0)
 
+        # Compile statistics shortly after each period closes
+        track_utc_time_change(
+            self.hass,
+            self.async_periodic_statistics,
+            minute="/5" if self.short_term_statistics else 0,
+            second=10,
+        )
+        self.queue.put(CompileMissingStatisticsTask())
+
         _LOGGER.debug("Recorder processing the queue")
         self.hass.add_job(self._async_recorder_ready)
         self._run_event_loop()
@@ -560,19 +671,63 @@ class Recorder(threading.Thread):
 
     def _run_purge(self, keep_days, repack, apply_filter):
         """Purge the database."""
+        # Write the pending rows first so the purge does not remove shared
+        # attributes that they reference
+        self._commit_event_session_or_retry()
         if purge.purge_old_data(self, keep_days, repack, apply_filter):
             return
         # Schedule a new purge task if this one didn't finish
         self.queue.put(PurgeTask(keep_days, repack, apply_filter))
 
+    def _schedule_compile_missing_statistics(self):
+        """Queue the statistics of the periods that closed while we were stopped.
+
+        Only periods that still have states, and follow the last compiled
+        period, are compiled.
+        """
+        now = dt_util.utcnow()
+        keep_since = now - timedelta(days=self.keep_days)
+        for period in self.statistics_periods:
+            with session_scope(session=self.get_session()) as session:
+                last_start = statistics.get_last_compiled_start(session, period)
+            if last_start is None:
+                continue
+            length = statistics.PERIOD_LENGTHS[period]
+            start = max(
+                last_start + length, statistics.period_start(keep_since, period)
+            )
+            current_start = statistics.period_start(now, period)
+            while start < current_start:
+                self.queue.put(StatisticsTask(start, period))
+                start += length
+
+    def _run_statistics(self, start, period):
+        """Compile the statistics of a period."""
+        # Write the pending rows first so the statistics include the
+        # states recorded at the end of the period
+        self._commit_event_session_or_retry()
+        statistics.compile_statistics(self, start, period)
+
     def _process_one_event(self, event):
         """Process one event."""
         if isinstance(event, PurgeTask):
             self._run_purge(event.keep_days, event.repack, event.apply_filter)
             return
+        if isinstance(event, StatisticsTask):
+            self._run_statistics(event.start, event.period)
+            return
+        if isinstance(event, CompileMissingStatisticsTask):
+            self._schedule_compile_missing_statistics()
+            return
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
+        if isinstance(event, CommitTask):
+            try:
+                self._commit_event_session_or_retry()
+            finally:
+                self.hass.loop.call_soon_threadsafe(event.event.set)
+            return
         if event.event_type == EVENT_TIME_CHANGED:
             self._keepalive_count += 1
             if self._keepalive_count >= KEEPALIVE_TIME:
@@ -588,46 +743,79 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
 
+        # Rows are buffered until the next commit and written with a
+        # single executemany insert per table. The primary keys are
+        # assigned when the rows are written, see _write_pending_rows.
         try:
             if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
+                event_row = Events.row_from_event(event, event_data="{}")
             else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
+                event_row = Events.row_from_event(event)
         except (TypeError, ValueError):
             _LOGGER.warning("Event is not JSON serializable: %s", event)
             return
+        event_row["event_id"] = None
+        event_row["created"] = event.time_fired
+        self._pending_events.append(event_row)
 
         if event.event_type == EVENT_STATE_CHANGED:
             try:
-                dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
+                state_row = States.row_from_event(event)
             except (TypeError, ValueError):
                 _LOGGER.warning(
                     "State is not JSON serializable: %s",
                     event.data.get("new_state"),
                 )
+            else:
+                entity_id = state_row["entity_id"]
+                has_new_state = event.data.get("new_state")
+                if not has_new_state:
+                    state_row["state"] = None
+                state_row["state_id"] = None
+                state_row["created"] = event.time_fired
+                state_row["old_state_id"] = None
+                # The previous state row of the entity, its state_id is known
+                # once it has been written
+                old_state_row = self._old_states.pop(entity_id, None)
+                attributes_row = self._state_attributes_row(state_row)
+                self._pending_states.append(
+                    (state_row, event_row, old_state_row, attributes_row)
+                )
+                if has_new_state:
+                    self._old_states[entity_id] = state_row
 
         # If they do not have a commit interval
         # than we commit right away
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _state_attributes_row(self, state_row):
+        """Move the attributes of a state row to the shared attributes table.
+
+        Returns the pending shared attributes row when the attributes are
+        not in the cache of recently used attributes ids.
+        """
+        shared_attrs = state_row["attributes"]
+        state_row["attributes"] = None
+        state_row["attributes_id"] = None
+
+        attributes_row = self._pending_state_attributes.get(shared_attrs)
+        if attributes_row is not None:
+            return attributes_row
+
+        attributes_id = self._state_attributes_ids.get(shared_attrs)
+        if attributes_id is not None:
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            state_row["attributes_id"] = attributes_id
+            return None
+
+        attributes_row = self._pending_state_attributes[shared_attrs] = {
+            "attributes_id": None,
+            "hash": StateAttributes.hash_shared_attrs(shared_attrs),
+            "shared_attrs": shared_attrs,
+        }
+        return attributes_row
+
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -664,15 +852,19 @@ class Recorder(threading.Thread):
     def _commit_event_session(self):
         self._commits_without_expire += 1
 
-        if self._pending_expunge:
-            self.event_session.flush()
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
+        if self._pending_events:
+            self._write_pending_rows()
         self.event_session.commit()
+        self._pending_events = []
+        self._pending_states = []
+
+        if self._pending_state_attributes:
+            state_attributes_ids = self._state_attributes_ids
+            for shared_attrs, attributes_row in self._pending_state_attributes.items():
+                state_attributes_ids[shared_attrs] = attributes_row["attributes_id"]
+            while len(state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+                state_attributes_ids.popitem(last=False)
+            self._pending_state_attributes = {}
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -681,6 +873,107 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             self.event_session.expire_all()
 
+    def _write_pending_rows(self):
+        """Write the buffered event and state rows with executemany inserts.
+
+        The recorder is the only writer of the events and states tables
+        so the primary keys are allocated here instead of being fetched
+        back row by row, which allows linking each state to its event and
+        old state without going through the ORM.
+        """
+        session = self.event_session
+        try:
+            event_id = session.query(func.max(Events.event_id)).scalar() or 0
+            for event_row in self._pending_events:
+                event_id += 1
+                event_row["event_id"] = event_id
+
+            session.execute(Events.__table__.insert(), self._pending_events)
+            last_ids = [(TABLE_EVENTS, "event_id", event_id)]
+
+            if self._pending_state_attributes:
+                last_ids.append(self._write_pending_state_attributes())
+
+            if self._pending_states:
+                state_id = session.query(func.max(States.state_id)).scalar() or 0
+                state_rows = []
+                for (
+                    state_row,
+                    event_row,
+                    old_state_row,
+                    attributes_row,
+                ) in self._pending_states:
+                    state_id += 1
+                    state_row["state_id"] = state_id
+                    state_row["event_id"] = event_row["event_id"]
+                    if old_state_row is not None:
+                        state_row["old_state_id"] = old_state_row["state_id"]
+                    if attributes_row is not None:
+                        state_row["attributes_id"] = attributes_row["attributes_id"]
+                    state_rows.append(state_row)
+                session.execute(States.__table__.insert(), state_rows)
+                last_ids.append((TABLE_STATES, "state_id", state_id))
+
+            if self.engine.dialect.name == "postgresql":
+                # Explicit ids do not advance the serial sequences
+                for table, column, last_id in last_ids:
+                    session.execute(
+                        text(
+                            "SELECT setval(pg_get_serial_sequence(:table, :column), :id)"
+                        ),
+                        {"table": table, "column": column, "id": last_id},
+                    )
+        except Exception:
+            # Keep the rows buffered so they are written again on retry
+            session.rollback()
+            raise
+
+    def _write_pending_state_attributes(self):
+        """Write the shared attributes that are not in the database yet.
+
+        Attributes that are already stored, but were not in the cache, reuse
+        the existing row.
+        """
+        session = self.event_session
+        pending = self._pending_state_attributes
+        for attributes_row in pending.values():
+            attributes_row["attributes_id"] = None
+
+        hashes = list({attributes_row["hash"] for attributes_row in pending.values()})
+        for idx in range(0, len(hashes), MAX_HASHES_PER_QUERY):
+            for attributes_id, shared_attrs in session.query(
+                StateAttributes.attributes_id, StateAttributes.shared_attrs
+            ).filter(
+                StateAttributes.hash.in_(hashes[idx : idx + MAX_HASHES_PER_QUERY])
+            ):
+                attributes_row = pending.get(shared_attrs)
+                if attributes_row is not None:
+                    attributes_row["attributes_id"] = attributes_id
+
+        attributes_id = (
+            session.query(func.max(StateAttributes.attributes_id)).scalar() or 0
+        )
+        new_rows = []
+        for attributes_row in pending.values():
+            if attributes_row["attributes_id"] is None:
+                attributes_id += 1
+                attributes_row["attributes_id"] = attributes_id
+                new_rows.append(attributes_row)
+
+        if new_rows:
+            session.execute(StateAttributes.__table__.insert(), new_rows)
+        return (TABLE_STATE_ATTRIBUTES, "attributes_id", attributes_id)
+
+    def evict_state_attributes_ids(self, attributes_ids):
+        """Remove purged attributes ids from the cache of recent attributes."""
+        state_attributes_ids = self._state_attributes_ids
+        for shared_attrs in [
+            shared_attrs
+            for shared_attrs, attributes_id in state_attributes_ids.items()
+            if attributes_id in attributes_ids
+        ]:
+            del state_attributes_ids[shared_attrs]
+
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
         self._close_event_session()
@@ -692,6 +985,10 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_state_attributes = {}
+        self._state_attributes_ids = OrderedDict()
 
         if not self.event_session:
             return
@@ -724,6 +1021,12 @@ class Recorder(threading.Thread):
         """Listen for new events and put them in the process queue."""
         self.queue.put(event)
 
+    async def async_commit(self):
+        """Wait until the events queued so far are in the database."""
+        event = asyncio.Event()
+        self.queue.put(CommitTask(event))
+        await event.wait()
+
     def block_till_done(self):
         """Block till all events processed.
 
@@ -785,8 +1088,43 @@ class Recorder(threading.Thread):
 
         Base.metadata.create_all(self.engine)
         self.get_session = scoped_session(sessionmaker(bind=self.engine))
+        self._setup_read_connection()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_connection(self):
+        """Set up the engine the history, logbook and statistics queries use.
+
+        Queries get their own connection pool so they do not wait on the
+        recorder session. With SQLite in WAL mode readers do not block the
+        writer, with other databases the queries can go to a replica.
+        """
+        read_url = self.db_read_url or self.db_url
+        if read_url == SQLITE_URL_PREFIX or ":memory:" in read_url:
+            # An in memory database only exists on the recorder connection
+            self.read_engine = self.engine
+            self.get_read_session = self.get_session
+            return
+
+        def setup_read_connection(dbapi_connection, connection_record):
+            """Make the query connections read only."""
+            cursor = dbapi_connection.cursor()
+            if read_url.startswith(SQLITE_URL_PREFIX):
+                cursor.execute("PRAGMA query_only=ON")
+            elif read_url.startswith("mysql"):
+                cursor.execute("SET session wait_timeout=28800")
+                cursor.execute("SET SESSION TRANSACTION READ ONLY")
+            elif read_url.startswith("postgresql"):
+                cursor.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
+            cursor.close()
+
+        kwargs = {"echo": False}
+        if read_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["connect_args"] = {"check_same_thread": False}
+
+        self.read_engine = create_engine(read_url, **kwargs)
+        sqlalchemy_event.listen(self.read_engine, "connect", setup_read_connection)
+        self.get_read_session = scoped_session(sessionmaker(bind=self.read_engine))
+
     @property
     def _using_file_sqlite(self):
         """Short version to check if we are using sqlite3 as a file."""
@@ -796,6 +1134,10 @@ class Recorder(threading.Thread):
 
     def _close_connection(self):
         """Close the connection."""
+        if self.get_read_session is not self.get_session:
+            self.read_engine.dispose()
+        self.read_engine = None
+        self.get_read_session = None
         self.engine.dispose()
         self.engine = None
         self.get_session = None
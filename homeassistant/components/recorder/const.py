@@ -8,3 +8,10 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 # The maximum number of rows (events) we purge in one delete statement
 MAX_ROWS_TO_PURGE = 1000
+
+# The minimum number of rows (events) we purge in one delete statement
+MIN_ROWS_TO_PURGE = 50
+
+# The time a purge batch may block the recorder thread before the batch
+# size is reduced
+PURGE_BATCH_LATENCY = 0.5
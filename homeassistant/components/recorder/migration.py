@@ -11,7 +11,14 @@ from sqlalchemy.exc import (
 )
 from sqlalchemy.schema import AddConstraint, DropConstraint
 
-from .models import SCHEMA_VERSION, TABLE_STATES, Base, SchemaChanges
+from .models import (
+    SCHEMA_VERSION,
+    TABLE_STATES,
+    Base,
+    SchemaChanges,
+    Statistics,
+    StatisticsShortTerm,
+)
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -405,6 +412,16 @@ def _apply_update(engine, new_version, old_version):
             )
     elif new_version == 14:
         _modify_columns(engine, "events", ["event_type VARCHAR(64)"])
+    elif new_version == 15:
+        # The state_attributes table is created with the other missing
+        # tables when connecting. States recorded before this version
+        # keep their attributes in the states table.
+        _add_columns(engine, "states", ["attributes_id INTEGER"])
+        _create_index(engine, "states", "ix_states_attributes_id")
+    elif new_version == 16:
+        Base.metadata.create_all(
+            engine, tables=[Statistics.__table__, StatisticsShortTerm.__table__]
+        )
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
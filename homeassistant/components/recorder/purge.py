@@ -1,19 +1,29 @@
 """Purge old data helper."""
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm.session import Session
-from sqlalchemy.sql.expression import distinct
+from sqlalchemy.sql.expression import distinct, exists
 
 import homeassistant.util.dt as dt_util
 
-from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .const import MAX_ROWS_TO_PURGE, MIN_ROWS_TO_PURGE, PURGE_BATCH_LATENCY
+from .models import (
+    TABLE_EVENTS,
+    TABLE_STATES,
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsShortTerm,
+)
 from .repack import repack_database
 from .util import session_scope
 
@@ -22,35 +32,78 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# The time column each partitioned table can be partitioned by
+PARTITION_COLUMNS = {TABLE_STATES: "last_updated", TABLE_EVENTS: "time_fired"}
+# The partition functions we can evaluate for purge_before
+PARTITION_FUNCTIONS = ("to_days", "unix_timestamp")
+
+
+@dataclass
+class PurgeProgress:
+    """Progress of the running or the last purge."""
+
+    purge_before: datetime
+    started: datetime
+    batch_size: int = MAX_ROWS_TO_PURGE
+    batches: int = 0
+    events_deleted: int = 0
+    states_deleted: int = 0
+    partitions_dropped: int = 0
+    purged_until: datetime | None = None
+    finished: datetime | None = None
+    unused_attributes: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation of the progress."""
+        progress = asdict(self)
+        del progress["unused_attributes"]
+        for key in ("purge_before", "started", "purged_until", "finished"):
+            if progress[key] is not None:
+                progress[key] = progress[key].isoformat()
+        return progress
+
 
 def purge_old_data(
     instance: Recorder, purge_days: int, repack: bool, apply_filter: bool = False
 ) -> bool:
     """Purge events and states older than purge_days ago.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Each call deletes one batch of the oldest rows, the batch size follows
+    how long the previous batches blocked the recorder.
     """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    progress = instance.purge_progress
+    if progress is None or progress.finished is not None:
+        progress = instance.purge_progress = PurgeProgress(
+            purge_before,
+            dt_util.utcnow(),
+            MAX_ROWS_TO_PURGE if progress is None else progress.batch_size,
+        )
+    progress.purge_before = purge_before
+
     try:
+        start = time.monotonic()
+        with session_scope(session=instance.get_session()) as session:  # type: ignore
+            if not progress.batches and instance.engine.dialect.name == "mysql":
+                _drop_old_partitions(session, progress)
+            progress.batches += 1
+            purged = _purge_batch(instance, session, progress)
+        _adjust_batch_size(progress, time.monotonic() - start, purged)
+        if purged:
+            # If states or events purging isn't processing the purge_before yet,
+            # return false, as we are not done yet.
+            _LOGGER.debug("Purging hasn't fully completed yet")
+            return False
         with session_scope(session=instance.get_session()) as session:  # type: ignore
-            # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            event_ids = _select_event_ids_to_purge(session, purge_before)
-            state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
-            if state_ids:
-                _purge_state_ids(session, state_ids)
-            if event_ids:
-                _purge_event_ids(session, event_ids)
-                # If states or events purging isn't processing the purge_before yet,
-                # return false, as we are not done yet.
-                _LOGGER.debug("Purging hasn't fully completed yet")
-                return False
             if apply_filter and _purge_filtered_data(instance, session) is False:
                 _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
                 return False
+            # The hourly statistics are kept, they are the long-term history
+            _purge_short_term_statistics(session, purge_before)
             _purge_old_recorder_runs(instance, session, purge_before)
         if repack:
             repack_database(instance)
@@ -65,44 +118,142 @@ def purge_old_data(
             1213,
         ):
             _LOGGER.info("%s; purge not completed, retrying", err.orig.args[1])
+            progress.batch_size = max(MIN_ROWS_TO_PURGE, progress.batch_size // 2)
             time.sleep(instance.db_retry_wait)
             return False
 
         _LOGGER.warning("Error purging history: %s", err)
 
+    progress.finished = dt_util.utcnow()
     return True
 
 
-def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
-    """Return a list of event ids to purge."""
+def _purge_batch(instance: Recorder, session: Session, progress: PurgeProgress) -> int:
+    """Purge the oldest batch of states and events, return the rows deleted."""
+    if progress.unused_attributes:
+        attributes_ids = _select_unused_attributes_ids(session, progress.batch_size)
+        if attributes_ids:
+            _purge_attributes_ids(instance, session, attributes_ids)
+            return len(attributes_ids)
+        progress.unused_attributes = False
+
+    state_ids = _select_state_ids_to_purge(
+        session, progress.purge_before, progress.batch_size
+    )
+    event_ids = _select_event_ids_to_purge(session, progress)
+    if state_ids:
+        _purge_state_ids(instance, session, state_ids)
+        progress.states_deleted += len(state_ids)
+    if event_ids:
+        _purge_event_ids(session, event_ids)
+        progress.events_deleted += len(event_ids)
+    return len(state_ids) + len(event_ids)
+
+
+def _adjust_batch_size(progress: PurgeProgress, elapsed: float, purged: int) -> None:
+    """Size the next batch so it blocks the recorder for PURGE_BATCH_LATENCY."""
+    if elapsed > PURGE_BATCH_LATENCY:
+        progress.batch_size = max(MIN_ROWS_TO_PURGE, progress.batch_size // 2)
+    elif elapsed < PURGE_BATCH_LATENCY / 4 and purged >= progress.batch_size:
+        progress.batch_size = min(MAX_ROWS_TO_PURGE, progress.batch_size * 2)
+
+
+def _select_event_ids_to_purge(session: Session, progress: PurgeProgress) -> list[int]:
+    """Return the ids of the oldest events to purge."""
     events = (
-        session.query(Events.event_id)
-        .filter(Events.time_fired < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
+        session.query(Events.event_id, Events.time_fired)
+        .filter(Events.time_fired < progress.purge_before)
+        .order_by(Events.time_fired)
+        .limit(progress.batch_size)
         .all()
     )
     _LOGGER.debug("Selected %s event ids to remove", len(events))
+    if events:
+        progress.purged_until = dt_util.as_utc(events[-1].time_fired)
     return [event.event_id for event in events]
 
 
 def _select_state_ids_to_purge(
-    session: Session, purge_before: datetime, event_ids: list[int]
+    session: Session, purge_before: datetime, batch_size: int
 ) -> list[int]:
-    """Return a list of state ids to purge."""
-    if not event_ids:
-        return []
+    """Return the ids of the oldest states to purge."""
     states = (
         session.query(States.state_id)
         .filter(States.last_updated < purge_before)
-        .filter(States.event_id.in_(event_ids))
+        .order_by(States.last_updated)
+        .limit(batch_size)
         .all()
     )
     _LOGGER.debug("Selected %s state ids to remove", len(states))
     return [state.state_id for state in states]
 
 
-def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
+def _drop_old_partitions(session: Session, progress: PurgeProgress) -> None:
+    """Drop the range partitions that only hold rows older than purge_before.
+
+    Only tables partitioned by the time column, for example
+    PARTITION BY RANGE (TO_DAYS(time_fired)), are considered. The newest
+    partition is always kept.
+    """
+    for table, column in PARTITION_COLUMNS.items():
+        partitions = session.execute(
+            text(
+                "SELECT PARTITION_NAME, PARTITION_METHOD, PARTITION_EXPRESSION, "
+                "PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+                "AND PARTITION_NAME IS NOT NULL ORDER BY PARTITION_ORDINAL_POSITION"
+            ),
+            {"table": table},
+        ).fetchall()
+        expired = []
+        for name, method, expression, description in partitions[:-1]:
+            expression = expression.replace("`", "").replace(" ", "").lower()
+            if description == "MAXVALUE":
+                break
+            if method == "RANGE COLUMNS" and expression == column:
+                bound = dt_util.parse_datetime(description.strip("'"))
+                if bound is None:
+                    break
+                expired_before = progress.purge_before.replace(tzinfo=None)
+            elif method == "RANGE" and expression in (
+                f"{function}({column})" for function in PARTITION_FUNCTIONS
+            ):
+                bound = int(description)
+                expired_before = session.execute(
+                    text(f"SELECT {expression.split('(')[0]}(:purge_before)"),
+                    {"purge_before": progress.purge_before.replace(tzinfo=None)},
+                ).scalar()
+            else:
+                break
+            if bound > expired_before:
+                break
+            expired.append(name)
+
+        if not expired:
+            continue
+        session.execute(
+            text(
+                f"ALTER TABLE {table} DROP PARTITION "
+                + ", ".join(f"`{name}`" for name in expired)
+            )
+        )
+        _LOGGER.debug("Dropped %s partitions of %s", len(expired), table)
+        progress.partitions_dropped += len(expired)
+        if table == TABLE_STATES:
+            progress.unused_attributes = True
+
+
+def _purge_state_ids(
+    instance: Recorder, session: Session, state_ids: list[int]
+) -> None:
     """Disconnect states and delete by state id."""
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id)).filter(
+            States.state_id.in_(state_ids)
+        )
+        if attributes_id is not None
+    }
 
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
@@ -122,6 +273,46 @@ def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
     )
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
+    if attributes_ids:
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the shared attributes no remaining state refers to."""
+    unused_attributes_ids = attributes_ids - {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id)).filter(
+            States.attributes_id.in_(attributes_ids)
+        )
+    }
+    if unused_attributes_ids:
+        _purge_attributes_ids(instance, session, unused_attributes_ids)
+
+
+def _select_unused_attributes_ids(session: Session, batch_size: int) -> set[int]:
+    """Return the ids of shared attributes no state refers to."""
+    return {
+        attributes_id
+        for (attributes_id,) in session.query(StateAttributes.attributes_id)
+        .filter(~exists().where(States.attributes_id == StateAttributes.attributes_id))
+        .limit(batch_size)
+    }
+
+
+def _purge_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete shared attributes by attributes id."""
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    instance.evict_state_attributes_ids(attributes_ids)
+    _LOGGER.debug("Deleted %s shared attributes", deleted_rows)
+
 
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     """Delete by event id."""
@@ -133,6 +324,16 @@ def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
 
+def _purge_short_term_statistics(session: Session, purge_before: datetime) -> None:
+    """Remove the short-term statistics of the periods before purge_before."""
+    deleted_rows = (
+        session.query(StatisticsShortTerm)
+        .filter(StatisticsShortTerm.start < purge_before)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s short-term statistics", deleted_rows)
+
+
 def _purge_old_recorder_runs(
     instance: Recorder, session: Session, purge_before: datetime
 ) -> None:
@@ -158,7 +359,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if not instance.entity_filter(entity_id)
     ]
     if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(session, excluded_entity_ids)
+        _purge_filtered_states(instance, session, excluded_entity_ids)
         return False
 
     # Check if excluded event_types are in database
@@ -168,13 +369,15 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if event_type in instance.exclude_t
     ]
     if len(excluded_event_types) > 0:
-        _purge_filtered_events(session, excluded_event_types)
+        _purge_filtered_events(instance, session, excluded_event_types)
         return False
 
     return True
 
 
-def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) -> None:
+def _purge_filtered_states(
+    instance: Recorder, session: Session, excluded_entity_ids: list[str]
+) -> None:
     """Remove filtered states and linked events."""
     state_ids: list[int]
     event_ids: list[int | None]
@@ -190,11 +393,13 @@ def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) ->
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
-    _purge_state_ids(session, state_ids)
+    _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
 
 
-def _purge_filtered_events(session: Session, excluded_event_types: list[str]) -> None:
+def _purge_filtered_events(
+    instance: Recorder, session: Session, excluded_event_types: list[str]
+) -> None:
     """Remove filtered events and linked states."""
     events: list[Events] = (
         session.query(Events.event_id)
@@ -210,5 +415,5 @@ def _purge_filtered_events(session: Session, excluded_event_types: list[str]) ->
         session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
     )
     state_ids: list[int] = [state.state_id for state in states]
-    _purge_state_ids(session, state_ids)
+    _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)
@@ -0,0 +1,125 @@
+"""Long-term statistics compiled from the recorded states."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from itertools import groupby
+import logging
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import func
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+from .models import (
+    Statistics,
+    StatisticsShortTerm,
+    process_timestamp,
+    process_timestamp_to_utc_isoformat,
+)
+from .util import execute, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+PERIOD_5MINUTE = "5minute"
+PERIOD_HOUR = "hour"
+
+STATISTICS_TABLES = {
+    PERIOD_5MINUTE: StatisticsShortTerm,
+    PERIOD_HOUR: Statistics,
+}
+
+PERIOD_LENGTHS = {
+    PERIOD_5MINUTE: timedelta(minutes=5),
+    PERIOD_HOUR: timedelta(hours=1),
+}
+
+STATISTIC_KEYS = ("mean", "min", "max", "state", "sum")
+
+
+def period_start(point_in_time: datetime, period: str) -> datetime:
+    """Return the start of the period point_in_time falls in."""
+    point_in_time = dt_util.as_utc(point_in_time).replace(second=0, microsecond=0)
+    if period == PERIOD_HOUR:
+        return point_in_time.replace(minute=0)
+    return point_in_time.replace(minute=point_in_time.minute - point_in_time.minute % 5)
+
+
+def get_last_compiled_start(session: Session, period: str) -> datetime | None:
+    """Return the start of the last period statistics were compiled for."""
+    table = STATISTICS_TABLES[period]
+    return process_timestamp(session.query(func.max(table.start)).scalar())
+
+
+def compile_statistics(instance: Recorder, start: datetime, period: str) -> None:
+    """Compile the statistics of the recorder platforms for a closed period.
+
+    Compiling a period again is a no-op, the rows of a period are written
+    all at once.
+    """
+    start = dt_util.as_utc(start)
+    end = start + PERIOD_LENGTHS[period]
+    table = STATISTICS_TABLES[period]
+    platforms = list(instance.hass.data.get(DOMAIN, {}).values())
+
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        if session.query(table.id).filter(table.start == start).first():
+            _LOGGER.debug("Statistics for %s-%s already compiled", start, end)
+            return
+
+        _LOGGER.debug("Compiling %s statistics for %s-%s", period, start, end)
+        for platform in platforms:
+            if not hasattr(platform, "compile_statistics"):
+                continue
+            platform_stats = platform.compile_statistics(
+                instance.hass, session, start, end
+            )
+            for statistic_id, stats in platform_stats.items():
+                session.add(table.from_stats(statistic_id, start, stats))
+
+
+def statistics_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    statistic_ids: list[str] | None = None,
+    period: str = PERIOD_HOUR,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the statistics of the periods starting between start_time and end_time."""
+    table = STATISTICS_TABLES[period]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        query = session.query(
+            table.statistic_id,
+            table.start,
+            *(getattr(table, key) for key in STATISTIC_KEYS),
+        ).filter(table.start >= start_time)
+
+        if end_time is not None:
+            query = query.filter(table.start < end_time)
+
+        if statistic_ids is not None:
+            query = query.filter(table.statistic_id.in_(statistic_ids))
+
+        query = query.order_by(table.statistic_id, table.start)
+        return _sorted_statistics_to_dict(execute(query))
+
+
+def _sorted_statistics_to_dict(stats) -> dict[str, list[dict[str, Any]]]:
+    """Convert statistics rows sorted by statistic_id and start to a dict."""
+    return {
+        statistic_id: [
+            {
+                "statistic_id": statistic_id,
+                "start": process_timestamp_to_utc_isoformat(row.start),
+                **{key: getattr(row, key) for key in STATISTIC_KEYS},
+            }
+            for row in rows
+        ]
+        for statistic_id, rows in groupby(stats, lambda row: row.statistic_id)
+    }
@@ -36,11 +36,22 @@ MAX_RESTART_TIME = timedelta(minutes=10)
 
 @contextmanager
 def session_scope(
-    *, hass: HomeAssistantType | None = None, session: Session | None = None
+    *,
+    hass: HomeAssistantType | None = None,
+    session: Session | None = None,
+    read_only: bool = False,
 ) -> Generator[Session, None, None]:
-    """Provide a transactional scope around a series of operations."""
+    """Provide a transactional scope around a series of operations.
+
+    Pass read_only for queries, they use the connection pool that is kept
+    apart from the recorder writes.
+    """
     if session is None and hass is not None:
-        session = hass.data[DATA_INSTANCE].get_session()
+        instance = hass.data[DATA_INSTANCE]
+        if read_only:
+            session = instance.get_read_session()
+        else:
+            session = instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
@@ -0,0 +1,26 @@
+"""The Recorder websocket API."""
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_INSTANCE
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the recorder websocket API."""
+    websocket_api.async_register_command(hass, ws_purge_progress)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "recorder/purge_progress"})
+@callback
+def ws_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the progress of the running or the last purge."""
+    progress = hass.data[DATA_INSTANCE].purge_progress
+    connection.send_result(msg["id"], progress and progress.as_dict())
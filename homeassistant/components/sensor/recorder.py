@@ -0,0 +1,172 @@
+"""Statistics helper for sensor."""
+from __future__ import annotations
+
+from datetime import datetime
+import json
+import math
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm.session import Session
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.models import (
+    StateAttributes,
+    States,
+    process_timestamp,
+)
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    DEVICE_CLASS_ENERGY,
+)
+from homeassistant.core import HomeAssistant
+
+from . import DOMAIN
+
+# Sensors of these device classes are meters, the statistics
+# sum up how much they increased during the period
+METER_DEVICE_CLASSES = (DEVICE_CLASS_ENERGY,)
+
+
+def _parse_float(state: str | None) -> float | None:
+    """Return the state as a finite float, or None if it is not numeric."""
+    try:
+        value = float(state)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _get_period_states(
+    hass: HomeAssistant, session: Session, start: datetime, end: datetime
+) -> dict[str, list[Any]]:
+    """Return the sensor states of the period by entity.
+
+    The states are preceded by the state the sensor had when the period
+    started.
+    """
+    query = (
+        session.query(
+            States.state_id,
+            States.entity_id,
+            States.state,
+            States.last_updated,
+            States.attributes,
+            StateAttributes.shared_attrs,
+        )
+        .outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+        .filter(States.domain == DOMAIN)
+    )
+
+    period_states: dict[str, list[Any]] = {}
+
+    run = recorder.run_information_from_instance(
+        hass, start
+    ) or recorder.run_information_with_session(session, start)
+    if run is not None:
+        most_recent_state_ids = (
+            session.query(func.max(States.state_id).label("max_state_id"))
+            .filter(States.domain == DOMAIN)
+            .filter(States.last_updated >= run.start)
+            .filter(States.last_updated < start)
+            .group_by(States.entity_id)
+            .subquery()
+        )
+        for row in query.join(
+            most_recent_state_ids,
+            States.state_id == most_recent_state_ids.c.max_state_id,
+        ):
+            period_states[row.entity_id] = [row]
+
+    for row in (
+        query.filter(States.last_updated >= start)
+        .filter(States.last_updated < end)
+        .order_by(States.last_updated, States.state_id)
+    ):
+        period_states.setdefault(row.entity_id, []).append(row)
+
+    return period_states
+
+
+def _compile_measurement(
+    values: list[tuple[datetime, float | None]], end: datetime
+) -> dict[str, float] | None:
+    """Return the time weighted mean, min, max and last value."""
+    duration = 0.0
+    weighted_sum = 0.0
+    minimum = maximum = last = None
+    for (timestamp, value), (next_timestamp, _) in zip(
+        values, [*values[1:], (end, None)]
+    ):
+        seconds = (next_timestamp - timestamp).total_seconds()
+        if value is None or not seconds:
+            continue
+        duration += seconds
+        weighted_sum += value * seconds
+        minimum = value if minimum is None else min(minimum, value)
+        maximum = value if maximum is None else max(maximum, value)
+        last = value
+
+    if last is None or not duration:
+        return None
+
+    return {
+        "mean": weighted_sum / duration,
+        "min": minimum,
+        "max": maximum,
+        "state": last,
+    }
+
+
+def _compile_meter(
+    values: list[tuple[datetime, float | None]]
+) -> dict[str, float] | None:
+    """Return the last value and how much the meter increased."""
+    increase = 0.0
+    last = None
+    for _, value in values:
+        if value is None:
+            continue
+        if last is not None:
+            # A decreasing meter has been reset
+            increase += value - last if value >= last else value
+        last = value
+
+    if last is None:
+        return None
+
+    return {"state": last, "sum": increase}
+
+
+def compile_statistics(
+    hass: HomeAssistant, session: Session, start: datetime, end: datetime
+) -> dict[str, dict[str, float]]:
+    """Compile the statistics of the numeric sensors for a period.
+
+    Sensors are numeric when they have a unit of measurement, states that
+    are not a number are left out.
+    """
+    result = {}
+
+    for entity_id, rows in _get_period_states(hass, session, start, end).items():
+        shared_attrs = rows[-1].shared_attrs or rows[-1].attributes
+        attributes = json.loads(shared_attrs) if shared_attrs else {}
+        if ATTR_UNIT_OF_MEASUREMENT not in attributes:
+            continue
+
+        values = [
+            (max(process_timestamp(row.last_updated), start), _parse_float(row.state))
+            for row in rows
+        ]
+        if attributes.get(ATTR_DEVICE_CLASS) in METER_DEVICE_CLASSES:
+            stats = _compile_meter(values)
+        else:
+            stats = _compile_measurement(values, end)
+
+        if stats is not None:
+            result[entity_id] = stats
+
+    return result
@@ -1,8 +1,11 @@
 """Support for statistics for sensor values."""
+from bisect import bisect_left, insort
 from collections import deque
+from itertools import count as counter
 import logging
-import statistics
+import math
 
+from sqlalchemy.orm import joinedload
 import voluptuous as vol
 
 from homeassistant.components.recorder.models import States
@@ -53,6 +56,10 @@ DEFAULT_SIZE = 20
 DEFAULT_PRECISION = 2
 ICON = "mdi:calculator"
 
+# The sums are recomputed when a dropped value is this many times larger
+# than the values left in the queue
+RECOMPUTE_MAGNITUDE = 1000
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -96,7 +103,10 @@ class StatisticsSensor(SensorEntity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
+        if self.is_binary:
+            self.states = deque(maxlen=self._sampling_size)
+        else:
+            self.states = RollingStatistics(self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
 
         self.count = 0
@@ -152,7 +162,10 @@ class StatisticsSensor(SensorEntity):
             if self.is_binary:
                 self.states.append(new_state.state)
             else:
-                self.states.append(float(new_state.state))
+                value = float(new_state.state)
+                if not math.isfinite(value):
+                    raise ValueError
+                self.states.append(value)
 
             self.ages.append(new_state.last_updated)
         except ValueError:
@@ -247,24 +260,24 @@ class StatisticsSensor(SensorEntity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count >= 1:  # require only one data point
+                self.mean = round(self.states.mean, self._precision)
+                self.median = round(self.states.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count >= 2:  # require at least two data points
+                self.stdev = round(self.states.stdev, self._precision)
+                self.variance = round(self.states.variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(self.states.total, self._precision)
+                self.min = round(self.states.min, self._precision)
+                self.max = round(self.states.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -324,9 +337,11 @@ class StatisticsSensor(SensorEntity):
 
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
-        with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._entity_id.lower()
+        with session_scope(hass=self.hass, read_only=True) as session:
+            query = (
+                session.query(States)
+                .options(joinedload(States.state_attributes))
+                .filter(States.entity_id == self._entity_id.lower())
             )
 
             if self._max_age is not None:
@@ -351,3 +366,139 @@ class StatisticsSensor(SensorEntity):
         self.async_schedule_update_ha_state(True)
 
         _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+
+class RollingStatistics:
+    """A bounded queue of numbers with incrementally updated statistics.
+
+    Values are appended on the right and dropped on the left, either when
+    the queue is full or explicitly. The mean and variance are kept with
+    Welford's algorithm, the minimum and maximum with monotonic queues and
+    the median with a sorted list, so no statistic requires a pass over all
+    values. The sums are recomputed from the values once the queue turned
+    over, or when a value that dominates them is dropped, so rounding
+    errors do not pile up.
+    """
+
+    def __init__(self, maxlen):
+        """Initialize the queue."""
+        self.maxlen = maxlen
+        self._values = deque()
+        self._sorted = []
+        # Monotonic queues of (sequence, value) of the minimum and maximum
+        self._min = deque()
+        self._max = deque()
+        self._sequence = counter()
+        self._first_sequence = 0
+        self._dropped = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.total = 0.0
+
+    def __len__(self):
+        """Return the number of values."""
+        return len(self._values)
+
+    def __iter__(self):
+        """Iterate over the values from oldest to newest."""
+        return iter(self._values)
+
+    def __getitem__(self, index):
+        """Return a value by position."""
+        return self._values[index]
+
+    def append(self, value):
+        """Add a value, dropping the oldest value if the queue is full."""
+        if len(self._values) == self.maxlen:
+            self.popleft()
+
+        sequence = next(self._sequence)
+        self._values.append(value)
+        insort(self._sorted, value)
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((sequence, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((sequence, value))
+
+        self.total += value
+        delta = value - self._mean
+        self._mean += delta / len(self._values)
+        self._m2 += delta * (value - self._mean)
+
+    def popleft(self):
+        """Remove and return the oldest value."""
+        value = self._values.popleft()
+        sequence = self._first_sequence
+        self._first_sequence += 1
+        del self._sorted[bisect_left(self._sorted, value)]
+
+        if self._min[0][0] == sequence:
+            self._min.popleft()
+        if self._max[0][0] == sequence:
+            self._max.popleft()
+
+        if not self._values:
+            # Start over to not carry rounding errors
+            self._mean = self._m2 = self.total = 0.0
+            self._dropped = 0
+            return value
+
+        self._dropped += 1
+        if (
+            self._dropped >= len(self._values)
+            or not math.isfinite(value)
+            or abs(value) > RECOMPUTE_MAGNITUDE * max(abs(self.min), abs(self.max))
+        ):
+            self._recompute()
+            return value
+
+        self.total -= value
+        mean = self._mean
+        self._mean -= (value - mean) / len(self._values)
+        self._m2 = max(self._m2 - (value - mean) * (value - self._mean), 0.0)
+        return value
+
+    def _recompute(self):
+        """Compute the sums from the values."""
+        values = self._values
+        self.total = math.fsum(values)
+        self._mean = self.total / len(values)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in values)
+        self._dropped = 0
+
+    @property
+    def mean(self):
+        """Return the mean of the values."""
+        return self._mean
+
+    @property
+    def median(self):
+        """Return the median of the values."""
+        values = self._sorted
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+
+    @property
+    def variance(self):
+        """Return the sample variance of the values."""
+        return self._m2 / (len(self._values) - 1)
+
+    @property
+    def stdev(self):
+        """Return the sample standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self):
+        """Return the smallest value."""
+        return self._min[0][1]
+
+    @property
+    def max(self):
+        """Return the largest value."""
+        return self._max[0][1]
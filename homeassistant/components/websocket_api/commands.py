@@ -1,5 +1,6 @@
 """Commands part of Websocket API."""
 import asyncio
+import datetime
 import json
 
 import voluptuous as vol
@@ -20,7 +21,11 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import TrackTemplate, async_track_template_result
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.loader import (
+    DATA_IMPORT_TIME,
+    IntegrationNotFound,
+    async_get_integration,
+)
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 
 from . import const, decorators, messages
@@ -43,6 +48,7 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -101,6 +107,154 @@ def handle_subscribe_events(hass, connection, msg):
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(hass, connection, msg):
+    """Handle subscribe entities command.
+
+    Sends the current states and then the changes of each entity,
+    coalesced into a single message per ENTITY_COALESCE_WINDOW.
+    """
+    subscription = EntitySubscription(
+        hass, connection, msg["id"], msg.get("entity_ids")
+    )
+    connection.subscriptions[msg["id"]] = subscription.async_subscribe()
+    connection.send_message(messages.result_message(msg["id"]))
+    subscription.async_send_states()
+
+
+class EntitySubscription:
+    """Send the coalesced state changes of entities to a subscriber.
+
+    The message is not built when the window ends but when the
+    connection writer gets to it. Changes that come in while the client
+    is slow to read are merged into the queued message instead of
+    filling the queue of the connection.
+    """
+
+    def __init__(self, hass, connection, msg_id, entity_ids):
+        """Initialize the subscription."""
+        self.hass = hass
+        self.connection = connection
+        self.msg_id = msg_id
+        self.entity_ids = entity_ids and set(entity_ids)
+        # The states as the subscriber knows them
+        self._sent_states = {}
+        self._changed_entity_ids = set()
+        self._scheduled = None
+
+    @callback
+    def async_subscribe(self):
+        """Listen for state changes."""
+        event_filter = None
+        if self.entity_ids is not None:
+
+            @callback
+            def event_filter(event):
+                """Filter the entities of the subscription."""
+                return event.data["entity_id"] in self.entity_ids
+
+        unsub = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, event_filter
+        )
+
+        @callback
+        def async_unsubscribe():
+            """Stop sending changes."""
+            unsub()
+            if self._scheduled:
+                self._scheduled.cancel()
+            # A message that is already queued will have nothing to send
+            self._changed_entity_ids.clear()
+
+        return async_unsubscribe
+
+    @callback
+    def async_send_states(self):
+        """Send the current states."""
+        if self.entity_ids is None:
+            states = self.hass.states.async_all()
+        else:
+            states = [
+                state
+                for state in map(self.hass.states.get, self.entity_ids)
+                if state is not None
+            ]
+
+        check_entity = self.connection.user.permissions.check_entity
+        added = {}
+        for state in states:
+            if check_entity(state.entity_id, POLICY_READ):
+                self._sent_states[state.entity_id] = state
+                added[state.entity_id] = messages.compressed_state_dict_add(state)
+
+        self.connection.send_message(
+            messages.event_message(self.msg_id, {messages.ENTITY_EVENT_ADD: added})
+        )
+
+    @callback
+    def _async_state_changed(self, event):
+        """Collect a changed entity."""
+        entity_id = event.data["entity_id"]
+        if not self.connection.user.permissions.check_entity(entity_id, POLICY_READ):
+            return
+
+        self._changed_entity_ids.add(entity_id)
+        if self._scheduled is None:
+            self._scheduled = self.hass.loop.call_later(
+                const.ENTITY_COALESCE_WINDOW, self._async_queue_changes
+            )
+
+    @callback
+    def _async_queue_changes(self):
+        """Queue the message, it is built when it gets written."""
+        self.connection.send_message(self._async_changes_message)
+
+    @callback
+    def _async_changes_message(self):
+        """Return the message with the changes since the last one or None."""
+        self._scheduled = None
+        changed_entity_ids = self._changed_entity_ids
+        self._changed_entity_ids = set()
+
+        sent_states = self._sent_states
+        added = {}
+        changed = {}
+        removed = []
+        for entity_id in changed_entity_ids:
+            old_state = sent_states.get(entity_id)
+            new_state = self.hass.states.get(entity_id)
+            if old_state is new_state:
+                continue
+            if new_state is None:
+                del sent_states[entity_id]
+                removed.append(entity_id)
+                continue
+            sent_states[entity_id] = new_state
+            if old_state is None:
+                added[entity_id] = messages.compressed_state_dict_add(new_state)
+                continue
+            diff = messages.compressed_state_diff(old_state, new_state)
+            if diff is not None:
+                changed[entity_id] = diff
+
+        event = {}
+        if added:
+            event[messages.ENTITY_EVENT_ADD] = added
+        if changed:
+            event[messages.ENTITY_EVENT_CHANGE] = changed
+        if removed:
+            event[messages.ENTITY_EVENT_REMOVE] = removed
+        if not event:
+            return None
+        return messages.message_to_json(messages.event_message(self.msg_id, event))
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -218,7 +372,14 @@ def handle_get_states(hass, connection, msg):
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    try:
+        states_json = ", ".join(state.as_json() for state in states)
+    except (ValueError, TypeError):
+        # Let the message serialization log where the bad data is
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(messages.result_message_json(msg["id"], f"[{states_json}]"))
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -266,10 +427,17 @@ async def handle_manifest_get(hass, connection, msg):
 @decorators.async_response
 async def handle_integration_setup_info(hass, connection, msg):
     """Handle integrations command."""
+    import_time = hass.data.get(DATA_IMPORT_TIME, {})
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
+            {
+                "domain": integration,
+                "seconds": timedelta.total_seconds(),
+                "import_seconds": import_time.get(
+                    integration, datetime.timedelta()
+                ).total_seconds(),
+            }
             for integration, timedelta in hass.data[DATA_SETUP_TIME].items()
         ],
     )
@@ -19,6 +19,8 @@ URL = "/api/websocket"
 PENDING_MSG_PEAK = 512
 PENDING_MSG_PEAK_TIME = 5
 MAX_PENDING_MSG = 2048
+# Seconds the changes of subscribe_entities are collected before sending
+ENTITY_COALESCE_WINDOW = 0.05
 
 ERR_ID_REUSE = "id_reuse"
 ERR_INVALID_FORMAT = "invalid_format"
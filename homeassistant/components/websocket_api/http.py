@@ -74,6 +74,12 @@ class WebSocketHandler:
                 if message is None:
                     break
 
+                if callable(message):
+                    # Built as late as possible, see EntitySubscription
+                    message = message()
+                    if message is None:
+                        continue
+
                 if not isinstance(message, str):
                     message = message_to_json(message)
 
@@ -90,6 +96,9 @@ class WebSocketHandler:
     def _send_message(self, message):
         """Send a message to the client.
 
+        The message can be a callable that returns the message or None
+        when the writer gets to it.
+
         Closes connection if the client is not reading the messages.
 
         Async friendly.
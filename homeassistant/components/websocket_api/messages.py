@@ -7,8 +7,10 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -29,15 +31,35 @@ MINIMAL_MESSAGE_SCHEMA = vol.Schema(
 # Base schema to extend by message handlers
 BASE_COMMAND_MESSAGE_SCHEMA = vol.Schema({vol.Required("id"): cv.positive_int})
 
+_json_encode = JSONEncoder(allow_nan=False).encode
+
 IDEN_TEMPLATE = "__IDEN__"
 IDEN_JSON_TEMPLATE = '"__IDEN__"'
 
+# Keys of the entity changes sent to subscribe_entities subscribers
+ENTITY_EVENT_ADD = "a"
+ENTITY_EVENT_REMOVE = "r"
+ENTITY_EVENT_CHANGE = "c"
+COMPRESSED_STATE_STATE = "s"
+COMPRESSED_STATE_ATTRIBUTES = "a"
+COMPRESSED_STATE_CONTEXT = "c"
+COMPRESSED_STATE_LAST_CHANGED = "lc"
+COMPRESSED_STATE_LAST_UPDATED = "lu"
+
 
 def result_message(iden: int, result: Any = None) -> dict:
     """Return a success result message."""
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def result_message_json(iden: int, result_json: str) -> str:
+    """Return a success result message with a result already serialized to json."""
+    return (
+        f'{{"id": {iden}, "type": "{const.TYPE_RESULT}", '
+        f'"success": true, "result": {result_json}}}'
+    )
+
+
 def error_message(iden: int, code: str, message: str) -> dict:
     """Return an error result message."""
     return {
@@ -72,9 +94,95 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    if event.event_type == EVENT_STATE_CHANGED:
+        try:
+            return (
+                f'{{"id": {IDEN_JSON_TEMPLATE}, "type": "event", '
+                f'"event": {_state_changed_event_to_json(event)}}}'
+            )
+        except (ValueError, TypeError):
+            # Fall through to log where the bad data is
+            pass
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def _state_changed_event_to_json(event: Event) -> str:
+    """Serialize a state changed event to json.
+
+    The states reuse their cached json, the new state of an event
+    is the old state of the next event of the entity.
+    """
+    event_dict = event.as_dict()
+    data = event_dict.pop("data")
+    data_json = _json_encode(
+        {key: value for key, value in data.items() if not isinstance(value, State)}
+    )
+    for key, value in data.items():
+        if isinstance(value, State):
+            data_json = _json_add_key(data_json, key, value.as_json())
+    return _json_add_key(_json_encode(event_dict), "data", data_json)
+
+
+def _json_add_key(object_json: str, key: str, value_json: str) -> str:
+    """Add a key with an already serialized value to the end of a JSON object."""
+    separator = "" if object_json == "{}" else ", "
+    return f"{object_json[:-1]}{separator}{_json_encode(key)}: {value_json}}}"
+
+
+def compressed_state_dict_add(state: State) -> dict:
+    """Return the compressed format of a state new to the subscriber.
+
+    last_updated is left out when it equals last_changed.
+    """
+    compressed_state = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: dict(state.attributes),
+        COMPRESSED_STATE_CONTEXT: state.context.id,
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_updated != state.last_changed:
+        compressed_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed_state
+
+
+def compressed_state_diff(old_state: State, new_state: State) -> dict | None:
+    """Return the changes between two states of an entity.
+
+    Changed values are under "+", removed attributes under "-".
+    Returns None when nothing the subscriber sees has changed.
+    """
+    additions: dict[str, Any] = {}
+    diff: dict[str, Any] = {"+": additions}
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    if old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context.id != new_state.context.id:
+        additions[COMPRESSED_STATE_CONTEXT] = new_state.context.id
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    if old_attributes != new_attributes:
+        changed_attributes = {
+            key: value
+            for key, value in new_attributes.items()
+            if key not in old_attributes or old_attributes[key] != value
+        }
+        if changed_attributes:
+            additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+        removed_attributes = [
+            key for key in old_attributes if key not in new_attributes
+        ]
+        if removed_attributes:
+            diff["-"] = {COMPRESSED_STATE_ATTRIBUTES: removed_attributes}
+
+    if not additions and "-" not in diff:
+        return None
+    return diff
+
+
 def message_to_json(message: Any) -> str:
     """Serialize a websocket message to json."""
     try:
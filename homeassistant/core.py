@@ -10,6 +10,7 @@ import asyncio
 import datetime
 import enum
 import functools
+import json
 import logging
 import os
 import pathlib
@@ -38,6 +39,7 @@ import yarl
 from homeassistant import block_async_io, loader, util
 from homeassistant.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
     ATTR_SECONDS,
@@ -123,6 +125,20 @@ TIMEOUT_EVENT_START = 15
 _LOGGER = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Convert the objects found in state attributes to JSON types."""
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_json_dumps = json.JSONEncoder(allow_nan=False, default=_json_default).encode
+
+
 def split_entity_id(entity_id: str) -> list[str]:
     """Split a state entity ID into domain and object ID."""
     return entity_id.split(".", 1)
@@ -658,12 +674,19 @@ class Event:
         )
 
 
+def _entity_id_event_key(event_data: dict[str, Any]) -> Any:
+    """Return the entity_id an event is about."""
+    return event_data.get(ATTR_ENTITY_ID)
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        self._keyed_listeners: dict[str, dict[Any, list[HassJob]]] = {}
+        self._event_keys: dict[str, Callable[[dict[str, Any]], Any]] = {}
         self._hass = hass
 
     @callback
@@ -672,7 +695,22 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(self._listeners[key]) for key in self._listeners}
+        listeners = {key: len(self._listeners[key]) for key in self._listeners}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            # A listener for multiple keys is counted once
+            listeners[event_type] = listeners.get(event_type, 0) + len(
+                {job for jobs in keyed_listeners.values() for job in jobs}
+            )
+        return listeners
+
+    @callback
+    def async_keyed_listeners(self, event_type: str) -> dict[Any, int]:
+        """Return dictionary with the keys of an event and their listeners.
+
+        This method must be run in the event loop.
+        """
+        keyed_listeners = self._keyed_listeners.get(event_type, {})
+        return {key: len(jobs) for key, jobs in keyed_listeners.items()}
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -719,6 +757,14 @@ class EventBus:
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
+        keyed_listeners = self._keyed_listeners.get(event_type)
+        if keyed_listeners is not None:
+            key = self._event_keys[event_type](event.data)
+            if key in keyed_listeners:
+                self._hass.loop.call_soon(
+                    self._async_run_keyed_listeners, event_type, key, event
+                )
+
         if not listeners:
             return
 
@@ -784,6 +830,57 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        keys: Iterable[Any],
+        listener: Callable,
+        event_key: Callable[[dict[str, Any]], Any] = _entity_id_event_key,
+    ) -> CALLBACK_TYPE:
+        """Listen for the events of a specific type about some keys.
+
+        The key of a fired event is looked up by calling event_key with the
+        event data, by default its entity_id. Only the listeners of that key
+        are called, so firing costs the same regardless of how many
+        listeners are registered for other keys.
+
+        All keyed listeners of an event type must use the same event_key.
+
+        This method must be run in the event loop.
+        """
+        if self._event_keys.setdefault(event_type, event_key) is not event_key:
+            raise HomeAssistantError(
+                f"Event {event_type} is already keyed by {self._event_keys[event_type]}"
+            )
+
+        keys = list(keys)
+        job = HassJob(listener)
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+        for key in keys:
+            keyed_listeners.setdefault(key, []).append(job)
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(event_type, keys, job)
+
+        return remove_listener
+
+    @callback
+    def _async_run_keyed_listeners(
+        self, event_type: str, key: Any, event: Event
+    ) -> None:
+        """Run the listeners registered for the key of an event."""
+        jobs = self._keyed_listeners.get(event_type, {}).get(key)
+        if not jobs:
+            return
+
+        for job in jobs[:]:
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while processing %s for %s", event, key)
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None]
     ) -> CALLBACK_TYPE:
@@ -858,6 +955,32 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: str,
+        keys: list[Any],
+        job: HassJob,
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        keyed_listeners = self._keyed_listeners.get(event_type, {})
+        try:
+            for key in keys:
+                keyed_listeners[key].remove(job)
+
+                # delete key list if empty
+                if not keyed_listeners[key]:
+                    keyed_listeners.pop(key)
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown job listener %s", job)
+
+        if not keyed_listeners:
+            self._keyed_listeners.pop(event_type, None)
+            self._event_keys.pop(event_type, None)
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -882,6 +1005,8 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_json",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -917,6 +1042,8 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_json: str | None = None
+        self._attributes_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -949,6 +1076,38 @@ class State:
             }
         return self._as_dict
 
+    def as_json(self) -> str:
+        """Return the State serialized to JSON.
+
+        Async friendly.
+
+        The JSON is cached, consumers that send or store the same state
+        share one serialization. Raises ValueError if the attributes contain values
+        that are not valid JSON, like NaN.
+        """
+        if self._as_json is None:
+            # The attributes are serialized once, shared with attributes_json,
+            # and added as the last key of the object
+            state_dict = {
+                key: value
+                for key, value in self.as_dict().items()
+                if key != "attributes"
+            }
+            self._as_json = (
+                f'{_json_dumps(state_dict)[:-1]}, "attributes": '
+                f"{self.attributes_json()}}}"
+            )
+        return self._as_json
+
+    def attributes_json(self) -> str:
+        """Return the attributes serialized to JSON.
+
+        Async friendly.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = _json_dumps(dict(self.attributes))
+        return self._attributes_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
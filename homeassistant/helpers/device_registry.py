@@ -139,6 +139,8 @@ class DeviceRegistry:
     devices: dict[str, DeviceEntry]
     deleted_devices: dict[str, DeletedDeviceEntry]
     _devices_index: dict[str, dict[str, dict[tuple[str, str], str]]]
+    _area_index: dict[str, dict[str, None]]
+    _config_entry_index: dict[str, dict[str, None]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
@@ -204,6 +206,7 @@ class DeviceRegistry:
         else:
             devices_index = self._devices_index[REGISTERED_DEVICE]
             self.devices[device.id] = device
+            self._add_device_to_reverse_indexes(device)
 
         _add_device_to_index(devices_index, device)
 
@@ -215,6 +218,7 @@ class DeviceRegistry:
         else:
             devices_index = self._devices_index[REGISTERED_DEVICE]
             self.devices.pop(device.id)
+            self._remove_device_from_reverse_indexes(device)
 
         _remove_device_from_index(devices_index, device)
 
@@ -226,18 +230,50 @@ class DeviceRegistry:
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
 
+        # Only touch the reverse indexes that changed to keep their order
+        if old_device.area_id != new_device.area_id:
+            _remove_from_reverse_index(
+                self._area_index, old_device.area_id, old_device.id
+            )
+            _add_to_reverse_index(self._area_index, new_device.area_id, new_device.id)
+        for config_entry_id in old_device.config_entries - new_device.config_entries:
+            _remove_from_reverse_index(
+                self._config_entry_index, config_entry_id, old_device.id
+            )
+        for config_entry_id in new_device.config_entries - old_device.config_entries:
+            _add_to_reverse_index(
+                self._config_entry_index, config_entry_id, new_device.id
+            )
+
+    def _add_device_to_reverse_indexes(self, device: DeviceEntry) -> None:
+        """Add a device to the area and config entry indexes."""
+        _add_to_reverse_index(self._area_index, device.area_id, device.id)
+        for config_entry_id in device.config_entries:
+            _add_to_reverse_index(self._config_entry_index, config_entry_id, device.id)
+
+    def _remove_device_from_reverse_indexes(self, device: DeviceEntry) -> None:
+        """Remove a device from the area and config entry indexes."""
+        _remove_from_reverse_index(self._area_index, device.area_id, device.id)
+        for config_entry_id in device.config_entries:
+            _remove_from_reverse_index(
+                self._config_entry_index, config_entry_id, device.id
+            )
+
     def _clear_index(self) -> None:
         """Clear the index."""
         self._devices_index = {
             REGISTERED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
             DELETED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
         }
+        self._area_index = {}
+        self._config_entry_index = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._devices_index[REGISTERED_DEVICE], device)
+            self._add_device_to_reverse_indexes(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._devices_index[DELETED_DEVICE], deleted_device)
 
@@ -617,9 +653,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self._area_index.get(area_id, ())):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @callback
@@ -647,7 +682,9 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable=protected-access
+    device_ids = registry._area_index.get(area_id, ())
+    return [registry.devices[device_id] for device_id in device_ids]
 
 
 @callback
@@ -655,11 +692,9 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    # pylint: disable=protected-access
+    device_ids = registry._config_entry_index.get(config_entry_id, ())
+    return [registry.devices[device_id] for device_id in device_ids]
 
 
 @callback
@@ -807,3 +842,23 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index[IDX_CONNECTIONS]:
             del devices_index[IDX_CONNECTIONS][connection]
+
+
+def _add_to_reverse_index(
+    index: dict[str, dict[str, None]], key: str | None, device_id: str
+) -> None:
+    """Add a device to a reverse index."""
+    if key is not None:
+        index.setdefault(key, {})[device_id] = None
+
+
+def _remove_from_reverse_index(
+    index: dict[str, dict[str, None]], key: str | None, device_id: str
+) -> None:
+    """Remove a device from a reverse index."""
+    if key is None:
+        return
+    device_ids = index[key]
+    del device_ids[device_id]
+    if not device_ids:
+        del index[key]
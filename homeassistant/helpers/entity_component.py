@@ -89,6 +89,10 @@ class EntityComponent:
         ] = {domain: self._async_init_entity_platform(domain, None)}
         self.async_add_entities = self._platforms[domain].async_add_entities
         self.add_entities = self._platforms[domain].add_entities
+        # Entities of all platforms by entity id
+        self._entities: dict[str, entity.Entity] = self._platforms[
+            domain
+        ].domain_entities
 
         hass.data.setdefault(DATA_INSTANCES, {})[domain] = self
 
@@ -101,11 +105,7 @@ class EntityComponent:
 
     def get_entity(self, entity_id: str) -> entity.Entity | None:
         """Get an entity."""
-        for platform in self._platforms.values():
-            entity_obj = platform.entities.get(entity_id)
-            if entity_obj is not None:
-                return entity_obj
-        return None
+        return self._entities.get(entity_id)
 
     def setup(self, config: ConfigType) -> None:
         """Set up a full entity component.
@@ -210,7 +210,7 @@ class EntityComponent:
         async def handle_service(call: Callable) -> None:
             """Handle the service."""
             await self.hass.helpers.service.entity_service_call(
-                self._platforms.values(), func, call, required_features
+                self._entities, func, call, required_features
             )
 
         self.hass.services.async_register(self.domain, name, handle_service, schema)
@@ -150,6 +150,9 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_index: dict[str, dict[str, None]] = {}
+        self._area_index: dict[str, dict[str, None]] = {}
+        self._config_entry_index: dict[str, dict[str, None]] = {}
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -432,7 +435,6 @@ class EntityRegistry:
             if split_entity_id(new_entity_id)[0] != split_entity_id(entity_id)[0]:
                 raise ValueError("New entity ID should be same domain")
 
-            self.entities.pop(entity_id)
             entity_id = new_values["entity_id"] = new_entity_id
             old_values["entity_id"] = old.entity_id
 
@@ -451,9 +453,8 @@ class EntityRegistry:
         if not new_values:
             return old
 
-        self._remove_index(old)
         new = attr.evolve(old, **new_values)
-        self._register_entry(new)
+        self._update_entry(old, new)
 
         self.async_schedule_save()
 
@@ -543,26 +544,39 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._config_entry_index.get(config_entry, ())):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self._area_index.get(area_id, ())):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
         self._add_index(entry)
 
+    def _update_entry(self, old: RegistryEntry, new: RegistryEntry) -> None:
+        if old.entity_id != new.entity_id:
+            self._unregister_entry(old)
+            self._register_entry(new)
+            return
+
+        self.entities[new.entity_id] = new
+        if old.unique_id != new.unique_id:
+            del self._index[(old.domain, old.platform, old.unique_id)]
+            self._index[(new.domain, new.platform, new.unique_id)] = new.entity_id
+        # Only touch the reverse indexes that changed to keep their order
+        for index, old_key, new_key in self._reverse_indexes(old, new):
+            if old_key != new_key:
+                _remove_from_reverse_index(index, old_key, old.entity_id)
+                _add_to_reverse_index(index, new_key, new.entity_id)
+
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for index, key, _ in self._reverse_indexes(entry, entry):
+            _add_to_reverse_index(index, key, entry.entity_id)
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -570,13 +584,48 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for index, key, _ in self._reverse_indexes(entry, entry):
+            _remove_from_reverse_index(index, key, entry.entity_id)
+
+    def _reverse_indexes(
+        self, old: RegistryEntry, new: RegistryEntry
+    ) -> tuple[tuple[dict[str, dict[str, None]], str | None, str | None], ...]:
+        """Return the reverse indexes with the keys of two entries."""
+        return (
+            (self._device_index, old.device_id, new.device_id),
+            (self._area_index, old.area_id, new.area_id),
+            (self._config_entry_index, old.config_entry_id, new.config_entry_id),
+        )
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_index = {}
+        self._area_index = {}
+        self._config_entry_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
 
+def _add_to_reverse_index(
+    index: dict[str, dict[str, None]], key: str | None, entity_id: str
+) -> None:
+    """Add an entity to a reverse index."""
+    if key is not None:
+        index.setdefault(key, {})[entity_id] = None
+
+
+def _remove_from_reverse_index(
+    index: dict[str, dict[str, None]], key: str | None, entity_id: str
+) -> None:
+    """Remove an entity from a reverse index."""
+    if key is None:
+        return
+    entity_ids = index[key]
+    del entity_ids[entity_id]
+    if not entity_ids:
+        del index[key]
+
+
 @callback
 def async_get(hass: HomeAssistant) -> EntityRegistry:
     """Get entity registry."""
@@ -604,11 +653,11 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
+    # pylint: disable=protected-access
+    entity_ids = registry._device_index.get(device_id, ())
+    entries = (registry.entities[entity_id] for entity_id in entity_ids)
     return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        entry for entry in entries if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -617,7 +666,9 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    # pylint: disable=protected-access
+    entity_ids = registry._area_index.get(area_id, ())
+    return [registry.entities[entity_id] for entity_id in entity_ids]
 
 
 @callback
@@ -625,11 +676,9 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    # pylint: disable=protected-access
+    entity_ids = registry._config_entry_index.get(config_entry_id, ())
+    return [registry.entities[entity_id] for entity_id in entity_ids]
 
 
 @callback
@@ -6,6 +6,7 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
 import logging
 import time
 from typing import Any, Awaitable, Callable, Iterable, List, cast
@@ -41,17 +42,14 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
-
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
 TRACK_STATE_REMOVED_DOMAIN_CALLBACKS = "track_state_removed_domain_callbacks"
 TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 
-TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
-TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
+TRACK_POINT_IN_TIME_WHEEL = "track_point_in_time_wheel"
+TRACK_TIME_PATTERN_GROUPS = "track_time_pattern_groups"
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -239,64 +237,15 @@ def async_track_state_change_event(
     Unlike async_track_state_change, async_track_state_change_event
     passes the full event to the callback.
 
-    In order to avoid having to iterate a long list
-    of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    The listeners are registered with the event bus by entity_id, so
+    a state change only creates jobs for the listeners that care about
+    that entity instead of running a filter for every listener.
     """
     entity_ids = _async_string_to_lower_list(entity_ids)
     if not entity_ids:
         return _remove_empty_listener
 
-    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
-
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
-    job = HassJob(action)
-
-    for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            job,
-        )
-
-    return remove_listener
+    return hass.bus.async_listen_keyed(EVENT_STATE_CHANGED, entity_ids, action)
 
 
 @callback
@@ -339,56 +288,17 @@ def async_track_entity_registry_updated_event(
     if not entity_ids:
         return _remove_empty_listener
 
-    entity_callbacks = hass.data.setdefault(TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS, {})
-
-    if TRACK_ENTITY_REGISTRY_UPDATED_LISTENER not in hass.data:
-
-        @callback
-        def _async_entity_registry_updated_filter(event: Event) -> bool:
-            """Filter entity registry updates by entity_id."""
-            entity_id = event.data.get("old_entity_id", event.data["entity_id"])
-            return entity_id in entity_callbacks
-
-        @callback
-        def _async_entity_registry_updated_dispatcher(event: Event) -> None:
-            """Dispatch entity registry updates by entity_id."""
-            entity_id = event.data.get("old_entity_id", event.data["entity_id"])
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing entity registry update for %s",
-                        entity_id,
-                    )
-
-        hass.data[TRACK_ENTITY_REGISTRY_UPDATED_LISTENER] = hass.bus.async_listen(
-            EVENT_ENTITY_REGISTRY_UPDATED,
-            _async_entity_registry_updated_dispatcher,
-            event_filter=_async_entity_registry_updated_filter,
-        )
-
-    job = HassJob(action)
-
-    for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
+    return hass.bus.async_listen_keyed(
+        EVENT_ENTITY_REGISTRY_UPDATED,
+        entity_ids,
+        action,
+        event_key=_entity_registry_updated_event_key,
+    )
 
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS,
-            TRACK_ENTITY_REGISTRY_UPDATED_LISTENER,
-            entity_ids,
-            job,
-        )
 
-    return remove_listener
+def _entity_registry_updated_event_key(event_data: dict[str, Any]) -> Any:
+    """Return the entity_id an entity registry update was made for."""
+    return event_data.get("old_entity_id", event_data.get(ATTR_ENTITY_ID))
 
 
 @callback
@@ -796,7 +706,7 @@ class _TrackTemplateResultInfo:
             template = track_template_.template
             variables = track_template_.variables
             self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict
+                variables, strict=strict, memoize=True
             )
 
             if info.exception:
@@ -916,7 +826,7 @@ class _TrackTemplateResultInfo:
 
         self._rate_limit.async_triggered(template, now)
         self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+            track_template_.variables, memoize=True
         )
 
         try:
@@ -1172,39 +1082,148 @@ def async_track_point_in_utc_time(
     # having to figure out how to call the action every time its called.
     job = action if isinstance(action, HassJob) else HassJob(action)
 
-    cancel_callback: asyncio.TimerHandle | None = None
+    wheel: _TimerWheel | None = hass.data.get(TRACK_POINT_IN_TIME_WHEEL)
+    if wheel is None:
+        wheel = hass.data[TRACK_POINT_IN_TIME_WHEEL] = _TimerWheel(hass)
+
+    return wheel.async_schedule(utc_point_in_time, job)
+
+
+@callback
+def _async_run_timer_job(hass: HomeAssistant, job: HassJob, *args: Any) -> None:
+    """Run a timer job without letting it break the other jobs due with it."""
+    try:
+        hass.async_run_hass_job(job, *args)
+    except Exception as err:  # pylint: disable=broad-except
+        hass.loop.call_exception_handler(
+            {
+                "message": f"Exception in timer callback {job}",
+                "exception": err,
+            }
+        )
+
+
+class _TimerEntry:
+    """A single point in time listener."""
+
+    __slots__ = ("job", "utc_point_in_time")
+
+    def __init__(self, job: HassJob, utc_point_in_time: datetime) -> None:
+        """Initialize the entry."""
+        self.job: HassJob | None = job
+        self.utc_point_in_time = utc_point_in_time
+
+
+class _TimerWheel:
+    """Schedule the point in time listeners of a Home Assistant instance.
+
+    Listeners due at the same time share a slot and all due slots are run
+    in a single wakeup, so the event loop only holds a timer for the
+    earliest slot instead of one timer per listener.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self._slots: dict[float, list[_TimerEntry]] = {}
+        self._timestamps: list[float] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_timestamp: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of pending listeners."""
+        return sum(len(slot) for slot in self._slots.values())
 
     @callback
-    def run_action() -> None:
-        """Call the action."""
-        nonlocal cancel_callback
+    def async_schedule(
+        self, utc_point_in_time: datetime, job: HassJob
+    ) -> CALLBACK_TYPE:
+        """Schedule a job to run at a point in time."""
+        timestamp = utc_point_in_time.timestamp()
+        entry = _TimerEntry(job, utc_point_in_time)
+
+        slot = self._slots.get(timestamp)
+        if slot is None:
+            slot = self._slots[timestamp] = []
+            heapq.heappush(self._timestamps, timestamp)
+        slot.append(entry)
+
+        if self._handle_timestamp is None or timestamp < self._handle_timestamp:
+            self._async_arm(timestamp)
 
-        now = time_tracker_utcnow()
+        @callback
+        def unsub_point_in_time_listener() -> None:
+            """Cancel the listener."""
+            if entry.job is None:
+                return
+            entry.job = None
+            if self._slots.get(timestamp) is not slot:
+                # Already being run, the cleared job is skipped
+                return
+            slot.remove(entry)
+            if slot:
+                return
+            # The timestamp stays in the heap and is skipped when popped,
+            # unless cancelled timestamps start to outnumber the pending ones
+            del self._slots[timestamp]
+            if len(self._timestamps) > 2 * len(self._slots):
+                self._timestamps = list(self._slots)
+                heapq.heapify(self._timestamps)
+
+        return unsub_point_in_time_listener
+
+    @callback
+    def _async_arm(self, timestamp: float) -> None:
+        """Arm the loop timer for a timestamp."""
+        if self._handle is not None:
+            self._handle.cancel()
+        loop = self.hass.loop
+        self._handle = loop.call_at(
+            loop.time() + timestamp - time.time(), self._async_run
+        )
+        self._handle_timestamp = timestamp
+
+    @callback
+    def _async_arm_next(self) -> None:
+        """Arm the loop timer for the earliest pending slot."""
+        timestamps = self._timestamps
+        while timestamps and timestamps[0] not in self._slots:
+            heapq.heappop(timestamps)
+        if timestamps:
+            self._async_arm(timestamps[0])
+
+    @callback
+    def _async_run(self) -> None:
+        """Run all listeners that are due."""
+        self._handle = self._handle_timestamp = None
+        now = time_tracker_utcnow().timestamp()
+        timestamps = self._timestamps
+
+        due: list[list[_TimerEntry]] = []
+        while timestamps and timestamps[0] <= now:
+            slot = self._slots.pop(heapq.heappop(timestamps), None)
+            if slot:
+                due.append(slot)
 
         # Depending on the available clock support (including timer hardware
         # and the OS kernel) it can happen that we fire a little bit too early
         # as measured by utcnow(). That is bad when callbacks have assumptions
         # about the current time. Thus, we rearm the timer for the remaining
         # time.
-        delta = (utc_point_in_time - now).total_seconds()
-        if delta > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
-
-            cancel_callback = hass.loop.call_later(delta, run_action)
-            return
+        if not due and timestamps:
+            _LOGGER.debug("Called %f seconds too early, rearming", timestamps[0] - now)
 
-        hass.async_run_hass_job(job, utc_point_in_time)
-
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action)
-
-    @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
+        # Arm before running so listeners scheduled by the jobs only
+        # re-arm the timer when they are due earlier.
+        self._async_arm_next()
 
-    return unsub_point_in_time_listener
+        for slot in due:
+            for entry in slot:
+                job = entry.job
+                if job is None:
+                    continue
+                entry.job = None
+                _async_run_timer_job(self.hass, job, entry.utc_point_in_time)
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -1382,41 +1401,124 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
+    pattern = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
+        local,
+    )
 
-    def calculate_next(now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(now) if local else now
-        return dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
-        )
+    groups: dict[tuple, _TimePatternGroup] | None = hass.data.get(
+        TRACK_TIME_PATTERN_GROUPS
+    )
+    if groups is None:
+        groups = hass.data[TRACK_TIME_PATTERN_GROUPS] = {}
+
+    next_time = _calculate_next_pattern_time(pattern, dt_util.utcnow())
+    group = groups.get((pattern, next_time))
+    if group is None:
+        group = _TimePatternGroup(hass, groups, pattern, next_time)
+    return group.async_add_listener(job)
+
+
+def _calculate_next_pattern_time(pattern: tuple, now: datetime) -> datetime:
+    """Calculate the next time a time pattern matches."""
+    seconds, minutes, hours, local = pattern
+    localized_now = dt_util.as_local(now) if local else now
+    return dt_util.find_next_time_expression_time(
+        localized_now, list(seconds), list(minutes), list(hours)
+    )
+
+
+class _TimePatternListener:
+    """A listener of a time pattern group."""
+
+    __slots__ = ("job", "group")
+
+    def __init__(self, job: HassJob, group: _TimePatternGroup) -> None:
+        """Initialize the listener."""
+        self.job = job
+        self.group = group
+
+
+class _TimePatternGroup:
+    """Listeners of the same time pattern that are due at the same time.
+
+    The next matching time is calculated once per group instead of once
+    per listener. Groups of the same pattern that become due at the same
+    time are merged.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        groups: dict[tuple, _TimePatternGroup],
+        pattern: tuple,
+        next_time: datetime,
+    ) -> None:
+        """Initialize the group and schedule it."""
+        self.hass = hass
+        self._groups = groups
+        self._pattern = pattern
+        self._job = HassJob(self._async_fire)
+        self.listeners: dict[_TimePatternListener, None] = {}
+        self._async_schedule(next_time)
 
-    time_listener: CALLBACK_TYPE | None = None
+    @callback
+    def _async_schedule(self, next_time: datetime) -> None:
+        """Schedule the group for the next matching time."""
+        self._key = (self._pattern, next_time)
+        self._groups[self._key] = self
+        self._cancel = async_track_point_in_utc_time(self.hass, self._job, next_time)
 
     @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
+    def _async_unschedule(self) -> None:
+        """Cancel the scheduled time of the group."""
+        self._cancel()
+        if self._groups.get(self._key) is self:
+            del self._groups[self._key]
 
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
+    @callback
+    def async_add_listener(self, job: HassJob) -> CALLBACK_TYPE:
+        """Add a listener to the group."""
+        listener = _TimePatternListener(job, self)
+        self.listeners[listener] = None
 
-        time_listener = async_track_point_in_utc_time(
-            hass,
-            pattern_time_change_listener,
-            calculate_next(now + timedelta(seconds=1)),
-        )
+        @callback
+        def unsub_pattern_time_change_listener() -> None:
+            """Cancel the time listener."""
+            group = listener.group
+            if group.listeners.pop(listener, False) is False:
+                return
+            if not group.listeners:
+                group._async_unschedule()  # pylint: disable=protected-access
 
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener, calculate_next(dt_util.utcnow())
-    )
+        return unsub_pattern_time_change_listener
 
     @callback
-    def unsub_pattern_time_change_listener() -> None:
-        """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
+    def _async_fire(self, _: datetime) -> None:
+        """Run the listeners and schedule the next matching time."""
+        now = time_tracker_utcnow()
+        listeners = list(self.listeners)
 
-    return unsub_pattern_time_change_listener
+        if self._groups.get(self._key) is self:
+            del self._groups[self._key]
+        next_time = _calculate_next_pattern_time(
+            self._pattern, now + timedelta(seconds=1)
+        )
+        group = self._groups.get((self._pattern, next_time))
+        if group is None:
+            self._async_schedule(next_time)
+        else:
+            for listener in listeners:
+                listener.group = group
+            group.listeners.update(self.listeners)
+            self.listeners = {}
+
+        fire_time = dt_util.as_local(now) if self._pattern[3] else now
+        for listener in listeners:
+            if listener in listener.group.listeners:
+                _async_run_timer_job(self.hass, listener.job, fire_time)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta
+import json
 import logging
 from typing import Any, cast
 
@@ -205,7 +206,10 @@ class RestoreStateData:
         # To fully mimic all the attribute data types when loaded from storage,
         # we're going to serialize it to JSON and then re-load it.
         if state is not None:
-            state = State.from_dict(_encode_complex(state.as_dict()))
+            try:
+                state = State.from_dict(json.loads(state.as_json()))
+            except (TypeError, ValueError):
+                state = State.from_dict(_encode_complex(state.as_dict()))
         if state is not None:
             self.last_states[entity_id] = StoredState(state, dt_util.utcnow())
 
@@ -354,26 +354,31 @@ async def async_extract_referenced_entity_ids(
 
     # Find devices for this area
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    for area_id in selector.area_ids:
+        selected.referenced_devices.update(
+            device_entry.id
+            for device_entry in device_registry.async_entries_for_area(dev_reg, area_id)
+        )
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
+    # Entities whose area matches the target area
+    for area_id in selector.area_ids:
+        selected.indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in entity_registry.async_entries_for_area(ent_reg, area_id)
+        )
+
+    for device_id in selected.referenced_devices:
+        targeted_device = device_id in selector.device_ids
+        for ent_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
         ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+            # Entities of a targeted device, or of a device in a target area
+            # when the entity has no explicitly set area
+            if targeted_device or not ent_entry.area_id:
+                selected.indirectly_referenced.add(ent_entry.entity_id)
 
     return selected
 
@@ -518,13 +523,16 @@ def async_set_service_schema(
 @bind_hass
 async def entity_service_call(
     hass: HomeAssistant,
-    platforms: Iterable[EntityPlatform],
+    platforms: Iterable[EntityPlatform] | dict[str, Entity],
     func: str | Callable[..., Any],
     call: ServiceCall,
     required_features: Iterable[int] | None = None,
 ) -> None:
     """Handle an entity service call.
 
+    The entities can be passed as the platforms they belong to, or as a
+    dictionary of the registered entities by entity id.
+
     Calls all platforms simultaneously.
     """
     if call.context.user_id:
@@ -537,6 +545,15 @@ async def entity_service_call(
     else:
         entity_perms = None
 
+    if isinstance(platforms, dict):
+        registered_entities = platforms
+    else:
+        registered_entities = {
+            entity_id: entity
+            for platform in platforms
+            for entity_id, entity in platform.entities.items()
+        }
+
     target_all_entities = call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL
 
     if target_all_entities:
@@ -561,44 +578,31 @@ async def entity_service_call(
     # Check the permissions
 
     # A list with entities to call the service on.
-    entity_candidates: list[Entity] = []
+    entity_candidates: list[Entity]
 
-    if entity_perms is None:
-        for platform in platforms:
-            if target_all_entities:
-                entity_candidates.extend(platform.entities.values())
-            else:
-                assert all_referenced is not None
-                entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
-                    ]
-                )
-
-    elif target_all_entities:
-        # If we target all entities, we will select all entities the user
-        # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
-            )
+    if target_all_entities:
+        entity_candidates = list(registered_entities.values())
+        if entity_perms is not None:
+            # If we target all entities, we will select all entities the user
+            # is allowed to control.
+            entity_candidates = [
+                entity
+                for entity in entity_candidates
+                if entity_perms(entity.entity_id, POLICY_CONTROL)
+            ]
 
     else:
         assert all_referenced is not None
 
-        for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
+        # Only look up the targeted entities
+        entity_candidates = [
+            registered_entities[entity_id]
+            for entity_id in all_referenced
+            if entity_id in registered_entities
+        ]
 
+        if entity_perms is not None:
+            for entity in entity_candidates:
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
                         context=call.context,
@@ -606,10 +610,6 @@ async def entity_service_call(
                         permission=POLICY_CONTROL,
                     )
 
-                platform_entities.append(entity)
-
-            entity_candidates.extend(platform_entities)
-
     if not target_all_entities:
         assert referenced is not None
 
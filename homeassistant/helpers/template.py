@@ -7,6 +7,7 @@ import base64
 import collections.abc
 from contextlib import suppress
 from contextvars import ContextVar
+from copy import copy
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import json
@@ -18,10 +19,9 @@ import re
 import sys
 from typing import Any, Callable, Generator, Iterable, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
-from jinja2 import contextfilter, contextfunction
+from jinja2 import contextfilter, contextfunction, nodes
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace  # type: ignore
 import voluptuous as vol
@@ -56,10 +56,27 @@ _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
+_RENDER_RESULT_CACHE = "template.render_result_cache"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+COMPILED_TEMPLATE_CACHE_SIZE = 1000
+RENDER_RESULT_CACHE_SIZE = 1000
+
+# Functions and filters that make a render depend on more than the states
+# Closest and distance depend on the home location without entity arguments
+_NOT_MEMOIZABLE_NAMES = {
+    "closest",
+    "device_entities",
+    "distance",
+    "lipsum",
+    "now",
+    "relative_time",
+    "utcnow",
+}
+_NOT_MEMOIZABLE_FILTERS = {"closest", "device_entities", "random"}
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -85,6 +102,67 @@ DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
 template_cv: ContextVar[str | None] = ContextVar("template_cv", default=None)
 
 
+class TemplateCache:
+    """LRU cache keyed by template source that counts its hits and misses."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: collections.OrderedDict[Any, Any] = collections.OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value of a key or None."""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Compiling can happen in the executor, the key may be evicted meanwhile
+        with suppress(KeyError):
+            self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Cache the value of a key, evicting the least recently used keys."""
+        self._data[key] = value
+        while len(self._data) > self.maxsize:
+            with suppress(KeyError):
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of cached keys."""
+        return len(self._data)
+
+    def info(self) -> dict[str, int]:
+        """Return the counters of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+@bind_hass
+def template_cache_info(hass: HomeAssistant) -> dict[str, dict[str, int]]:
+    """Return the counters of the compiled template and render result caches."""
+    compiled = {"hits": 0, "misses": 0, "size": 0, "maxsize": 0}
+    for wanted_env in (_ENVIRONMENT, _ENVIRONMENT_LIMITED, _ENVIRONMENT_STRICT):
+        env: TemplateEnvironment | None = hass.data.get(wanted_env)
+        if env is None:
+            continue
+        for key, value in env.template_cache.info().items():
+            compiled[key] += value
+
+    render_result_cache: TemplateCache | None = hass.data.get(_RENDER_RESULT_CACHE)
+    if render_result_cache is None:
+        render_result_cache = TemplateCache(RENDER_RESULT_CACHE_SIZE)
+
+    return {"compiled": compiled, "render_result": render_result_cache.info()}
+
+
 @bind_hass
 def attach(hass: HomeAssistant, obj: Any) -> None:
     """Recursively attach hass to all template instances in list and dict."""
@@ -298,6 +376,7 @@ class Template:
         "_exc_info",
         "_limited",
         "_strict",
+        "_memoizable",
     )
 
     def __init__(self, template, hass=None):
@@ -313,6 +392,7 @@ class Template:
         self._exc_info = None
         self._limited = None
         self._strict = None
+        self._memoizable: bool | None = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -487,9 +567,18 @@ class Template:
 
     @callback
     def async_render_to_info(
-        self, variables: TemplateVarsType = None, strict: bool = False, **kwargs: Any
+        self,
+        variables: TemplateVarsType = None,
+        strict: bool = False,
+        memoize: bool = False,
+        **kwargs: Any,
     ) -> RenderInfo:
-        """Render the template and collect an entity filter."""
+        """Render the template and collect an entity filter.
+
+        With memoize, the render is shared with the templates of the same
+        source that only depend on entity states which have not been
+        updated since.
+        """
         assert self.hass and _RENDER_INFO not in self.hass.data
 
         render_info = RenderInfo(self)
@@ -500,6 +589,13 @@ class Template:
             render_info._freeze_static()
             return render_info
 
+        memo_key = None
+        if memoize and not variables and set(kwargs) <= {"parse_result"}:
+            memo_key = (strict, kwargs.get("parse_result", True), self.template)
+            memoized_info = self._async_get_memoized_render(memo_key)
+            if memoized_info is not None:
+                return memoized_info
+
         self.hass.data[_RENDER_INFO] = render_info
         try:
             render_info._result = self.async_render(variables, strict=strict, **kwargs)
@@ -509,8 +605,75 @@ class Template:
             del self.hass.data[_RENDER_INFO]
 
         render_info._freeze()
+
+        if memo_key is not None and self._is_memoizable(render_info):
+            self.hass.data[_RENDER_RESULT_CACHE][memo_key] = (
+                self._entities_last_updated(render_info.entities),
+                render_info,
+            )
+
         return render_info
 
+    def _async_get_memoized_render(self, memo_key: tuple) -> RenderInfo | None:
+        """Return a copy of the memoized render if its states are unchanged."""
+        render_result_cache: TemplateCache | None = self.hass.data.get(
+            _RENDER_RESULT_CACHE
+        )
+        if render_result_cache is None:
+            render_result_cache = self.hass.data[_RENDER_RESULT_CACHE] = TemplateCache(
+                RENDER_RESULT_CACHE_SIZE
+            )
+
+        memoized = render_result_cache.get(memo_key)
+        if memoized is None:
+            return None
+
+        entities_last_updated, memoized_info = memoized
+        if entities_last_updated != self._entities_last_updated(memoized_info.entities):
+            # Counted as a miss, the render is replaced after rendering again
+            render_result_cache.hits -= 1
+            render_result_cache.misses += 1
+            return None
+
+        render_info = copy(memoized_info)
+        render_info.template = self
+        return render_info
+
+    def _entities_last_updated(
+        self, entities: collections.abc.Set[str]
+    ) -> tuple[tuple[str, datetime | None], ...]:
+        """Return when the states of the entities were last updated."""
+        result = []
+        for entity_id in sorted(entities):
+            state = self.hass.states.get(entity_id)
+            result.append((entity_id, None if state is None else state.last_updated))
+        return tuple(result)
+
+    def _is_memoizable(self, render_info: RenderInfo) -> bool:
+        """Return if a render only depends on the states of its entities."""
+        if (
+            render_info.exception
+            or render_info.all_states
+            or render_info.all_states_lifecycle
+            or render_info.domains
+            or render_info.domains_lifecycle
+            or render_info.has_time
+            or render_info.rate_limit is not None
+        ):
+            return False
+
+        if self._memoizable is None:
+            parsed = self._env.parse(self.template)
+            self._memoizable = not any(
+                node.name in _NOT_MEMOIZABLE_NAMES
+                for node in parsed.find_all(nodes.Name)
+            ) and not any(
+                node.name in _NOT_MEMOIZABLE_FILTERS
+                for node in parsed.find_all(nodes.Filter)
+            )
+
+        return self._memoizable
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -1406,7 +1569,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        self.template_cache = TemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
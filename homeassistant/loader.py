@@ -8,14 +8,25 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+from datetime import timedelta
 import functools as ft
 import importlib
 import json
 import logging
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    TypedDict,
+    TypeVar,
+    cast,
+)
 
 from awesomeversion import AwesomeVersion, AwesomeVersionStrategy
 
@@ -39,6 +50,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIME = "import_time"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -331,6 +343,7 @@ class Integration:
         self.file_path = file_path
         self.manifest = manifest
         manifest["is_built_in"] = self.is_built_in
+        self._pending_imports: dict[str, asyncio.Task] = {}
 
         if self.dependencies:
             self._all_dependencies_resolved: bool | None = None
@@ -480,7 +493,9 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
+            start = timer()
             cache[self.domain] = importlib.import_module(self.pkg_path)
+            self._record_import_time(timer() - start)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -488,9 +503,93 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
+            start = timer()
             cache[full_name] = self._import_platform(platform_name)
+            self._record_import_time(timer() - start)
         return cache[full_name]  # type: ignore
 
+    async def async_get_component(self) -> ModuleType:
+        """Return the component, importing it in the executor."""
+        await self.async_pre_import()
+        return self.get_component()
+
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform for an integration, importing it in the executor."""
+        await self.async_pre_import([platform_name])
+        return self.get_platform(platform_name)
+
+    async def async_pre_import(self, platforms: Iterable[str] = ()) -> None:
+        """Import the component and platforms in the executor.
+
+        Modules that are already imported or being imported are skipped.
+        Import errors are ignored here, they are raised again when the
+        module is imported by get_component or get_platform.
+        """
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        wanted = [self.domain, *(f"{self.domain}.{name}" for name in platforms)]
+        to_import = [
+            full_name
+            for full_name in wanted
+            if full_name not in cache and full_name not in self._pending_imports
+        ]
+
+        if to_import:
+            task = self.hass.async_create_task(self._async_import(to_import))
+            for full_name in to_import:
+                self._pending_imports[full_name] = task
+
+        pending = {
+            self._pending_imports[full_name]
+            for full_name in wanted
+            if full_name in self._pending_imports
+        }
+        if pending:
+            await asyncio.wait(pending)
+
+    async def _async_import(self, to_import: list[str]) -> None:
+        """Import modules in the executor and add them to the cache."""
+        try:
+            imported = await self.hass.async_add_executor_job(
+                self._import_modules, to_import
+            )
+        finally:
+            for full_name in to_import:
+                self._pending_imports.pop(full_name)
+
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        for full_name, (module, seconds) in imported.items():
+            if full_name not in cache:
+                cache[full_name] = module
+                self._record_import_time(seconds)
+
+    def _import_modules(
+        self, to_import: list[str]
+    ) -> dict[str, tuple[ModuleType, float]]:
+        """Import modules of the integration and return them with their import time."""
+        imported = {}
+        for full_name in to_import:
+            start = timer()
+            try:
+                if full_name == self.domain:
+                    module = importlib.import_module(self.pkg_path)
+                else:
+                    module = self._import_platform(full_name.split(".", 1)[1])
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Unable to import %s in the executor: %s", full_name, err)
+                if full_name == self.domain:
+                    # Platforms import the component first and fail as well
+                    break
+                continue
+            imported[full_name] = (module, timer() - start)
+        return imported
+
+    def _record_import_time(self, seconds: float) -> None:
+        """Add the time spent importing a module to the integration."""
+        import_time = self.hass.data.setdefault(DATA_IMPORT_TIME, {})
+        import_time[self.domain] = import_time.get(
+            self.domain, timedelta()
+        ) + timedelta(seconds=seconds)
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
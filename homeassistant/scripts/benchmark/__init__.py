@@ -5,9 +5,13 @@ import argparse
 import asyncio
 import collections
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
+import math
+import os
+import statistics
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import Callable, TypeVar
 
@@ -146,6 +150,81 @@ async def time_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def track_point_in_time_helper(hass):
+    """Schedule and run 50k point in time listeners spread over a second."""
+    count = 0
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle timer."""
+        nonlocal count
+        count += 1
+
+        if count == 50000:
+            event.set()
+
+    start = timer()
+
+    now = dt_util.utcnow()
+    for idx in range(50000):
+        hass.helpers.event.async_track_point_in_utc_time(
+            listener, now - timedelta(milliseconds=idx % 1000)
+        )
+
+    await event.wait()
+
+    return timer() - start
+
+
+@benchmark
+async def entity_service_call_dispatch(hass):
+    """Dispatch service calls to 3 entities in domains of growing size."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import device_registry, entity_registry
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_component import EntityComponent
+
+    class BenchmarkEntity(Entity):
+        """Entity that counts its service calls."""
+
+        should_poll = False
+        calls = 0
+
+        @core.callback
+        def async_called_by_service(self):
+            """Handle service call."""
+            BenchmarkEntity.calls += 1
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await device_registry.async_load(hass)
+        await entity_registry.async_load(hass)
+
+    runtime = 0.0
+
+    for size in (10, 100, 1000, 10000):
+        domain = f"benchmark_{size}"
+        component = EntityComponent(logging.getLogger(__name__), domain, hass)
+        entities = [BenchmarkEntity() for _ in range(size)]
+        for idx, entity in enumerate(entities):
+            entity.entity_id = f"{domain}.entity_{idx}"
+        await component.async_add_entities(entities)
+        component.async_register_entity_service("call", {}, "async_called_by_service")
+        targets = {"entity_id": [entity.entity_id for entity in entities[:3]]}
+
+        start = timer()
+        for _ in range(1000):
+            await hass.services.async_call(domain, "call", targets, blocking=True)
+        duration = timer() - start
+
+        print(f"{size} entities: {duration / 1000 * 10 ** 6:.1f}us per call")
+        runtime += duration
+
+    return runtime
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -390,6 +469,256 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _state_changed_events(count):
+    """Create state changed events of 100 entities with some attributes."""
+    events = []
+    old_states = {}
+    for idx in range(count):
+        entity_id = f"sensor.power_{idx % 100}"
+        new_state = core.State(
+            entity_id,
+            str(idx),
+            {
+                "unit_of_measurement": "W",
+                "friendly_name": f"Power {idx % 100}",
+                "device_class": "power",
+                "icon": "mdi:flash",
+            },
+        )
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+    return events
+
+
+@benchmark
+async def json_serialize_state_changes(hass):
+    """Serialize 100k state changes for websocket clients and the recorder."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder.models import States
+    from homeassistant.components.websocket_api import messages
+
+    events = _state_changed_events(10 ** 5)
+
+    start = timer()
+
+    for event in events:
+        messages.cached_event_message(1, event)
+        States.row_from_event(event)
+
+    return timer() - start
+
+
+@benchmark
+async def json_serialize_state_changes_uncached(hass):
+    """Serialize 100k state changes like json_serialize_state_changes without sharing."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.websocket_api import messages
+
+    events = _state_changed_events(10 ** 5)
+
+    start = timer()
+
+    for event in events:
+        messages.message_to_json(
+            messages.event_message(messages.IDEN_TEMPLATE, event)
+        ).replace(messages.IDEN_JSON_TEMPLATE, "1", 1)
+        json.dumps(dict(event.data["new_state"].attributes), cls=JSONEncoder)
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_subscription_matching(hass):
+    """Replay a topic stream against 10k MQTT subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import mqtt
+
+    trie = mqtt.SubscriptionTrie()
+    topics = []
+    for idx in range(2500):
+        for topic in (
+            f"zigbee2mqtt/device_{idx}",
+            f"zigbee2mqtt/device_{idx}/availability",
+            f"tele/tasmota_{idx}/STATE",
+            f"stat/tasmota_{idx}/POWER",
+        ):
+            topics.append(topic)
+            trie.add(mqtt.Subscription(topic, None))
+    for topic in ("homeassistant/#", "zigbee2mqtt/bridge/#", "tele/+/LWT"):
+        trie.add(mqtt.Subscription(topic, None))
+
+    stream = [topics[(idx * 7919) % len(topics)] for idx in range(10 ** 6)]
+
+    start = timer()
+
+    for topic in stream:
+        trie.matches(topic)
+
+    return timer() - start
+
+
+@benchmark
+async def recorder_write_throughput(hass):
+    """Write 100k state changes through the recorder.
+
+    Set RECORDER_DB_URL to run against MariaDB or PostgreSQL instead
+    of an in-memory SQLite database.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    hass.state = core.CoreState.running
+    instance = recorder.Recorder(
+        hass,
+        auto_purge=False,
+        keep_days=10,
+        commit_interval=1,
+        uri=os.environ.get("RECORDER_DB_URL", "sqlite://"),
+        db_max_retries=10,
+        db_retry_wait=3,
+        entity_filter=lambda entity_id: True,
+        exclude_t=[],
+        short_term_statistics=False,
+    )
+    instance.async_initialize()
+    instance.start()
+    assert await instance.async_db_ready
+    await instance.async_recorder_ready.wait()
+
+    events = []
+    old_states = {}
+    for idx in range(10 ** 5):
+        entity_id = f"sensor.power_{idx % 1000}"
+        new_state = core.State(entity_id, str(idx), {"unit_of_measurement": "W"})
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+        # Commit every 1000 state changes
+        if idx % 1000 == 999:
+            events.append(core.Event(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()}))
+
+    start = timer()
+
+    for event in events:
+        instance.queue.put(event)
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    return timer() - start
+
+
+@benchmark
+async def recorder_write_latency_during_history(hass):
+    """Measure recorder commit latency while history queries run.
+
+    Writes 100 batches of 1000 state changes to a SQLite file while four
+    executor threads keep querying the history through the read pool.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.ext import baked
+
+    from homeassistant.components import history, recorder
+
+    hass.state = core.CoreState.running
+    runtime = 0.0
+
+    with TemporaryDirectory() as config_dir:
+        instance = hass.data[recorder.DATA_INSTANCE] = recorder.Recorder(
+            hass,
+            auto_purge=False,
+            keep_days=10,
+            commit_interval=1,
+            uri=f"sqlite:///{config_dir}/home-assistant_v2.db",
+            db_max_retries=10,
+            db_retry_wait=3,
+            entity_filter=lambda entity_id: True,
+            exclude_t=[],
+            short_term_statistics=False,
+        )
+        instance.async_initialize()
+        instance.start()
+        assert await instance.async_db_ready
+        await instance.async_recorder_ready.wait()
+        hass.data[history.HISTORY_BAKERY] = baked.bakery()
+
+        start_time = dt_util.utcnow()
+        old_states = {}
+
+        def write_batch(batch):
+            for idx in range(1000):
+                entity_id = f"sensor.power_{idx % 100}"
+                new_state = core.State(
+                    entity_id, str(batch * 1000 + idx), {"unit_of_measurement": "W"}
+                )
+                instance.queue.put(
+                    core.Event(
+                        EVENT_STATE_CHANGED,
+                        {
+                            "entity_id": entity_id,
+                            "old_state": old_states.get(entity_id),
+                            "new_state": new_state,
+                        },
+                    )
+                )
+                old_states[entity_id] = new_state
+            instance.queue.put(
+                core.Event(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+            )
+            instance.block_till_done()
+
+        async def measure(readers):
+            stop = False
+            queries = 0
+
+            def query_history():
+                nonlocal queries
+                while not stop:
+                    history.get_significant_states(
+                        hass, start_time, entity_ids=["sensor.power_1"]
+                    )
+                    queries += 1
+
+            tasks = [hass.async_add_executor_job(query_history) for _ in range(readers)]
+            latencies = []
+            for batch in range(100):
+                start = timer()
+                await hass.async_add_executor_job(write_batch, batch)
+                latencies.append(timer() - start)
+            stop = True
+            await asyncio.gather(*tasks)
+
+            p99 = statistics.quantiles(latencies, n=100)[-1]
+            print(
+                f"{readers} readers: p99 write latency {p99 * 1000:.1f}ms, "
+                f"{queries} history queries"
+            )
+            return sum(latencies)
+
+        await measure(0)
+        runtime = await measure(4)
+
+        await hass.async_add_executor_job(instance.queue.put, None)
+        await hass.async_add_executor_job(instance.join)
+
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -420,6 +749,7 @@ def _create_state_changed_event_from_old_new(
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
     row.attributes = attributes_json
+    row.shared_attrs = None
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -433,3 +763,293 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row)
+
+
+def _statistics_samples(count):
+    """Return sensor samples for the statistics benchmarks."""
+    return [math.sin(idx / 10) * 1000 + idx % 7 for idx in range(count)]
+
+
+@benchmark
+async def statistics_rolling_window(hass):
+    """Update the statistics of a 1000 sample window with 10k samples."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import RollingStatistics
+
+    samples = _statistics_samples(10 ** 4)
+    window = RollingStatistics(1000)
+
+    start = timer()
+
+    for sample in samples:
+        window.append(sample)
+        _ = (
+            window.mean,
+            window.median,
+            window.stdev if len(window) > 1 else None,
+            window.variance if len(window) > 1 else None,
+            window.total,
+            window.min,
+            window.max,
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_rolling_window_recompute(hass):
+    """Update the statistics like statistics_rolling_window with full recomputes."""
+    samples = _statistics_samples(10 ** 4)
+    window: collections.deque = collections.deque(maxlen=1000)
+
+    start = timer()
+
+    for sample in samples:
+        window.append(sample)
+        _ = (
+            statistics.mean(window),
+            statistics.median(window),
+            statistics.stdev(window) if len(window) > 1 else None,
+            statistics.variance(window) if len(window) > 1 else None,
+            sum(window),
+            min(window),
+            max(window),
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def prometheus_scrape(hass):
+    """Scrape the Prometheus exposition for a growing number of sensors."""
+    # pylint: disable=import-outside-toplevel
+    import prometheus_client
+
+    from homeassistant.components.prometheus import PrometheusMetrics
+    from homeassistant.helpers.entity_values import EntityValues
+    from homeassistant.helpers.entityfilter import generate_filter
+
+    class FullRegistry:
+        """Collect every metric family like a scrape of the default registry."""
+
+        def __init__(self, metrics):
+            """Initialize the registry."""
+            self.metrics = metrics
+
+        def collect(self):
+            """Collect the default and the entity metric families."""
+            yield from prometheus_client.REGISTRY.collect()
+            # pylint: disable=protected-access
+            for metric in self.metrics._metrics.values():
+                yield from metric.collect()
+
+    runtime = 0.0
+
+    for size in (100, 1000, 5000):
+        metrics = PrometheusMetrics(
+            prometheus_client,
+            generate_filter([], [], [], []),
+            None,
+            hass.config.units.temperature_unit,
+            EntityValues(),
+            None,
+            None,
+        )
+        states = [
+            core.State(
+                f"sensor.entity_{idx}",
+                str(idx),
+                {"unit_of_measurement": f"unit_{idx % 50}"},
+            )
+            for idx in range(size)
+        ]
+        for state in states:
+            metrics.handle_event(core.Event(EVENT_STATE_CHANGED, {"new_state": state}))
+        metrics.render(metrics.async_pop_changed_metrics())
+
+        registry = FullRegistry(metrics)
+
+        # Between scrapes one in ten sensors of a single unit changes
+        changed_states = states[: size // 10 : 50]
+        full = incremental = 0.0
+        for _ in range(20):
+            for state in changed_states:
+                metrics.handle_event(
+                    core.Event(EVENT_STATE_CHANGED, {"new_state": state})
+                )
+            start = timer()
+            metrics.render(metrics.async_pop_changed_metrics())
+            incremental += timer() - start
+
+            start = timer()
+            prometheus_client.generate_latest(registry)
+            full += timer() - start
+
+        print(
+            f"{size} entities: {incremental / 20 * 1000:.1f}ms per scrape, "
+            f"{full / 20 * 1000:.1f}ms with generate_latest"
+        )
+        runtime += incremental
+
+    return runtime
+
+
+@benchmark
+async def websocket_state_changed_fanout(hass):
+    """Send a burst of 2000 state changes to 20 websocket clients.
+
+    Compares subscribe_events with the coalesced subscribe_entities. The
+    clients read a message every 3ms, like a busy tablet.
+    """
+    # pylint: disable=import-outside-toplevel,protected-access
+    from homeassistant.auth.models import User
+    from homeassistant.components import websocket_api
+    from homeassistant.components.websocket_api.http import WebSocketHandler
+
+    class SlowSocket:
+        """Socket of a client that reads slowly."""
+
+        closed = False
+
+        def __init__(self):
+            """Initialize the socket."""
+            self.messages = 0
+            self.last_message = None
+
+        async def send_str(self, message):
+            """Take a while to send a message."""
+            await asyncio.sleep(0.003)
+            self.messages += 1
+            self.last_message = timer()
+
+    websocket_api.commands.async_register_commands(
+        hass, websocket_api.async_register_command
+    )
+    user = User(name="benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    for idx in range(400):
+        hass.states.async_set(f"sensor.power_{idx}", "0", {"unit_of_measurement": "W"})
+
+    runtime = 0.0
+
+    for command in ({"type": "subscribe_events"}, {"type": "subscribe_entities"}):
+        handlers = []
+        for _ in range(20):
+            handler = WebSocketHandler(hass, None)
+            handler.wsock = SlowSocket()
+            handler._handle_task = hass.loop.create_future()
+            handler._writer_task = asyncio.create_task(handler._writer())
+            connection = websocket_api.ActiveConnection(
+                logging.getLogger(__name__), hass, handler._send_message, user, None
+            )
+            connection.async_handle({"id": 1, **command})
+            handlers.append((handler, connection))
+
+        connections = [connection for _, connection in handlers]
+        handlers = [handler for handler, _ in handlers]
+        while any(handler._to_write.qsize() for handler in handlers):
+            await asyncio.sleep(0.01)
+        for handler in handlers:
+            handler.wsock.messages = 0
+
+        start = timer()
+        for change in range(5):
+            for idx in range(400):
+                hass.states.async_set(
+                    f"sensor.power_{idx}", str(change + 1), {"unit_of_measurement": "W"}
+                )
+
+        # Wait till the connected clients received everything
+        peak = 0
+        connected = handlers
+        while connected:
+            peak = max(peak, *(handler._to_write.qsize() for handler in handlers))
+            await asyncio.sleep(0.01)
+            connected = [
+                handler for handler in handlers if not handler._handle_task.done()
+            ]
+            if connected and (
+                not any(handler._to_write.qsize() for handler in connected)
+                and timer() - max(handler.wsock.last_message for handler in connected)
+                > 0.1
+            ):
+                break
+
+        print(
+            f"{command['type']}: {len(connected)} of 20 clients still connected, "
+            f"{handlers[-1].wsock.messages} messages per client, "
+            f"{peak} peak pending messages"
+        )
+        if connected:
+            duration = max(handler.wsock.last_message for handler in connected) - start
+            print(f"Last change received after {duration * 1000:.0f}ms")
+            runtime += duration
+
+        for connection in connections:
+            connection.async_close()
+        for handler in handlers:
+            handler._writer_task.cancel()
+
+    return runtime
+
+
+@benchmark
+async def group_scene_activation(hass):
+    """Turn 1000 lights in nested groups on and off 10 times.
+
+    The lights are in 50 room groups of 20, in 5 floor groups, in a
+    group with all lights.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import group
+    from homeassistant.helpers import device_registry, entity_registry
+
+    hass.state = core.CoreState.running
+    hass.data[group.REG_KEY] = group.GroupIntegrationRegistry()
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await device_registry.async_load(hass)
+        await entity_registry.async_load(hass)
+
+    for idx in range(1000):
+        hass.states.async_set(f"light.light_{idx}", "off")
+    for room in range(50):
+        await group.Group.async_create_group(
+            hass,
+            f"room_{room}",
+            [f"light.light_{room * 20 + idx}" for idx in range(20)],
+        )
+    for floor in range(5):
+        await group.Group.async_create_group(
+            hass,
+            f"floor_{floor}",
+            [f"group.room_{floor * 10 + idx}" for idx in range(10)],
+        )
+    await group.Group.async_create_group(
+        hass, "all_lights", [f"group.floor_{idx}" for idx in range(5)]
+    )
+    await hass.async_block_till_done()
+
+    writes = 0
+    async_set = hass.states.async_set
+
+    @core.callback
+    def count_group_writes(entity_id, *args, **kwargs):
+        """Count the state writes of the groups."""
+        nonlocal writes
+        if entity_id.startswith("group."):
+            writes += 1
+        async_set(entity_id, *args, **kwargs)
+
+    hass.states.async_set = count_group_writes
+
+    start = timer()
+    for activation in range(10):
+        state = "on" if activation % 2 == 0 else "off"
+        for idx in range(1000):
+            hass.states.async_set(f"light.light_{idx}", state)
+        await hass.async_block_till_done()
+        assert hass.states.get("group.all_lights").state == state
+    runtime = timer() - start
+
+    print(f"{writes / 10:.0f} group state writes per scene activation")
+    return runtime
@@ -3,9 +3,12 @@ from unittest.mock import patch
 
 from homeassistant import core
 from homeassistant.components.alexa import state_report
+from homeassistant.components.alexa.const import DATA_CHANGE_REPORTERS
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.test_util.aiohttp import AiohttpClientMockResponse
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -277,3 +280,107 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
 
         await hass.async_block_till_done()
     assert len(aioclient_mock.mock_calls) == 1
+
+
+async def test_report_state_coalesced(hass, aioclient_mock):
+    """Test changes of an entity waiting in the queue are sent once."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+    reporter = hass.data[DATA_CHANGE_REPORTERS][-1]
+
+    for state in ("on", "off", "on", "off"):
+        hass.states.async_set(
+            "binary_sensor.test_contact",
+            state,
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 1
+    call_json = aioclient_mock.mock_calls[0][2]
+    assert (
+        call_json["event"]["payload"]["change"]["properties"][0]["value"]
+        == "NOT_DETECTED"
+    )
+    assert reporter.sent == 1
+    assert reporter.coalesced == 3
+    assert reporter.queued == 0
+    assert reporter.max_queue_latency is not None
+
+
+async def test_report_state_rate_limited(hass, aioclient_mock):
+    """Test reports rejected by the rate limit are retried."""
+    responses = [
+        AiohttpClientMockResponse(
+            "POST",
+            TEST_URL,
+            status=429,
+            json={
+                "payload": {
+                    "code": "TOO_MANY_REQUESTS",
+                    "description": "Too many requests",
+                }
+            },
+        ),
+        AiohttpClientMockResponse("POST", TEST_URL, status=202, text=""),
+    ]
+
+    async def fake_event_gateway(method, url, data):
+        """Reject the first report."""
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    aioclient_mock.post(TEST_URL, side_effect=fake_event_gateway)
+
+    with patch.object(state_report, "CHANGE_REPORT_RATE_LIMITED_DELAY", 0):
+        await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+        reporter = hass.data[DATA_CHANGE_REPORTERS][-1]
+
+        hass.states.async_set(
+            "binary_sensor.test_contact",
+            "on",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+        await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+    for call in aioclient_mock.mock_calls:
+        assert call[2]["event"]["header"]["name"] == "ChangeReport"
+        assert (
+            call[2]["event"]["endpoint"]["endpointId"] == "binary_sensor#test_contact"
+        )
+    assert reporter.sent == 1
+    assert reporter.queued == 0
+
+
+async def test_report_state_paced(hass, aioclient_mock):
+    """Test bulk changes are sent one endpoint at a time and can be stopped."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+    reporter = hass.data[DATA_CHANGE_REPORTERS][-1]
+
+    with patch.object(state_report, "CHANGE_REPORT_INTERVAL", 0):
+        for idx in range(5):
+            hass.states.async_set(
+                f"binary_sensor.test_contact_{idx}",
+                "on",
+                {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+            )
+        await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 5
+    assert [
+        call[2]["event"]["endpoint"]["endpointId"] for call in aioclient_mock.mock_calls
+    ] == [f"binary_sensor#test_contact_{idx}" for idx in range(5)]
+
+    unsub()
+    assert reporter not in hass.data[DATA_CHANGE_REPORTERS]
+
+    hass.states.async_set(
+        "binary_sensor.test_contact_0",
+        "off",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 5
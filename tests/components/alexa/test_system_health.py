@@ -0,0 +1,34 @@
+"""Test Alexa system health."""
+from homeassistant.components.alexa import state_report
+from homeassistant.components.alexa.const import DOMAIN
+from homeassistant.setup import async_setup_component
+
+from . import DEFAULT_CONFIG, TEST_URL
+
+from tests.common import get_system_health_info
+
+
+async def test_alexa_system_health(hass, aioclient_mock):
+    """Test Alexa system health."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    assert await async_setup_component(hass, "system_health", {})
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info == {}
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "on",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info.pop("max_queue_latency") is not None
+    assert info == {
+        "queued_reports": 0,
+        "sent_reports": 1,
+        "coalesced_reports": 0,
+    }
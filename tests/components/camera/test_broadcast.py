@@ -0,0 +1,115 @@
+"""The tests for sharing MJPEG streams between clients."""
+import asyncio
+from contextlib import suppress
+from unittest.mock import AsyncMock, Mock
+
+from aiohttp.test_utils import make_mocked_request
+
+from homeassistant.components.camera import broadcast
+
+
+async def _async_chunks(*chunks):
+    """Yield chunks of a stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_multipart_parts():
+    """Test splitting a multipart stream at its boundaries."""
+    parts = [
+        part
+        async for part in broadcast.async_multipart_parts(
+            "multipart/x-mixed-replace; boundary=--myboundary",
+            _async_chunks(
+                b"--myboundary\r\nContent-Type: image/jpeg\r\n\r\nfra",
+                b"me1\r\n--myboun",
+                b"dary\r\n\r\nframe2\r\n--myboundary\r\n\r\nframe3",
+            ),
+        )
+    ]
+
+    assert parts == [
+        b"--myboundary\r\nContent-Type: image/jpeg\r\n\r\nframe1\r\n",
+        b"--myboundary\r\n\r\nframe2\r\n",
+        b"--myboundary\r\n\r\nframe3",
+    ]
+
+
+async def test_multipart_parts_without_boundary():
+    """Test streams without a boundary are passed on as read."""
+    parts = [
+        part
+        async for part in broadcast.async_multipart_parts(
+            None, _async_chunks(b"Frame1", b"Frame2")
+        )
+    ]
+
+    assert parts == [b"Frame1", b"Frame2"]
+
+
+async def test_slow_client_drops_oldest_parts(hass):
+    """Test a full client buffer drops its oldest parts."""
+    queue = asyncio.Queue(broadcast.MJPEG_CLIENT_BUFFER)
+
+    for idx in range(broadcast.MJPEG_CLIENT_BUFFER + 2):
+        broadcast._async_put_dropping_oldest(queue, bytes([idx]))
+
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [
+        bytes([idx]) for idx in range(2, broadcast.MJPEG_CLIENT_BUFFER + 2)
+    ]
+
+
+async def test_reconnect_after_last_client_left(hass):
+    """Test a client connecting right after the last one left gets a new source."""
+    opened = []
+
+    async def _async_parts():
+        """Yield parts until the source is closed."""
+        try:
+            while True:
+                yield b"--frameboundary\r\n\r\nFrame\r\n"
+                await asyncio.sleep(0.01)
+        finally:
+            # Closing the upstream connection takes a while
+            await asyncio.sleep(0.1)
+
+    async def _async_open_source():
+        """Open a new source."""
+        opened.append(True)
+        return "multipart/x-mixed-replace; boundary=--frameboundary", _async_parts()
+
+    closed = []
+    stream = broadcast.MjpegBroadcast(
+        hass, _async_open_source, lambda: closed.append(True)
+    )
+
+    def _mock_request():
+        """Return a request that records the parts written to it."""
+        writer = Mock(write=AsyncMock(), write_headers=AsyncMock())
+        return make_mocked_request("GET", "/", writer=writer), writer
+
+    first_request, first_writer = _mock_request()
+    first = hass.async_create_task(stream.async_handle(first_request))
+    while not first_writer.write.called:
+        await asyncio.sleep(0.01)
+
+    first.cancel()
+    with suppress(asyncio.CancelledError):
+        await first
+    assert closed == [True]
+
+    second_request, second_writer = _mock_request()
+    second = hass.async_create_task(stream.async_handle(second_request))
+    while second_writer.write.call_count < 3:
+        await asyncio.sleep(0.01)
+
+    assert not second.done()
+    assert len(opened) == 2
+
+    second.cancel()
+    with suppress(asyncio.CancelledError):
+        await second
+
+    # Let the readers close their sources
+    await asyncio.sleep(0.2)
+    assert closed == [True, True]
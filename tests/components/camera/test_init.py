@@ -7,7 +7,11 @@ from unittest.mock import Mock, PropertyMock, mock_open, patch
 import pytest
 
 from homeassistant.components import camera
-from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.const import (
+    DOMAIN,
+    PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_MAX_AGE,
+)
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
@@ -354,3 +358,92 @@ async def test_record_service(hass, mock_camera, mock_stream):
         # So long as we call stream.record, the rest should be covered
         # by those tests.
         assert mock_record.called
+
+
+async def test_camera_snapshot_shared(hass, hass_ws_client, mock_camera):
+    """Test concurrent image requests share one fetch and the max age pref."""
+    fetched = asyncio.Event()
+    calls = 0
+
+    async def mock_camera_image():
+        """Return an image once released."""
+        nonlocal calls
+        calls += 1
+        await fetched.wait()
+        return b"Shared"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=mock_camera_image,
+    ):
+        requests = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*requests)
+
+        assert calls == 1
+        assert {image.content for image in images} == {b"Shared"}
+
+        # Without a max age every request fetches a new image
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert calls == 2
+
+        client = await hass_ws_client(hass)
+        await client.send_json(
+            {
+                "id": 8,
+                "type": "camera/update_prefs",
+                "entity_id": "camera.demo_camera",
+                "snapshot_max_age": 60,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"][PREF_SNAPSHOT_MAX_AGE] == 60
+
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Shared"
+        assert calls == 2
+
+
+async def test_mjpeg_still_stream_shared(hass, hass_client, mock_camera):
+    """Test MJPEG clients of a camera share one image source."""
+    calls = 0
+
+    async def mock_camera_image():
+        """Return a new image."""
+        nonlocal calls
+        calls += 1
+        return b"Frame"
+
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=mock_camera_image,
+    ):
+        url = "/api/camera_proxy_stream/camera.demo_camera?interval=10"
+        first = await client.get(url)
+        assert first.status == 200
+        assert b"Frame" in await first.content.readuntil(b"Frame")
+
+        second = await client.get(url)
+        assert second.status == 200
+        assert b"Frame" in await second.content.readuntil(b"Frame")
+
+        assert calls == 1
+
+        entity = hass.data[DOMAIN].get_entity("camera.demo_camera")
+        assert len(entity._mjpeg_broadcasts) == 1
+
+        first.close()
+        second.close()
+        for _ in range(10):
+            if not entity._mjpeg_broadcasts:
+                break
+            await asyncio.sleep(0.01)
+
+        assert not entity._mjpeg_broadcasts
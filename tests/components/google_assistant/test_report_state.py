@@ -1,16 +1,27 @@
 """Test Google report state."""
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.components.google_assistant import error, report_state
+from homeassistant.components.google_assistant.const import REPORT_STATE_BASE_URL
+from homeassistant.components.google_assistant.http import GoogleConfig
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from . import BASIC_CONFIG
+from .test_http import DUMMY_CONFIG, MOCK_TOKEN
 
 from tests.common import async_fire_time_changed
 
 
-async def test_report_state(hass, caplog, legacy_patchable_time):
+async def _async_report_pending(hass, seconds=report_state.REPORT_STATE_WINDOW):
+    """Move time past the collect window so pending states get reported."""
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=seconds))
+    await hass.async_block_till_done()
+
+
+async def test_report_state(hass, caplog):
     """Test report state works."""
     assert await async_setup_component(hass, "switch", {})
     hass.states.async_set("light.ceiling", "off")
@@ -39,7 +50,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
-        await hass.async_block_till_done()
+        await _async_report_pending(hass)
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -53,11 +64,11 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ), patch.object(BASIC_CONFIG, "async_report_state_all", AsyncMock()) as mock_report:
         # New state, so reported
         hass.states.async_set("light.double_report", "on")
-        await hass.async_block_till_done()
+        await _async_report_pending(hass)
 
         # Changed, but serialize is same, so filtered out by extra check
         hass.states.async_set("light.double_report", "off")
-        await hass.async_block_till_done()
+        await _async_report_pending(hass)
 
         assert len(mock_report.mock_calls) == 1
         assert mock_report.mock_calls[0][1][0] == {
@@ -69,7 +80,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("switch.ac", "on", {"something": "else"})
-        await hass.async_block_till_done()
+        await _async_report_pending(hass)
 
     assert len(mock_report.mock_calls) == 0
 
@@ -81,7 +92,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         side_effect=error.SmartHomeError("mock-error", "mock-msg"),
     ):
         hass.states.async_set("light.kitchen", "off")
-        await hass.async_block_till_done()
+        await _async_report_pending(hass)
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -92,6 +103,94 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
-        await hass.async_block_till_done()
+        await _async_report_pending(hass)
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def _async_enable_homegraph_report_state(hass, aioclient_mock):
+    """Set up report state against a mocked HomeGraph endpoint."""
+    config = GoogleConfig(hass, DUMMY_CONFIG)
+    await config.async_initialize()
+    await config.async_connect_agent_user("mock-user-id")
+
+    aioclient_mock.post(REPORT_STATE_BASE_URL, status=200, json={})
+
+    hass.states.async_set("light.initial", "off")
+
+    with patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, config)
+        await _async_report_pending(hass, 0)
+
+    assert aioclient_mock.call_count == 1
+    aioclient_mock.clear_requests()
+    aioclient_mock.post(REPORT_STATE_BASE_URL, status=200, json={})
+    return unsub
+
+
+async def test_report_state_batched(hass, aioclient_mock, hass_storage):
+    """Test changes within the collect window are reported in one request."""
+    with patch(
+        "homeassistant.components.google_assistant.http._get_homegraph_token",
+        return_value=MOCK_TOKEN,
+    ):
+        unsub = await _async_enable_homegraph_report_state(hass, aioclient_mock)
+
+        for idx in range(150):
+            hass.states.async_set(f"light.scene_{idx}", "on")
+        await hass.async_block_till_done()
+
+        assert aioclient_mock.call_count == 0
+
+        await _async_report_pending(hass)
+
+    assert aioclient_mock.call_count == 1
+    payload = aioclient_mock.mock_calls[0][2]
+    assert payload["agentUserId"] == "mock-user-id"
+    states = payload["payload"]["devices"]["states"]
+    assert len(states) == 150
+    assert states["light.scene_0"] == {"on": True, "online": True}
+
+    unsub()
+
+
+async def test_report_state_chunked_and_rate_limited(
+    hass, aioclient_mock, hass_storage
+):
+    """Test large reports are split and limited by the token bucket."""
+    with patch(
+        "homeassistant.components.google_assistant.http._get_homegraph_token",
+        return_value=MOCK_TOKEN,
+    ), patch.object(report_state, "MAX_REPORT_STATE_SIZE", 300), patch.object(
+        report_state, "REPORT_STATE_BURST", 2
+    ):
+        unsub = await _async_enable_homegraph_report_state(hass, aioclient_mock)
+        # The initial report used one of the tokens, let it refill
+        await _async_report_pending(hass, report_state.REPORT_STATE_REFILL_INTERVAL)
+
+        for idx in range(30):
+            hass.states.async_set(f"light.scene_{idx}", "on")
+
+        await _async_report_pending(hass)
+
+        # Bucket allows two requests, the rest waits for new tokens
+        assert aioclient_mock.call_count == 2
+
+        # Every refilled token sends one more chunk
+        for step in range(1, 4):
+            await _async_report_pending(
+                hass,
+                report_state.REPORT_STATE_WINDOW
+                + step * report_state.REPORT_STATE_REFILL_INTERVAL,
+            )
+            assert aioclient_mock.call_count == 2 + step
+
+    reported = {}
+    for call in aioclient_mock.mock_calls:
+        states = call[2]["payload"]["devices"]["states"]
+        assert len(states) < 30
+        reported.update(states)
+
+    assert len(reported) == 30
+
+    unsub()
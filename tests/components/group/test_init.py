@@ -9,6 +9,7 @@ from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
     ATTR_ICON,
     EVENT_HOMEASSISTANT_START,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_HOME,
     STATE_NOT_HOME,
@@ -17,7 +18,6 @@ from homeassistant.const import (
     STATE_UNKNOWN,
 )
 from homeassistant.core import CoreState
-from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 from homeassistant.setup import async_setup_component
 
 from tests.common import assert_setup_component
@@ -439,11 +439,11 @@ async def test_reloading_groups(hass):
         "group.second_group",
         "group.test_group",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["hello.world"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
+    assert hass.bus.async_listeners()["state_changed"] == 3
+    assert hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED)["hello.world"] == 1
+    assert hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED)["light.bowl"] == 1
+    assert hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED)["test.one"] == 1
+    assert hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED)["test.two"] == 1
 
     with patch(
         "homeassistant.config.load_yaml_config_file",
@@ -458,10 +458,10 @@ async def test_reloading_groups(hass):
         "group.all_tests",
         "group.hello",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
+    assert hass.bus.async_listeners()["state_changed"] == 2
+    assert hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED)["light.bowl"] == 1
+    assert hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED)["test.one"] == 1
+    assert hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED)["test.two"] == 1
 
 
 async def test_modify_group(hass):
@@ -1168,6 +1168,55 @@ async def test_group_that_references_a_group_of_lights(hass):
     assert hass.states.get("group.grouped_group").state == "off"
 
 
+async def test_nested_groups_write_state_once(hass):
+    """Test member changes of a loop iteration write the group state once."""
+    entity_ids = [f"light.light_{idx}" for idx in range(10)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "off")
+
+    assert await async_setup_component(
+        hass,
+        "group",
+        {
+            "group": {
+                "room": {"entities": entity_ids},
+                "floor": {"entities": ["group.room"]},
+                "all_room": {"entities": entity_ids, "all": True},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("group.floor").state == "off"
+
+    writes = []
+    async_set = hass.states.async_set
+
+    def count_writes(entity_id, *args, **kwargs):
+        writes.append(entity_id)
+        async_set(entity_id, *args, **kwargs)
+
+    with patch.object(hass.states, "async_set", count_writes):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "on")
+        await hass.async_block_till_done()
+
+    assert sorted(writes[10:]) == ["group.all_room", "group.floor", "group.room"]
+    assert hass.states.get("group.room").state == "on"
+    assert hass.states.get("group.floor").state == "on"
+    assert hass.states.get("group.all_room").state == "on"
+
+    hass.states.async_set(entity_ids[0], "off")
+    await hass.async_block_till_done()
+    assert hass.states.get("group.room").state == "on"
+    assert hass.states.get("group.all_room").state == "off"
+
+    for entity_id in entity_ids[1:]:
+        hass.states.async_set(entity_id, "off")
+    await hass.async_block_till_done()
+    assert hass.states.get("group.room").state == "off"
+    assert hass.states.get("group.floor").state == "off"
+
+
 async def test_group_that_references_a_group_of_covers(hass):
     """Group that references a group of covers."""
 
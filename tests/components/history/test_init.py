@@ -3,12 +3,13 @@
 from copy import copy
 from datetime import timedelta
 import json
-from unittest.mock import patch, sentinel
+from unittest.mock import ANY, patch, sentinel
 
 import pytest
 
 from homeassistant.components import history, recorder
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.statistics import PERIOD_HOUR, period_start
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component
@@ -648,6 +649,54 @@ def check_significant_states(hass, zero, four, states, config):
     assert states == hist
 
 
+@pytest.mark.parametrize("minimal_response", [False, True])
+@pytest.mark.parametrize("include_start_time_state", [False, True])
+@pytest.mark.parametrize(
+    "entity_ids", [None, ["thermostat.test2", "media_player.test", "zone.missing"]]
+)
+def test_stream_significant_states_json(
+    hass_history, minimal_response, include_start_time_state, entity_ids
+):
+    """Test streaming gives the same states as get_significant_states."""
+    hass = hass_history
+    zero, four, _ = record_states(hass)
+    start_time = zero + timedelta(seconds=2)
+    filters = history.Filters()
+
+    hist = history.get_significant_states(
+        hass,
+        start_time,
+        four,
+        entity_ids,
+        filters,
+        include_start_time_state=include_start_time_state,
+        minimal_response=minimal_response,
+    )
+    expected = json.loads(json.dumps(list(hist.values()), cls=JSONEncoder))
+    if entity_ids is None:
+        expected.sort(key=lambda states: states[0]["entity_id"])
+
+    # Every state is written in its own chunk
+    with patch.object(history, "STREAM_CHUNK_SIZE", 1), patch.object(
+        history, "STREAM_BATCH_SIZE", 2
+    ), recorder.session_scope(hass=hass) as session:
+        chunks = list(
+            history._stream_significant_states_json(
+                hass,
+                session,
+                start_time,
+                four,
+                entity_ids,
+                filters,
+                include_start_time_state=include_start_time_state,
+                minimal_response=minimal_response,
+            )
+        )
+
+    assert len(chunks) == sum(map(len, expected)) + 1
+    assert json.loads(b"".join(chunks)) == expected
+
+
 def record_states(hass):
     """Record some test states.
 
@@ -756,6 +805,30 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == 200
 
 
+async def test_fetch_period_api_streams_states(hass, hass_client):
+    """Test the fetch period view streams the states of each entity."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.cow", "on")
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    with patch.object(history, "STREAM_CHUNK_SIZE", 1):
+        response = await client.get(f"/api/history/period/{start.isoformat()}")
+    assert response.status == 200
+    assert response.headers["Content-Type"] == "application/json"
+    response_json = await response.json()
+    assert [
+        [(state["entity_id"], state["state"]) for state in states]
+        for states in response_json
+    ] == [[("light.cow", "on")], [("light.kitchen", "on"), ("light.kitchen", "off")]]
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -971,3 +1044,173 @@ async def test_entity_ids_limit_via_api_with_skip_initial_state(hass, hass_clien
     assert len(response_json) == 2
     assert response_json[0][0]["entity_id"] == "light.kitchen"
     assert response_json[1][0]["entity_id"] == "light.cow"
+
+
+async def test_statistics_during_period(hass, hass_ws_client):
+    """Test statistics_during_period websocket command."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    zero = period_start(dt_util.utcnow(), PERIOD_HOUR) + timedelta(hours=1)
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=zero + timedelta(minutes=10),
+    ):
+        hass.states.async_set("sensor.test", "10", {"unit_of_measurement": "°C"})
+        await hass.async_add_executor_job(trigger_db_commit, hass)
+        await hass.async_block_till_done()
+    instance.queue.put(recorder.StatisticsTask(zero, PERIOD_HOUR))
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/statistics_during_period",
+            "start_time": zero.isoformat(),
+            "end_time": (zero + timedelta(hours=1)).isoformat(),
+            "statistic_ids": ["sensor.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": [
+            {
+                "statistic_id": "sensor.test",
+                "start": zero.isoformat(),
+                "mean": 10.0,
+                "min": 10.0,
+                "max": 10.0,
+                "state": 10.0,
+                "sum": None,
+            }
+        ]
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/statistics_during_period",
+            "start_time": (zero + timedelta(hours=1)).isoformat(),
+            "period": "5minute",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {}
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/statistics_during_period",
+            "start_time": "not a date",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
+async def test_fetch_period_api_with_compressed_state_format(hass, hass_client):
+    """Test the fetch period view for history with the compressed state format."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 200})
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("climate.test", "heat", {"current_temperature": 19})
+    hass.states.async_set("climate.test", "heat", {"current_temperature": 20})
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?compressed_state_format"
+        "&significant_changes_only=0"
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert list(response_json) == ["climate.test", "light.kitchen"]
+
+    kitchen = response_json["light.kitchen"]
+    assert kitchen["a"] == {}
+    assert kitchen["s"] == ["on", "off"]
+    assert len(kitchen["lc"]) == 2
+    assert kitchen["lc"][0] >= start.timestamp()
+    assert kitchen["lc"][1] == hass.states.get("light.kitchen").last_changed.timestamp()
+    assert "ac" not in kitchen
+
+    climate = response_json["climate.test"]
+    assert climate["a"] == {"current_temperature": 20}
+    assert climate["s"] == ["heat", "heat"]
+    assert climate["ac"] == [{"current_temperature": 19}, {"current_temperature": 20}]
+
+    response = await client.get(
+        f"/api/history/period/{(start + timedelta(days=1)).isoformat()}"
+        "?compressed_state_format"
+    )
+    assert response.status == 200
+    assert await response.json() == {}
+
+
+async def test_history_during_period(hass, hass_ws_client):
+    """Test history_during_period websocket command."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.test", "2", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.other", "on")
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    state = hass.states.get("sensor.test")
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["result"] == {
+        "sensor.test": {
+            "a": {"unit_of_measurement": "W"},
+            "s": ["1", "2"],
+            "lc": [ANY, state.last_changed.timestamp()],
+        }
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (start + timedelta(days=1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {}
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": "not a date",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_end_time"
@@ -415,5 +415,53 @@ async def test_reload(hass):
     assert hass.states.get("sensor.second_test")
 
 
+async def test_measure_from_state_changes(hass):
+    """Test the history is read once and then kept up to date from changes."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass
+    )  # force in memory db
+
+    t0 = dt_util.utcnow() - timedelta(minutes=40)
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "on", last_changed=t0),
+        ]
+    }
+    hass.states.async_set("binary_sensor.test_id", "on")
+
+    with patch(
+        "homeassistant.components.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_changes:
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "test",
+                    "state": "on",
+                    "type": "count",
+                    "start": "{{ as_timestamp(now()) - 3600 }}",
+                    "end": "{{ now() }}",
+                },
+            },
+        )
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.test").state == "1"
+        assert len(mock_changes.mock_calls) == 1
+
+        for state in ("off", "on", "off", "on"):
+            hass.states.async_set("binary_sensor.test_id", state)
+            await hass.async_block_till_done()
+        hass.states.async_set("binary_sensor.test_id", "on", {"attribute": 1})
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.test").state == "3"
+        assert len(mock_changes.mock_calls) == 1
+
+
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
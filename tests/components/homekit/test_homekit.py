@@ -918,6 +918,7 @@ async def test_homekit_ignored_missing_devices(
     await asyncio.sleep(0)
     # Restore the registry
     entity_reg.entities = before_removal
+    entity_reg._rebuild_index()
 
     hass.states.async_set(light.entity_id, STATE_ON)
     hass.states.async_set("light.two", STATE_ON)
@@ -1,8 +1,10 @@
 """The tests for the InfluxDB component."""
 from dataclasses import dataclass
 import datetime
+import os
 from unittest.mock import MagicMock, Mock, call, patch
 
+from influxdb.line_protocol import make_lines
 import pytest
 
 import homeassistant.components.influxdb as influxdb
@@ -36,13 +38,14 @@ class FilterTest:
 
 
 @pytest.fixture(autouse=True)
-def mock_batch_timeout(hass, monkeypatch):
-    """Mock the event bus listener and the batch timeout for tests."""
+def mock_batch_timeout(hass, monkeypatch, tmp_path):
+    """Mock the event bus listener, the batch timeout and the disk buffer."""
     hass.bus.listen = MagicMock()
     monkeypatch.setattr(
         f"{INFLUX_PATH}.InfluxThread.batch_timeout",
         Mock(return_value=0),
     )
+    monkeypatch.setattr(f"{INFLUX_PATH}.SPILL_FILE", str(tmp_path / "buffer"))
 
 
 @pytest.fixture(name="mock_client")
@@ -62,7 +65,7 @@ def get_mock_call_fixture(request):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": _to_lines(body, precision)}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -71,8 +74,26 @@ def get_mock_call_fixture(request):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    # pylint: disable=unnecessary-lambda
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: call(
+        _to_lines(body, precision), time_precision=precision, protocol="line"
+    )
+
+
+def _to_lines(body, precision=None):
+    """Convert expected event json to the line protocol records written."""
+    lines = []
+    for json in body:
+        # Numeric states and attributes are always written as floats and the
+        # state fields are written ahead of the attributes
+        fields = {
+            key: float(value) if isinstance(value, int) else value
+            for key, value in sorted(
+                json["fields"].items(),
+                key=lambda item: (item[0] != "state", item[0] != "value"),
+            )
+        }
+        lines.append(influxdb.json_to_line({**json, "fields": fields}, precision))
+    return lines
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1465,13 +1486,14 @@ async def test_event_listener_scheduled_write(
         assert mock_sleep.called
     assert write_api.call_count == 2
 
-    # Write works again
+    # Write works again, the failed write is replayed from disk
     write_api.side_effect = None
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         handler_method(event)
         hass.data[influxdb.DOMAIN].block_till_done()
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    assert write_api.call_count == 4
+    assert write_api.call_args_list[2] == write_api.call_args_list[3]
 
 
 @pytest.mark.parametrize(
@@ -1790,3 +1812,171 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize("precision", [None, "us", "ms", "s"])
+def test_json_to_line(precision):
+    """Test line protocol serialization matches the InfluxDB client."""
+    json = {
+        "measurement": "living room,temp",
+        "tags": {
+            "entity_id": "sensor",
+            "domain": "fake",
+            "location": "first floor",
+            "empty": "",
+        },
+        "time": datetime.datetime(
+            2021, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc
+        ),
+        "fields": {
+            "friendly_name_str": 'The "living" room\\',
+            "state": "on",
+            "temperature": 21.5,
+            "value": 1.0,
+        },
+    }
+    influx_precision = {None: None, "us": "u"}.get(precision, precision)
+
+    assert f"{influxdb.json_to_line(json, precision)}\n" == make_lines(
+        {"points": [json]}, influx_precision
+    )
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            {"coalesce": "last"},
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.DEFAULT_API_VERSION,
+            {"coalesce": "mean"},
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_coalesce(
+    hass, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test updates of the same entity are merged within a batch."""
+    handler_method = await _setup(hass, mock_client, config_ext, get_write_api)
+
+    events = []
+    for entity_id, value, time_fired in (
+        ("fake.first", "1", 1),
+        ("fake.second", "5", 2),
+        ("fake.first", "2", 3),
+        ("fake.first", "6", 4),
+    ):
+        state = MagicMock(
+            state=value,
+            domain="fake",
+            entity_id=entity_id,
+            object_id=split_entity_id(entity_id)[1],
+            attributes={},
+        )
+        events.append(MagicMock(data={"new_state": state}, time_fired=time_fired))
+
+    first_value = 6 if config_ext["coalesce"] == "last" else 3
+    body = [
+        {
+            "measurement": "fake.first",
+            "tags": {"domain": "fake", "entity_id": "first"},
+            "time": 4,
+            "fields": {"value": first_value},
+        },
+        {
+            "measurement": "fake.second",
+            "tags": {"domain": "fake", "entity_id": "second"},
+            "time": 2,
+            "fields": {"value": 5},
+        },
+    ]
+
+    with patch.object(influxdb.InfluxThread, "batch_timeout", return_value=0.1):
+        for event in events:
+            handler_method(event)
+        hass.data[influxdb.DOMAIN].block_till_done()
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == get_mock_call(body)
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_backlog_replayed(
+    hass, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test old events are buffered on disk and written once caught up."""
+    handler_method = await _setup(hass, mock_client, config_ext, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+
+    def make_event(value, time_fired):
+        state = MagicMock(
+            state=value,
+            domain="fake",
+            entity_id="fake.entity",
+            object_id="entity",
+            attributes={},
+        )
+        return MagicMock(data={"new_state": state}, time_fired=time_fired)
+
+    def make_body(value, time_fired):
+        return [
+            {
+                "measurement": "fake.entity",
+                "tags": {"domain": "fake", "entity_id": "entity"},
+                "time": time_fired,
+                "fields": {"value": value},
+            }
+        ]
+
+    monotonic_time = 0
+
+    def fast_monotonic():
+        """Monotonic time that ticks fast enough to cause a timeout."""
+        nonlocal monotonic_time
+        monotonic_time += 60
+        return monotonic_time
+
+    with patch("homeassistant.components.influxdb.time.monotonic", new=fast_monotonic):
+        handler_method(make_event("1", 1))
+        instance.block_till_done()
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 0
+    assert instance.spilled == 1
+    assert instance.spill_size > 0
+
+    handler_method(make_event("2", 2))
+    instance.block_till_done()
+
+    assert write_api.call_count == 2
+    assert write_api.call_args_list[0] == get_mock_call(make_body(2, 2))
+    assert write_api.call_args_list[1] == get_mock_call(make_body(1, 1))
+    assert instance.written == 2
+    assert instance.spilled == 0
+    assert instance.spill_size == 0
+    assert not os.path.exists(instance.spill_path)
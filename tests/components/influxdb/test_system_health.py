@@ -0,0 +1,26 @@
+"""Test InfluxDB system health."""
+from unittest.mock import patch
+
+from homeassistant.components.influxdb.const import DOMAIN
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_influxdb_system_health(hass):
+    """Test InfluxDB system health."""
+    assert await async_setup_component(hass, "system_health", {})
+    with patch("homeassistant.components.influxdb.InfluxDBClient"):
+        assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+        await hass.async_block_till_done()
+
+        info = await get_system_health_info(hass, DOMAIN)
+
+    assert info == {
+        "queue_depth": 0,
+        "batch_size": 100,
+        "write_latency": None,
+        "written_events": 0,
+        "buffered_events": 0,
+        "dropped_events": 0,
+    }
@@ -1,5 +1,6 @@
 """The tests for the logbook component."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
 import collections
 from datetime import datetime, timedelta
 import json
@@ -295,6 +296,7 @@ def create_state_changed_event_from_old_new(
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
     row.attributes = attributes_json
+    row.shared_attrs = None
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -1834,6 +1836,184 @@ async def test_context_filter(hass, hass_client):
     assert response.status == 400
 
 
+async def test_event_stream(hass, hass_ws_client):
+    """Test the recorded entries are streamed before the live ones."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_ON)
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "20", {"unit_of_measurement": "W"})
+    await _async_commit_and_wait(hass)
+
+    # Not committed yet, the stream waits for the recorder
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    listeners = hass.bus.async_listeners()
+    instance = hass.data[recorder.DATA_INSTANCE]
+    # Before going live the recorded entries are read from the writer database
+    with patch.object(
+        instance, "get_read_session", wraps=instance.get_read_session
+    ) as mock_get_read_session:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+    assert not mock_get_read_session.called
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    assert "partial" not in response["event"]
+    entries = response["event"]["events"]
+    assert len(entries) == 3
+    _assert_entry(entries[0], name="Home Assistant", message="started")
+    _assert_entry(entries[1], entity_id="light.kitchen", state=STATE_ON)
+    _assert_entry(entries[2], entity_id="light.kitchen", state=STATE_OFF)
+
+    context = ha.Context()
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+        context=context,
+    )
+    hass.states.async_set(
+        "light.kitchen", STATE_ON, {"icon": "mdi:lamp"}, context=context
+    )
+    hass.states.async_set("light.kitchen", STATE_ON, {"brightness": 100})
+    hass.states.async_set("sensor.power", "30", {"unit_of_measurement": "W"})
+    logbook.async_log_entry(hass, "Alarm", "is triggered", "switch")
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="light.kitchen", state=STATE_ON)
+    assert entries[0]["icon"] == "mdi:lamp"
+    assert entries[0]["context_domain"] == "light"
+    assert entries[0]["context_service"] == "turn_on"
+
+    response = await client.receive_json()
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], name="Alarm", message="is triggered", domain="switch")
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert response["success"]
+
+    assert hass.bus.async_listeners() == listeners
+
+
+async def test_event_stream_chunks(hass, hass_ws_client):
+    """Test the recorded entries are sent in chunks for a fixed period."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    for idx in range(5):
+        hass.states.async_set("switch.test", STATE_ON if idx % 2 else STATE_OFF)
+        hass.states.async_set("switch.other", STATE_ON if idx % 2 else STATE_OFF)
+    await _async_commit_and_wait(hass)
+
+    client = await hass_ws_client()
+    with patch.object(logbook, "STREAM_CHUNK_SIZE", 3):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+                "end_time": dt_util.utcnow().isoformat(),
+                "entity_ids": ["switch.test"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+        assert response["event"]["partial"]
+        entries = response["event"]["events"]
+        response = await client.receive_json()
+        assert "partial" not in response["event"]
+        entries += response["event"]["events"]
+
+    assert len(entries) == 4
+    assert {entry["entity_id"] for entry in entries} == {"switch.test"}
+    assert [entry["state"] for entry in entries] == [STATE_ON, STATE_OFF] * 2
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 2, "type": "ping"})
+    response = await client.receive_json()
+    assert response["type"] == "pong"
+
+
+@pytest.mark.parametrize("recorder_alive", [True, False])
+async def test_event_stream_recorder_not_committing(
+    hass, hass_ws_client, recorder_alive
+):
+    """Test the stream reads the database when the recorder does not commit."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    hass.states.async_set("switch.test", STATE_OFF)
+    hass.states.async_set("switch.test", STATE_ON)
+    await _async_commit_and_wait(hass)
+
+    async def _async_never_commit():
+        """Wait for a commit that does not happen."""
+        await asyncio.Event().wait()
+
+    instance = hass.data[recorder.DATA_INSTANCE]
+    client = await hass_ws_client()
+    with patch.object(logbook, "STREAM_COMMIT_TIMEOUT", 0.01), patch.object(
+        instance, "is_alive", return_value=recorder_alive
+    ), patch.object(
+        instance, "async_commit", side_effect=_async_never_commit
+    ) as mock_commit:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+                "entity_ids": ["switch.test"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+
+    assert mock_commit.called == recorder_alive
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.test", state=STATE_ON)
+
+
+async def test_event_stream_invalid_start_time(hass, hass_ws_client):
+    """Test the stream reports an invalid start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/event_stream", "start_time": "no time"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def _async_fetch_logbook(client, params=None):
     if params is None:
         params = {}
@@ -19,6 +19,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
 )
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
@@ -575,6 +576,78 @@ async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls
     assert calls[0][0].payload == payload
 
 
+async def test_subscribe_overlapping_wildcards(hass, mqtt_mock):
+    """Test overlapping subscriptions are called in subscription order."""
+    calls = []
+
+    for topic in ("home/#", "home/+/state", "home/kitchen/state", "+/+/+"):
+        await mqtt.async_subscribe(
+            hass, topic, lambda msg: calls.append(msg.subscribed_topic)
+        )
+
+    async_fire_mqtt_message(hass, "home/kitchen/state", "on")
+    await hass.async_block_till_done()
+    assert calls == ["home/#", "home/+/state", "home/kitchen/state", "+/+/+"]
+
+    calls.clear()
+    async_fire_mqtt_message(hass, "home", "on")
+    await hass.async_block_till_done()
+    assert calls == ["home/#"]
+
+
+async def test_unsubscribe_prunes_subscription_trie(hass, mqtt_mock):
+    """Test removed subscriptions no longer match and other ones still do."""
+    calls_a = MagicMock()
+    calls_b = MagicMock()
+
+    unsub_a = await mqtt.async_subscribe(hass, "test/+/state", calls_a)
+    unsub_b = await mqtt.async_subscribe(hass, "test/+/state", calls_b)
+
+    unsub_a()
+    async_fire_mqtt_message(hass, "test/light/state", "on")
+    await hass.async_block_till_done()
+    assert not calls_a.called
+    assert calls_b.called
+
+    unsub_b()
+    calls_b.reset_mock()
+    async_fire_mqtt_message(hass, "test/light/state", "on")
+    await hass.async_block_till_done()
+    assert not calls_b.called
+
+    with pytest.raises(HomeAssistantError):
+        unsub_b()
+
+
+def test_subscription_trie():
+    """Test matching topics against the subscription trie."""
+    trie = mqtt.SubscriptionTrie()
+    subscriptions = {
+        topic: mqtt.Subscription(topic, None)
+        for topic in ("a/b/c", "a/+/c", "a/#", "#", "+/b", "$SYS/#", "$SYS/+/x")
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    def matches(topic):
+        return [subscription.topic for subscription in trie.matches(topic)]
+
+    assert matches("a/b/c") == ["a/b/c", "a/+/c", "a/#", "#"]
+    assert matches("a") == ["a/#", "#"]
+    assert matches("x/b") == ["#", "+/b"]
+    assert matches("$SYS/broker/x") == ["$SYS/#", "$SYS/+/x"]
+    assert matches("$other") == []
+
+    trie.remove(subscriptions["a/+/c"])
+    trie.remove(subscriptions["#"])
+    assert matches("a/b/c") == ["a/b/c", "a/#"]
+    assert trie.has_topic("a/b/c")
+    assert not trie.has_topic("a/+/c")
+
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions["a/+/c"])
+
+
 async def test_subscribe_same_topic(hass, mqtt_client_mock, mqtt_mock):
     """
     Test subscring to same topic twice and simulate retained messages.
@@ -201,6 +201,45 @@ async def test_view(hass, hass_client):
     )
 
 
+async def test_view_updates_changed_metrics(hass, hass_client):
+    """Test scrapes reflect state changes and honor the accepted encoding."""
+    client = await prometheus_client(hass, hass_client)
+
+    resp = await client.get(prometheus.API_ENDPOINT)
+    assert resp.headers["content-encoding"] == "gzip"
+    body = (await resp.text()).split("\n")
+    assert (
+        'sensor_unit_kwh{domain="sensor",'
+        'entity="sensor.television_energy",'
+        'friendly_name="Television Energy"} 74.0' in body
+    )
+
+    hass.states.async_set(
+        "sensor.television_energy",
+        80,
+        {"friendly_name": "Television Energy", "unit_of_measurement": "kWh"},
+    )
+    await hass.async_block_till_done()
+
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.status == 200
+    assert "content-encoding" not in resp.headers
+    body = (await resp.text()).split("\n")
+    assert (
+        'sensor_unit_kwh{domain="sensor",'
+        'entity="sensor.television_energy",'
+        'friendly_name="Television Energy"} 80.0' in body
+    )
+    assert (
+        'humidity_percent{domain="sensor",'
+        'entity="sensor.outside_humidity",'
+        'friendly_name="Outside Humidity"} 54.0' in body
+    )
+    assert body.count("# TYPE sensor_unit_kwh gauge") == 1
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
+import pytest
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -21,11 +22,17 @@ from homeassistant.components.recorder import (
     run_information_with_session,
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
@@ -63,6 +70,7 @@ def _default_recorder(hass):
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_t=[],
+        short_term_statistics=False,
     )
 
 
@@ -197,17 +205,18 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    event_session = hass.data[DATA_INSTANCE].event_session
+    original_execute = event_session.execute
+
+    def _throw_if_state_inserted(statement, *args, **kwargs):
+        if getattr(statement, "table", None) is States.__table__:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return original_execute(statement, *args, **kwargs)
 
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        event_session,
+        "execute",
+        side_effect=_throw_if_state_inserted,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -235,17 +244,18 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    event_session = hass.data[DATA_INSTANCE].event_session
+    original_execute = event_session.execute
+
+    def _throw_if_state_inserted(statement, *args, **kwargs):
+        if getattr(statement, "table", None) is States.__table__:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        return original_execute(statement, *args, **kwargs)
 
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        event_session,
+        "execute",
+        side_effect=_throw_if_state_inserted,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -632,6 +642,73 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_sets_old_state_within_one_commit(hass_recorder):
+    """Test saving links old states written in the same commit."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {})
+    hass.states.set("test.one", "on", {})
+    hass.states.remove("test.one")
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 5
+
+        assert [state.state for state in states] == ["on", "off", "on", None, "off"]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id == states[0].state_id
+        assert states[2].old_state_id == states[1].state_id
+        assert states[3].old_state_id == states[2].state_id
+        assert states[4].old_state_id is None
+        for state in states:
+            event = session.query(Events).get(state.event_id)
+            assert event.event_type == EVENT_STATE_CHANGED
+
+
+def test_saving_state_deduplicates_attributes(hass_recorder):
+    """Test identical attributes are stored once in the state_attributes table."""
+    hass = hass_recorder()
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    hass.states.set("test.one", "on", attributes)
+    hass.states.set("test.two", "on", attributes)
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", attributes)
+    hass.states.set("test.two", "off", {"test_attr": 6})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        shared = list(session.query(StateAttributes))
+        assert len(shared) == 2
+        states = list(session.query(States))
+        assert len(states) == 4
+        assert all(state.attributes is None for state in states)
+        assert states[0].attributes_id == shared[0].attributes_id
+        assert states[1].attributes_id == shared[0].attributes_id
+        assert states[2].attributes_id == shared[0].attributes_id
+        assert states[3].attributes_id == shared[1].attributes_id
+        assert shared[0].hash == StateAttributes.hash_shared_attrs(
+            shared[0].shared_attrs
+        )
+        assert states[2].to_native().attributes == attributes
+        assert states[3].to_native().attributes == {"test_attr": 6}
+        attributes_id = shared[0].attributes_id
+
+    # The id cache is dropped, rows are found again through the hash column
+    hass.data[DATA_INSTANCE]._state_attributes_ids.clear()
+    hass.states.set("test.three", "on", attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 2
+        state = session.query(States).filter_by(entity_id="test.three").one()
+        assert state.attributes_id == attributes_id
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -836,6 +913,33 @@ def test_service_disable_run_information_recorded(tmpdir):
     hass.stop()
 
 
+def test_read_only_session(tmpdir):
+    """Test queries use a separate read only connection pool."""
+    test_db_file = tmpdir.mkdir("sqlite").join("test_read_only.db")
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    hass = get_test_home_assistant()
+    setup_component(hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl}})
+    hass.start()
+    hass.states.set("test.read_only", "on", {})
+    wait_recording_done(hass)
+
+    instance = hass.data[DATA_INSTANCE]
+    assert instance.read_engine is not instance.engine
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].entity_id == "test.read_only"
+
+    with pytest.raises(OperationalError), session_scope(
+        hass=hass, read_only=True
+    ) as session:
+        session.add(RecorderRuns(start=dt_util.utcnow()))
+
+    hass.stop()
+
+
 class CannotSerializeMe:
     """A class that the JSONEncoder cannot serialize."""
 
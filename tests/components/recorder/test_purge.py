@@ -2,14 +2,24 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from sqlalchemy.exc import DatabaseError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
+from homeassistant.components.recorder.purge import (
+    PurgeProgress,
+    _drop_old_partitions,
+    purge_old_data,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.typing import ConfigType, HomeAssistantType
@@ -56,6 +66,39 @@ async def test_purge_old_states(
         assert states.count() == 2
 
 
+async def test_purge_old_states_removes_unused_attributes(
+    hass: HomeAssistantType, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purging deletes shared attributes no longer referenced by states."""
+    instance = await async_setup_recorder_instance(hass)
+    eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=eleven_days_ago,
+    ):
+        hass.states.async_set("test.purge", "on", {"purge": True})
+        hass.states.async_set("test.keep", "on", {"keep": True})
+        await async_wait_recording_done(hass, instance)
+    hass.states.async_set("test.keep", "off", {"keep": True})
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        attributes = session.query(StateAttributes)
+        assert attributes.count() == 2
+
+        finished = purge_old_data(instance, 4, repack=False)
+        assert not finished
+        finished = purge_old_data(instance, 4, repack=False)
+        assert finished
+
+        assert session.query(States).count() == 1
+        assert attributes.count() == 1
+        assert json.loads(attributes.one().shared_attrs) == {"keep": True}
+
+    assert len(instance._state_attributes_ids) == 1
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistantType, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -639,6 +682,73 @@ async def _add_test_states(hass: HomeAssistantType, instance: recorder.Recorder)
             old_state_id = state.state_id
 
 
+async def test_purge_progress(
+    hass: HomeAssistantType, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the purge progress is reported and the batch size adapts."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_events(hass, instance)
+
+    with patch("homeassistant.components.recorder.purge.PURGE_BATCH_LATENCY", 0):
+        assert not purge_old_data(instance, 4, repack=False)
+
+    progress = instance.purge_progress
+    assert progress.batches == 1
+    assert progress.events_deleted == 4
+    assert progress.batch_size == MAX_ROWS_TO_PURGE // 2
+    assert progress.purged_until < progress.purge_before
+    assert progress.finished is None
+
+    assert purge_old_data(instance, 4, repack=False)
+    assert progress.batches == 2
+    assert progress.finished is not None
+    assert progress.as_dict()["events_deleted"] == 4
+
+    # A new purge starts over, keeping the batch size
+    assert purge_old_data(instance, 4, repack=False)
+    assert instance.purge_progress is not progress
+    assert instance.purge_progress.events_deleted == 0
+    assert instance.purge_progress.batch_size == MAX_ROWS_TO_PURGE // 2
+
+
+def test_drop_old_partitions():
+    """Test dropping the partitions that are entirely before purge_before."""
+    purge_before = datetime(2021, 5, 10, tzinfo=dt_util.UTC)
+    progress = PurgeProgress(purge_before, purge_before)
+    partitions = {
+        "states": [
+            ("p0", "RANGE", "to_days(`last_updated`)", "738275"),
+            ("p1", "RANGE", "to_days(`last_updated`)", "738286"),
+            ("p2", "RANGE", "to_days(`last_updated`)", "MAXVALUE"),
+        ],
+        "events": [
+            ("p0", "RANGE COLUMNS", "`time_fired`", "'2021-05-01 00:00:00'"),
+            ("p1", "RANGE COLUMNS", "`time_fired`", "'2021-05-11 00:00:00'"),
+            ("p2", "RANGE COLUMNS", "`time_fired`", "'2021-05-21 00:00:00'"),
+        ],
+    }
+    statements = []
+
+    def execute(statement, params=None):
+        statements.append(str(statement))
+        result = MagicMock()
+        if "information_schema" in str(statement):
+            result.fetchall.return_value = partitions[params["table"]]
+        else:
+            # TO_DAYS('2021-05-10')
+            result.scalar.return_value = 738285
+        return result
+
+    session = MagicMock(execute=execute)
+    _drop_old_partitions(session, progress)
+
+    assert "ALTER TABLE states DROP PARTITION `p0`" in statements
+    assert "ALTER TABLE events DROP PARTITION `p0`" in statements
+    assert progress.partitions_dropped == 2
+    assert progress.unused_attributes
+
+
 async def _add_test_events(hass: HomeAssistantType, instance: recorder.Recorder):
     """Add a few events for testing."""
     utcnow = dt_util.utcnow()
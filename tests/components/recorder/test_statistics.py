@@ -0,0 +1,172 @@
+"""The tests for the recorder statistics."""
+# pylint: disable=protected-access
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.components.recorder import StatisticsTask
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.models import Statistics, StatisticsShortTerm
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
+    period_start,
+    statistics_during_period,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.setup import setup_component
+import homeassistant.util.dt as dt_util
+
+from .common import wait_recording_done
+
+TEMPERATURE_ATTRIBUTES = {"unit_of_measurement": "°C"}
+
+
+def _record_states(hass):
+    """Record the states of a temperature sensor around an hour."""
+    # The recorder only looks back for the state at the start of
+    # a period in the current run, so the test hour is in the future
+    zero = period_start(dt_util.utcnow(), PERIOD_HOUR) + timedelta(hours=2)
+
+    def set_state(point_in_time, entity_id, state, attributes):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=point_in_time,
+        ):
+            hass.states.set(entity_id, state, attributes)
+            wait_recording_done(hass)
+
+    set_state(
+        zero - timedelta(minutes=30), "sensor.test1", "10", TEMPERATURE_ATTRIBUTES
+    )
+    set_state(
+        zero + timedelta(minutes=15), "sensor.test1", "20", TEMPERATURE_ATTRIBUTES
+    )
+    set_state(
+        zero + timedelta(minutes=45), "sensor.test1", "30", TEMPERATURE_ATTRIBUTES
+    )
+    set_state(zero + timedelta(minutes=20), "sensor.no_unit", "5", {})
+    return zero
+
+
+def test_compile_hourly_statistics(hass_recorder):
+    """Test compiling hourly statistics when the period closes."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    instance = hass.data[DATA_INSTANCE]
+    zero = _record_states(hass)
+
+    hass.add_job(
+        instance.async_periodic_statistics, zero + timedelta(hours=1, seconds=10)
+    )
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, zero)
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": zero.isoformat(),
+                "mean": 20.0,
+                "min": 10.0,
+                "max": 30.0,
+                "state": 30.0,
+                "sum": None,
+            }
+        ]
+    }
+    assert statistics_during_period(hass, zero, period=PERIOD_5MINUTE) == {}
+    assert statistics_during_period(hass, zero + timedelta(hours=1)) == {}
+    assert statistics_during_period(hass, zero, statistic_ids=["sensor.other"]) == {}
+
+    # Compiling a period again does not add rows
+    instance.queue.put(StatisticsTask(zero, PERIOD_HOUR))
+    wait_recording_done(hass)
+    with session_scope(hass=hass) as session:
+        assert session.query(Statistics).count() == 1
+
+
+def test_compile_short_term_statistics(hass_recorder):
+    """Test the 5-minute statistics are only compiled when enabled."""
+    hass = hass_recorder({"short_term_statistics": True})
+    setup_component(hass, "sensor", {})
+    instance = hass.data[DATA_INSTANCE]
+    zero = _record_states(hass)
+
+    hass.add_job(
+        instance.async_periodic_statistics, zero + timedelta(minutes=20, seconds=10)
+    )
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(
+        hass,
+        zero + timedelta(minutes=15),
+        zero + timedelta(minutes=20),
+        period=PERIOD_5MINUTE,
+    )
+    assert stats["sensor.test1"] == [
+        {
+            "statistic_id": "sensor.test1",
+            "start": (zero + timedelta(minutes=15)).isoformat(),
+            "mean": 20.0,
+            "min": 20.0,
+            "max": 20.0,
+            "state": 20.0,
+            "sum": None,
+        }
+    ]
+    assert statistics_during_period(hass, zero) == {}
+
+
+def test_compile_missing_statistics(hass_recorder):
+    """Test the periods that closed while stopped are compiled."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    instance = hass.data[DATA_INSTANCE]
+    zero = _record_states(hass)
+
+    instance.queue.put(StatisticsTask(zero, PERIOD_HOUR))
+    wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=zero + timedelta(hours=3, minutes=1),
+    ):
+        instance._schedule_compile_missing_statistics()
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, zero)["sensor.test1"]
+    assert [stat["start"] for stat in stats] == [
+        zero.isoformat(),
+        (zero + timedelta(hours=1)).isoformat(),
+        (zero + timedelta(hours=2)).isoformat(),
+    ]
+    assert [stat["mean"] for stat in stats] == [20.0, 30.0, 30.0]
+
+
+def test_purge_keeps_hourly_statistics(hass_recorder):
+    """Test purging removes the short-term statistics only."""
+    hass = hass_recorder({"short_term_statistics": True})
+    setup_component(hass, "sensor", {})
+    instance = hass.data[DATA_INSTANCE]
+    zero = _record_states(hass)
+
+    instance.queue.put(StatisticsTask(zero, PERIOD_HOUR))
+    instance.queue.put(StatisticsTask(zero + timedelta(minutes=15), PERIOD_5MINUTE))
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        hourly_count = session.query(Statistics).count()
+        assert hourly_count >= 1
+        assert session.query(StatisticsShortTerm).count() >= 1
+
+    with patch(
+        "homeassistant.components.recorder.purge.dt_util.utcnow",
+        return_value=zero + timedelta(days=30),
+    ):
+        while not purge_old_data(instance, 10, repack=False):
+            pass
+
+    with session_scope(hass=hass) as session:
+        assert session.query(Statistics).count() == hourly_count
+        assert session.query(StatisticsShortTerm).count() == 0
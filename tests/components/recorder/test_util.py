@@ -146,7 +146,9 @@ def test_basic_sanity_check(hass_recorder):
 
 def test_combined_checks(hass_recorder, caplog):
     """Run Checks on the open database."""
-    hass = hass_recorder()
+    # The events table is dropped below, do not wait between the
+    # failing commit retries when the recorder shuts down
+    hass = hass_recorder({"db_retry_wait": 0})
 
     cursor = hass.data[DATA_INSTANCE].engine.raw_connection().cursor()
 
@@ -0,0 +1,29 @@
+"""The tests for the recorder websocket API."""
+from homeassistant.components.recorder.purge import purge_old_data
+
+from .common import async_wait_recording_done
+
+
+async def test_purge_progress(hass, hass_ws_client, async_setup_recorder_instance):
+    """Test reporting the purge progress."""
+    instance = await async_setup_recorder_instance(hass)
+    client = await hass_ws_client()
+
+    await client.send_json({"id": 1, "type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    await async_wait_recording_done(hass, instance)
+    while not await hass.async_add_executor_job(
+        purge_old_data, instance, 0, False, False
+    ):
+        pass
+
+    await client.send_json({"id": 2, "type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["batches"] >= 1
+    assert result["finished"] is not None
+    assert result["partitions_dropped"] == 0
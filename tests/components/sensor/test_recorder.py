@@ -0,0 +1,103 @@
+"""The tests for sensor recorder platform."""
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.statistics import PERIOD_HOUR, period_start
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.sensor.recorder import compile_statistics
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.setup import setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import get_test_home_assistant, init_recorder_component
+from tests.components.recorder.common import wait_recording_done
+
+ENERGY_ATTRIBUTES = {"device_class": "energy", "unit_of_measurement": "kWh"}
+POWER_ATTRIBUTES = {"device_class": "power", "unit_of_measurement": "W"}
+
+
+@pytest.fixture
+def hass_recorder():
+    """Home Assistant fixture with in-memory recorder."""
+    hass = get_test_home_assistant()
+
+    def setup_recorder(config=None):
+        """Set up with params."""
+        init_recorder_component(hass, config)
+        hass.start()
+        hass.block_till_done()
+        hass.data[DATA_INSTANCE].block_till_done()
+        return hass
+
+    yield setup_recorder
+    hass.stop()
+
+
+def _set_states(hass, zero, entity_id, states, attributes):
+    """Record states at minute offsets from zero."""
+    for minutes, state in states:
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=zero + timedelta(minutes=minutes),
+        ):
+            hass.states.set(entity_id, state, attributes)
+    wait_recording_done(hass)
+
+
+def _compile_statistics(hass, zero):
+    """Compile the statistics of the hour starting at zero."""
+    with session_scope(hass=hass) as session:
+        return compile_statistics(hass, session, zero, zero + timedelta(hours=1))
+
+
+def test_compile_statistics_measurement(hass_recorder):
+    """Test the mean is weighted by how long each value was the state."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    zero = period_start(dt_util.utcnow(), PERIOD_HOUR) + timedelta(hours=2)
+
+    _set_states(
+        hass,
+        zero,
+        "sensor.power",
+        [(-10, "100"), (6, "400"), (12, STATE_UNAVAILABLE), (30, "250")],
+        POWER_ATTRIBUTES,
+    )
+    _set_states(hass, zero, "sensor.text", [(5, "on"), (10, "off")], {"unit": "x"})
+    _set_states(
+        hass, zero, "sensor.unavailable", [(5, STATE_UNAVAILABLE)], POWER_ATTRIBUTES
+    )
+
+    # 100 for 6 minutes, 400 for 6 minutes, nothing for 18, 250 for 30
+    assert _compile_statistics(hass, zero) == {
+        "sensor.power": {"mean": 250.0, "min": 100.0, "max": 400.0, "state": 250.0}
+    }
+    # Without changes in the period the state at the start is used
+    assert _compile_statistics(hass, zero + timedelta(hours=1)) == {
+        "sensor.power": {"mean": 250.0, "min": 250.0, "max": 250.0, "state": 250.0}
+    }
+
+
+def test_compile_statistics_meter(hass_recorder):
+    """Test the increase of an energy meter is summed, including resets."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    zero = period_start(dt_util.utcnow(), PERIOD_HOUR) + timedelta(hours=2)
+
+    _set_states(
+        hass,
+        zero,
+        "sensor.energy",
+        [(-30, "100"), (10, "105"), (20, "2"), (25, STATE_UNAVAILABLE), (30, "5")],
+        ENERGY_ATTRIBUTES,
+    )
+
+    assert _compile_statistics(hass, zero) == {
+        "sensor.energy": {"state": 5.0, "sum": 10.0}
+    }
+    assert _compile_statistics(hass, zero + timedelta(hours=1)) == {
+        "sensor.energy": {"state": 5.0, "sum": 0.0}
+    }
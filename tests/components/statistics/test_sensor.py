@@ -9,7 +9,11 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import DOMAIN, StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    DOMAIN,
+    RollingStatistics,
+    StatisticsSensor,
+)
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     SERVICE_RELOAD,
@@ -149,6 +153,38 @@ class TestStatisticsSensor(unittest.TestCase):
         assert state.attributes.get("min_value") == 3.8
         assert state.attributes.get("max_value") == 14
 
+    def test_not_finite_values_ignored(self):
+        """Test values that are not finite are not added to the statistics."""
+        assert setup_component(
+            self.hass,
+            "sensor",
+            {
+                "sensor": {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "sampling_size": 3,
+                }
+            },
+        )
+
+        self.hass.block_till_done()
+        self.hass.start()
+        self.hass.block_till_done()
+
+        for value in [1, "nan", 2, "inf", 3, "-inf"]:
+            self.hass.states.set(
+                "sensor.test_monitored", value, {ATTR_UNIT_OF_MEASUREMENT: TEMP_CELSIUS}
+            )
+            self.hass.block_till_done()
+
+        state = self.hass.states.get("sensor.test")
+
+        assert state.state == "2.0"
+        assert state.attributes.get("count") == 3
+        assert state.attributes.get("total") == 6
+        assert state.attributes.get("variance") == 1
+
     def test_sampling_size_1(self):
         """Test validity of stats requiring only one sample."""
         assert setup_component(
@@ -498,5 +534,67 @@ async def test_reload(hass):
     assert hass.states.get("sensor.cputest")
 
 
+def test_rolling_statistics():
+    """Test the incremental statistics match a full computation."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, -3.5, 20, 1e-3]
+    rolling = RollingStatistics(5)
+
+    for idx, value in enumerate(values):
+        rolling.append(value)
+        if idx % 4 == 3:
+            rolling.popleft()
+
+        window = list(rolling)
+        assert len(rolling) == len(window) <= 5
+        assert rolling.total == pytest.approx(sum(window))
+        assert rolling.mean == pytest.approx(statistics.mean(window))
+        assert rolling.median == pytest.approx(statistics.median(window))
+        assert rolling.min == min(window)
+        assert rolling.max == max(window)
+        if len(window) > 1:
+            assert rolling.variance == pytest.approx(statistics.variance(window))
+            assert rolling.stdev == pytest.approx(statistics.stdev(window))
+
+    while rolling:
+        rolling.popleft()
+
+    assert rolling.total == 0
+    rolling.append(4)
+    assert rolling.mean == rolling.median == rolling.min == rolling.max == 4
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1e16, 1.0, 1.0],
+        [1.0, float("inf"), 2.0, 3.0, 4.0, 5.0],
+        [-1e300, 1e300, 2.0, 3.0, 4.0],
+    ],
+)
+def test_rolling_statistics_outlier_leaves_window(values):
+    """Test the statistics recover once an outlier left the queue."""
+    rolling = RollingStatistics(2)
+
+    for value in values:
+        rolling.append(value)
+
+    window = list(rolling)
+    assert rolling.total == sum(window)
+    assert rolling.mean == statistics.mean(window)
+    assert rolling.variance == statistics.variance(window)
+
+
+def test_rolling_statistics_long_run():
+    """Test rounding errors do not pile up over many values."""
+    rolling = RollingStatistics(10)
+
+    for idx in range(10000):
+        rolling.append(1e6 + (idx % 7) / 10)
+
+    window = list(rolling)
+    assert rolling.mean == pytest.approx(statistics.mean(window), abs=1e-9)
+    assert rolling.variance == pytest.approx(statistics.variance(window), rel=1e-9)
+
+
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
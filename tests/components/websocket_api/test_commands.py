@@ -1,5 +1,8 @@
 """Tests for WebSocket API commands."""
+import asyncio
 import datetime
+import json
+import logging
 from unittest.mock import ANY, patch
 
 from async_timeout import timeout
@@ -7,19 +10,21 @@ import pytest
 import voluptuous as vol
 
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
+from homeassistant.components import websocket_api
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import EntitySubscription
 from homeassistant.components.websocket_api.const import URL
 from homeassistant.core import Context, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import HomeAssistantType
-from homeassistant.loader import async_get_integration
+from homeassistant.loader import DATA_IMPORT_TIME, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
@@ -601,6 +606,130 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities(hass, websocket_client):
+    """Test subscribe entities sends the coalesced changes."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    original_state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "red"},
+                "c": original_state.context.id,
+                "lc": original_state.last_changed.timestamp(),
+                "s": "off",
+            }
+        }
+    }
+
+    hass.states.async_set("light.permitted", "on", {"color": "red"})
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    hass.states.async_set("light.permitted", "on", {"effect": "none"})
+    hass.states.async_set("switch.new", "on")
+    state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["c"] == {
+        "light.permitted": {
+            "+": {
+                "a": {"effect": "none"},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+                "lu": state.last_updated.timestamp(),
+                "s": "on",
+            },
+            "-": {"a": ["color"]},
+        }
+    }
+    assert msg["event"]["a"]["switch.new"]["s"] == "on"
+
+    hass.states.async_remove("switch.new")
+    hass.states.async_set("light.other", "on")
+    hass.states.async_remove("light.other")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["switch.new"]}
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
+async def test_subscribe_entities_filtered(hass, websocket_client, hass_admin_user):
+    """Test subscribe entities with entity_ids and entity permissions."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+    hass.states.async_set("light.not_subscribed", "off")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.permitted", "light.not_permitted"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.not_subscribed", "on")
+    hass.states.async_set("light.permitted", "on")
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]) == ["c"]
+    assert list(msg["event"]["c"]) == ["light.permitted"]
+
+
+async def test_subscribe_entities_merges_while_queued(hass, hass_admin_user):
+    """Test changes are merged into the message the writer has not sent yet."""
+    queued = []
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__), hass, queued.append, hass_admin_user, None
+    )
+    subscription = EntitySubscription(hass, connection, 5, None)
+    unsub = subscription.async_subscribe()
+    subscription.async_send_states()
+    assert queued.pop() == {"id": 5, "type": "event", "event": {"a": {}}}
+
+    with patch.object(const, "ENTITY_COALESCE_WINDOW", 0):
+        for idx in range(100):
+            hass.states.async_set("sensor.power", str(idx))
+            await asyncio.sleep(0)
+        await hass.async_block_till_done()
+
+    # One message is queued, the writer has not built it yet
+    assert len(queued) == 1
+    msg = json.loads(queued.pop()())
+    assert msg["event"]["a"]["sensor.power"]["s"] == "99"
+
+    hass.states.async_set("sensor.power", "100")
+    await hass.async_block_till_done()
+    unsub()
+    await asyncio.sleep(const.ENTITY_COALESCE_WINDOW * 2)
+    assert queued == []
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -1180,6 +1309,7 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    hass.data[DATA_IMPORT_TIME] = {"august": datetime.timedelta(seconds=0.5)}
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -1187,6 +1317,6 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 0.5},
+        {"domain": "isy994", "seconds": 12.8, "import_seconds": 0},
     ]
@@ -1,12 +1,15 @@
 """Test Websocket API messages module."""
+import json
 
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     cached_event_message,
+    compressed_state_diff,
+    event_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
-from homeassistant.core import callback
+from homeassistant.core import Context, State, callback
 
 
 async def test_cached_event_message(hass):
@@ -78,6 +81,54 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_changed_event_message(hass):
+    """Test state changed event messages reuse the json of the states."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.window", "off")
+    hass.states.async_remove("light.window")
+    hass.states.async_set("input_text.text", "__NEW_STATE__")
+    hass.states.async_set("input_text.text", "__OLD_STATE__", {"new": "__NEW_STATE__"})
+    await hass.async_block_till_done()
+
+    assert len(events) == 5
+    lru_event_cache.cache_clear()
+
+    for event in events:
+        assert json.loads(cached_event_message(2, event)) == json.loads(
+            message_to_json(event_message(2, event))
+        )
+
+    # The new state of the first event is the old state of the second
+    assert events[0].data["new_state"].as_json() in cached_event_message(2, events[1])
+
+
+async def test_cached_state_changed_event_message_invalid_json(hass, caplog):
+    """Test a state changed event with attributes that are not valid json."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("sensor.nan", "on", {"value": float("nan")})
+    await hass.async_block_till_done()
+
+    assert json.loads(cached_event_message(2, events[0]))["success"] is False
+    assert "Unable to serialize to JSON" in caplog.text
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
@@ -96,3 +147,34 @@ async def test_message_to_json(caplog):
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+def test_compressed_state_diff():
+    """Test the changes between two states."""
+    old_state = State("light.window", "on", {"brightness": 100, "effect": "none"})
+
+    assert compressed_state_diff(old_state, old_state) is None
+
+    new_state = State(
+        "light.window",
+        "on",
+        {"brightness": 200, "color_mode": "hs"},
+        last_changed=old_state.last_changed,
+        last_updated=old_state.last_updated,
+        context=old_state.context,
+    )
+    assert compressed_state_diff(old_state, new_state) == {
+        "+": {"a": {"brightness": 200, "color_mode": "hs"}},
+        "-": {"a": ["effect"]},
+    }
+
+    context = Context()
+    new_state = State("light.window", "off", old_state.attributes, context=context)
+    assert compressed_state_diff(old_state, new_state) == {
+        "+": {
+            "s": "off",
+            "c": context.id,
+            "lc": new_state.last_changed.timestamp(),
+            "lu": new_state.last_updated.timestamp(),
+        }
+    }
@@ -1250,3 +1250,53 @@ async def test_disable_config_entry_disables_devices(hass, registry):
     entry2 = registry.async_get(entry2.id)
     assert entry2.disabled
     assert entry2.disabled_by == "user"
+
+
+async def test_entries_for_index(hass, registry):
+    """Test the area and config entry lookups follow updates."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+    entry = registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    other = registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id,
+        identifiers={("bridgeid", "4567")},
+    )
+
+    assert device_registry.async_entries_for_config_entry(
+        registry, config_entry_1.entry_id
+    ) == [entry]
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+
+    entry = registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    entry = registry.async_update_device(entry.id, area_id="12345A")
+
+    assert device_registry.async_entries_for_config_entry(
+        registry, config_entry_2.entry_id
+    ) == [other, entry]
+    assert device_registry.async_entries_for_area(registry, "12345A") == [entry]
+
+    registry.async_clear_config_entry(config_entry_1.entry_id)
+    registry.async_update_device(other.id, area_id="12345A")
+    registry.async_clear_area_id("12345A")
+
+    assert (
+        device_registry.async_entries_for_config_entry(
+            registry, config_entry_1.entry_id
+        )
+        == []
+    )
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+
+    registry.async_remove_device(entry.id)
+
+    assert device_registry.async_entries_for_config_entry(
+        registry, config_entry_2.entry_id
+    ) == [registry.async_get(other.id)]
@@ -365,6 +365,47 @@ async def test_unload_entry_resets_platform(hass):
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_entities_indexed_across_platforms(hass):
+    """Test entities of all platforms are looked up by entity id."""
+    mock_setup_entry = AsyncMock(return_value=True)
+    mock_entity_platform(
+        hass,
+        "test_domain.entry_domain",
+        MockPlatform(async_setup_entry=mock_setup_entry),
+    )
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entry = MockConfigEntry(domain="entry_domain")
+    assert await component.async_setup_entry(entry)
+    add_entities = mock_setup_entry.mock_calls[0][1][2]
+
+    entry_entity = MockEntity(entity_id=f"{DOMAIN}.entry")
+    add_entities([entry_entity])
+    component_entity = MockEntity(entity_id=f"{DOMAIN}.component")
+    await component.async_add_entities([component_entity])
+    await hass.async_block_till_done()
+
+    assert component.get_entity(f"{DOMAIN}.entry") is entry_entity
+    assert component.get_entity(f"{DOMAIN}.component") is component_entity
+
+    calls = []
+
+    @ha.callback
+    def appender(**kwargs):
+        calls.append(kwargs)
+
+    entry_entity.async_called_by_service = appender
+    component.async_register_entity_service("hello", {}, "async_called_by_service")
+    await hass.services.async_call(
+        DOMAIN, "hello", {"entity_id": f"{DOMAIN}.entry"}, blocking=True
+    )
+    assert len(calls) == 1
+
+    assert await component.async_unload_entry(entry)
+    assert component.get_entity(f"{DOMAIN}.entry") is None
+    assert component.get_entity(f"{DOMAIN}.component") is component_entity
+
+
 async def test_unload_entry_fails_if_never_loaded(hass):
     """."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -895,3 +895,39 @@ async def test_disabled_entities_excluded_from_entity_list(hass, registry):
         registry, device_entry.id, include_disabled_entities=True
     )
     assert entries == [entry1, entry2]
+
+
+async def test_entries_for_index(registry):
+    """Test the device, area and config entry lookups follow updates."""
+    entry = registry.async_get_or_create(
+        "light",
+        "hue",
+        "1234",
+        config_entry=MockConfigEntry(entry_id="mock-entry"),
+        device_id="mock-device",
+    )
+    other = registry.async_get_or_create("light", "hue", "5678")
+
+    assert er.async_entries_for_device(registry, "mock-device") == [entry]
+    assert er.async_entries_for_config_entry(registry, "mock-entry") == [entry]
+    assert er.async_entries_for_area(registry, "mock-area") == []
+
+    entry = registry.async_update_entity(
+        entry.entity_id, area_id="mock-area", new_entity_id="light.renamed"
+    )
+    other = registry.async_update_entity(other.entity_id, area_id="mock-area")
+
+    assert er.async_entries_for_device(registry, "mock-device") == [entry]
+    assert er.async_entries_for_config_entry(registry, "mock-entry") == [entry]
+    assert er.async_entries_for_area(registry, "mock-area") == [entry, other]
+
+    registry.async_clear_area_id("mock-area")
+
+    assert er.async_entries_for_area(registry, "mock-area") == []
+    assert registry.async_get("light.renamed").area_id is None
+    assert registry.async_get(other.entity_id).area_id is None
+
+    registry.async_remove("light.renamed")
+
+    assert er.async_entries_for_device(registry, "mock-device") == []
+    assert er.async_entries_for_config_entry(registry, "mock-entry") == []
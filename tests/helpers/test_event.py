@@ -16,6 +16,7 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_POINT_IN_TIME_WHEEL,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
@@ -126,6 +127,109 @@ async def test_track_point_in_time_drift_rearm(hass):
     assert len(specific_runs) == 1
 
 
+async def test_track_point_in_time_shares_timer(hass):
+    """Test point in time listeners share a single loop timer."""
+    runs = []
+    now = dt_util.utcnow()
+
+    def _active_timers():
+        return [
+            handle
+            for handle in hass.loop._scheduled
+            if isinstance(handle, asyncio.TimerHandle) and not handle.cancelled()
+        ]
+
+    timers_before = len(_active_timers())
+    unsubs = [
+        async_track_point_in_utc_time(
+            hass,
+            callback(lambda x, idx=idx: runs.append(idx)),
+            now + timedelta(seconds=10 + idx % 5),
+        )
+        for idx in range(100)
+    ]
+    assert len(_active_timers()) == timers_before + 1
+
+    unsubs[0]()
+    unsubs[1]()
+
+    async_fire_time_changed(hass, now + timedelta(seconds=12))
+    await hass.async_block_till_done()
+    assert sorted(runs) == [
+        idx for idx in range(100) if idx % 5 <= 2 and idx not in (0, 1)
+    ]
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert sorted(runs) == list(range(2, 100))
+    assert len(_active_timers()) == timers_before
+
+
+async def test_track_point_in_time_cancel_while_running(hass):
+    """Test a listener can cancel a listener that is due at the same time."""
+    runs = []
+    point_in_time = dt_util.utcnow() + timedelta(seconds=10)
+
+    @callback
+    def _cancel_other(_):
+        runs.append("first")
+        unsub_other()
+
+    async_track_point_in_utc_time(hass, _cancel_other, point_in_time)
+    unsub_other = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("other")), point_in_time
+    )
+
+    async_fire_time_changed(hass, point_in_time)
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+
+
+async def test_track_point_in_time_reschedule_and_cancel_while_running(hass):
+    """Test cancelling a due listener after scheduling one at the same time."""
+    runs = []
+    point_in_time = dt_util.utcnow() + timedelta(seconds=10)
+
+    @callback
+    def _reschedule_and_cancel_other(_):
+        runs.append("first")
+        async_track_point_in_utc_time(
+            hass, callback(lambda x: runs.append("new")), point_in_time
+        )
+        unsub_other()
+
+    async_track_point_in_utc_time(hass, _reschedule_and_cancel_other, point_in_time)
+    unsub_other = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("other")), point_in_time
+    )
+
+    async_fire_time_changed(hass, point_in_time)
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+
+    async_fire_time_changed(hass, point_in_time + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == ["first", "new"]
+
+
+async def test_track_point_in_time_cancelled_timestamps_compacted(hass):
+    """Test cancelled timestamps do not pile up in the timer wheel."""
+    now = dt_util.utcnow()
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda x: None), now + timedelta(seconds=1000)
+    )
+
+    for seconds in range(100, 200):
+        unsub()
+        unsub = async_track_point_in_utc_time(
+            hass, callback(lambda x: None), now + timedelta(seconds=seconds)
+        )
+
+    wheel = hass.data[TRACK_POINT_IN_TIME_WHEEL]
+    assert len(wheel) == 1
+    assert len(wheel._timestamps) <= 3
+
+
 async def test_track_state_change_from_to_state_match(hass):
     """Test track_state_change with from and to state matchers."""
     from_and_to_state_runs = []
@@ -2795,6 +2899,52 @@ async def test_periodic_task_wrong_input(hass):
     assert len(specific_runs) == 0
 
 
+async def test_track_utc_time_change_grouped(hass):
+    """Test listeners of the same pattern share the next time calculation."""
+    runs = []
+    now = dt_util.utcnow()
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 21, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsubs = [
+            async_track_utc_time_change(
+                hass, callback(lambda x, idx=idx: runs.append(idx)), second=0
+            )
+            for idx in range(10)
+        ]
+
+    with patch(
+        "homeassistant.util.dt.find_next_time_expression_time",
+        wraps=dt_util.find_next_time_expression_time,
+    ) as mock_find_next:
+        async_fire_time_changed(
+            hass, datetime(now.year + 1, 5, 24, 22, 0, 0, tzinfo=dt_util.UTC)
+        )
+        await hass.async_block_till_done()
+
+    assert sorted(runs) == list(range(10))
+    assert len(mock_find_next.mock_calls) == 1
+
+    unsubs[0]()
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 22, 1, 0, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert sorted(runs) == sorted(list(range(10)) + list(range(1, 10)))
+
+    for unsub in unsubs[1:]:
+        unsub()
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 22, 2, 0, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 19
+
+
 async def test_periodic_task_clock_rollback(hass):
     """Test periodic tasks with the time rolling backwards."""
     specific_runs = []
@@ -290,6 +290,27 @@ async def test_state_saved_on_remove(hass):
     assert set(state.attributes["complicated"]["value"]) == {1, 2, now.isoformat()}
 
 
+async def test_state_saved_on_remove_not_serializable(hass):
+    """Test that we save entity state with attributes that are not JSON."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await entity.async_internal_added_to_hass()
+
+    value = object()
+    hass.states.async_set("input_boolean.b0", "on", {"unknown": value})
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await entity.async_remove()
+
+    state = data.last_states["input_boolean.b0"].state
+    assert state.state == "on"
+    assert state.attributes["unknown"] is value
+
+    # The storage can't write it either, leave it out of the final write
+    data.last_states.clear()
+
+
 async def test_restoring_invalid_entity_id(hass, hass_storage):
     """Test restoring invalid entity IDs."""
     entity = RestoreEntity()
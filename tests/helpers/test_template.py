@@ -2144,35 +2144,92 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_template_cache():
+    """Test compiled templates are cached by source after the template is gone."""
     template_string = (
-        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
-    )
-    tpl = template.Template(
-        (template_string),
+        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }} cache"
     )
+    cache = template._NO_HASS_ENV.template_cache  # pylint: disable=protected-access
+    hits = cache.hits
+    misses = cache.misses
+
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert cache.misses == misses + 1
+    del tpl
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert cache.hits == hits + 1
+    assert cache.misses == misses + 1
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+
+def test_template_cache_lru():
+    """Test the template cache evicts the least recently used source."""
+    cache = template.TemplateCache(2)
+    cache["one"] = 1
+    cache["two"] = 2
+    assert cache.get("one") == 1
+    cache["three"] = 3
+
+    assert cache.get("two") is None
+    assert cache.get("one") == 1
+    assert cache.get("three") == 3
+    assert cache.info() == {"hits": 3, "misses": 1, "size": 2, "maxsize": 2}
+
+
+async def test_render_to_info_memoize(hass):
+    """Test renders of the same source are shared until their states change."""
+    hass.states.async_set("sensor.one", "1")
+    template_string = "{{ states('sensor.one') | int + 1 }}"
+    render_result_cache = template.template_cache_info(hass)["render_result"]
+    assert render_result_cache["size"] == 0
+
+    info = template.Template(template_string, hass).async_render_to_info(memoize=True)
+    assert_result_info(info, 2, ["sensor.one"])
+
+    with patch(
+        "homeassistant.helpers.template.Template.async_render",
+        side_effect=AssertionError,
+    ):
+        tpl = template.Template(template_string, hass)
+        info = tpl.async_render_to_info(memoize=True)
+    assert_result_info(info, 2, ["sensor.one"])
+    assert info.template is tpl
+    assert template.template_cache_info(hass)["render_result"]["hits"] == 1
+
+    hass.states.async_set("sensor.one", "2")
+    info = template.Template(template_string, hass).async_render_to_info(memoize=True)
+    assert_result_info(info, 3, ["sensor.one"])
+
+    cache_info = template.template_cache_info(hass)
+    assert cache_info["render_result"]["hits"] == 1
+    assert cache_info["render_result"]["misses"] == 2
+    # The memoized render did not compile the second template
+    assert cache_info["compiled"]["hits"] == 1
+    assert cache_info["compiled"]["misses"] == 1
+
+
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "{{ states('sensor.one') ~ now() }}",
+        "{{ states('sensor.one') ~ ([1, 2] | random) }}",
+        "{{ states.sensor | list | count }}",
+        "{{ states('sensor.one') ~ relative_time(states.sensor.one.last_changed) }}",
+        "{{ states('sensor.one') ~ distance(12, 34) }}",
+        "{{ states('sensor.one') ~ closest('sensor.one') }}",
+        "{{ states('sensor.one') ~ ('sensor.one' | closest) }}",
+    ],
+)
+async def test_render_to_info_not_memoized(hass, template_string):
+    """Test renders that depend on more than some states are not memoized."""
+    hass.states.async_set("sensor.one", "1")
+
+    template.Template(template_string, hass).async_render_to_info(memoize=True)
+    template.Template(template_string, hass).async_render_to_info(memoize=True)
+
+    assert template.template_cache_info(hass)["render_result"]["hits"] == 0
 
 
 def test_is_template_string():
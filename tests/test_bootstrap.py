@@ -319,6 +319,31 @@ async def test_setup_after_deps_not_present(hass):
     assert order == ["root", "second_dep"]
 
 
+async def test_pre_import_integrations(hass):
+    """Test integrations and configured platforms are imported ahead of setup."""
+    hass.config.skip_pip = False
+    mock_integration(hass, MockModule(domain="other"))
+    mock_integration(hass, MockModule(domain="platform_int"))
+    mock_integration(hass, MockModule(domain="with_reqs", requirements=["foo==1.0"]))
+    config = {
+        "light": {"platform": "platform_int"},
+        "light 2": [{"platform": "with_reqs"}, {"platform": "platform_int"}],
+        "other": {"platform": "not_an_entity_platform"},
+    }
+
+    with patch(
+        "homeassistant.loader.Integration.async_pre_import", autospec=True
+    ) as mock_pre_import:
+        await bootstrap._async_pre_import_integrations(
+            hass, [{"light"}, {"other"}], config
+        )
+
+    assert {
+        integration.domain: set(platforms)
+        for (integration, platforms), _ in mock_pre_import.call_args_list
+    } == {"light": set(), "platform_int": {"light"}, "other": set()}
+
+
 @pytest.fixture
 def mock_is_virtual_env():
     """Mock enable logging."""
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -34,11 +35,13 @@ from homeassistant.const import (
 )
 import homeassistant.core as ha
 from homeassistant.exceptions import (
+    HomeAssistantError,
     InvalidEntityFormatError,
     InvalidStateError,
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -361,6 +364,25 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_json():
+    """Test a State serialized to JSON."""
+    state = ha.State("happy.happy", "on", {"pig": "dog", "at": datetime(2021, 1, 1)})
+    assert json.loads(state.as_json()) == json.loads(
+        json.dumps(state.as_dict(), cls=JSONEncoder)
+    )
+    assert state.as_json() is state.as_json()
+    assert state.attributes_json() == '{"pig": "dog", "at": "2021-01-01T00:00:00"}'
+    assert state.attributes_json() is state.attributes_json()
+
+    state = ha.State("input_text.text", "__ATTRIBUTES__", {"pig": "dog"})
+    assert json.loads(state.as_json()) == json.loads(
+        json.dumps(state.as_dict(), cls=JSONEncoder)
+    )
+
+    with pytest.raises(ValueError):
+        ha.State("happy.happy", "on", {"pig": float("nan")}).as_json()
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -409,6 +431,85 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass):
+    """Test keyed listeners are only called for the events of their keys."""
+    calls = []
+    all_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    hass.bus.async_listen("test", lambda event: all_calls.append(event))
+    unsub = hass.bus.async_listen_keyed("test", ["light.a", "light.b"], listener)
+    assert hass.bus.async_listeners()["test"] == 2
+    assert hass.bus.async_keyed_listeners("test") == {"light.a": 1, "light.b": 1}
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    hass.bus.async_fire("test", {"entity_id": "light.c"})
+    hass.bus.async_fire("test", {"entity_id": "light.b"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == ["light.a", "light.b"]
+    assert len(all_calls) == 4
+
+    unsub()
+    assert hass.bus.async_listeners()["test"] == 1
+    assert hass.bus.async_keyed_listeners("test") == {}
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+
+
+async def test_eventbus_keyed_listener_event_key(hass):
+    """Test keyed listeners with a custom event key."""
+    calls = []
+
+    def event_key(event_data):
+        """Return the key of an event."""
+        return event_data.get("old_entity_id", event_data.get("entity_id"))
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", ["light.a"], lambda event: calls.append(event), event_key=event_key
+    )
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed("test", ["light.b"], lambda event: None)
+
+    hass.bus.async_fire("test", {"entity_id": "light.b", "old_entity_id": "light.a"})
+    hass.bus.async_fire("test", {"entity_id": "light.a", "old_entity_id": "light.c"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == ["light.b"]
+
+    unsub()
+    # The event key is released with the last keyed listener
+    hass.bus.async_listen_keyed("test", ["light.b"], lambda event: None)
+
+
+async def test_eventbus_keyed_listener_that_throws(hass, caplog):
+    """Test a throwing keyed listener does not stop the others."""
+    calls = []
+
+    @ha.callback
+    def listener_that_throws(event):
+        """Mock listener that throws."""
+        raise ValueError
+
+    hass.bus.async_listen_keyed("test", ["light.a"], listener_that_throws)
+    hass.bus.async_listen_keyed("test", ["light.a"], lambda event: calls.append(event))
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert "Error while processing" in caplog.text
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1,4 +1,5 @@
 """Test to verify that we can load components."""
+import asyncio
 from unittest.mock import ANY, patch
 
 import pytest
@@ -214,6 +215,43 @@ async def test_get_integration_custom_component(hass, enable_custom_integrations
     assert integration.name == "Test Package"
 
 
+async def test_pre_import(hass, enable_custom_integrations):
+    """Test importing an integration and its platforms in the executor."""
+    integration = await loader.async_get_integration(hass, "test")
+    await integration.async_pre_import(["light", "non_existing"])
+
+    components = hass.data[loader.DATA_COMPONENTS]
+    assert components["test"].__name__ == "custom_components.test"
+    assert components["test.light"].__name__ == "custom_components.test.light"
+    assert "test.non_existing" not in components
+    assert hass.data[loader.DATA_IMPORT_TIME]["test"].total_seconds() > 0
+
+    assert await integration.async_get_component() is components["test"]
+    assert await integration.async_get_platform("light") is components["test.light"]
+
+    with pytest.raises(ImportError):
+        await integration.async_get_platform("non_existing")
+
+
+async def test_pre_import_only_once(hass, enable_custom_integrations):
+    """Test that concurrent imports of a module share one executor job."""
+    integration = await loader.async_get_integration(hass, "test_package")
+    module = MockModule("test_package")
+
+    with patch(
+        "homeassistant.loader.importlib.import_module", return_value=module
+    ) as mock_import:
+        results = await asyncio.gather(
+            integration.async_pre_import(),
+            integration.async_get_component(),
+            integration.async_get_component(),
+        )
+
+    assert results[1] is module
+    assert results[2] is module
+    assert len(mock_import.mock_calls) == 1
+
+
 def test_integration_properties(hass):
     """Test integration properties."""
     integration = loader.Integration(